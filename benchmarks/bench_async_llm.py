@@ -0,0 +1,83 @@
+"""
+Per-job LLM latency: sequential GPTAnswerer calls against AsyncAnswerer.prepare_job.
+
+Both sides talk to the local OpenAI-compatible stub with a fixed latency, with the
+response cache in a throwaway directory, so the numbers show how much LLM waiting
+the fan-out removes. Run from the repository root with:
+python -m benchmarks.bench_async_llm [--latency 0.5] [--questions 5] [--max-concurrency 4]
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.fake_openai import FakeOpenAIServer
+from benchmarks.generators import questions as generate_questions
+from src.async_answerer import AsyncAnswerer
+from src.gpt import GPTAnswerer, LLMLogger
+from src.job import Job
+from src.log_writer import BackgroundJsonlWriter
+
+
+def build_answerer(server, directory):
+    return GPTAnswerer("stub", cache_path=Path(directory) / "llm_cache.db", base_url=server.base_url)
+
+
+def build_job(index):
+    return Job("Engineer", "Acme", "Remote", f"https://www.linkedin.com/jobs/view/{index}/", "Easy Apply",
+               description=f"Job {index}: build backend services in Python.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare sequential and concurrent LLM calls per job.")
+    parser.add_argument("--latency", type=float, default=0.5)
+    parser.add_argument("--questions", type=int, default=5)
+    parser.add_argument("--max-concurrency", type=int, default=4)
+    parser.add_argument("--jobs", type=int, default=3)
+    args = parser.parse_args()
+
+    questions = generate_questions(args.questions)
+
+    def job_questions(index):
+        # Distinct per job, so the response cache does not answer later jobs.
+        return [{"question": f"{q} (job {index})", "type": "textbox"} for q in questions]
+
+    # Fake calls must not land in the real open_ai_calls.jsonl: LLMAccounting seeds the
+    # user's hourly and daily spend from it.
+    log_directory = tempfile.TemporaryDirectory()
+    real_calls_log_writer = LLMLogger.calls_log_writer
+    LLMLogger.calls_log_writer = BackgroundJsonlWriter(Path(log_directory.name) / "open_ai_calls.jsonl")
+    server = FakeOpenAIServer(latency=(args.latency, args.latency)).start()
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            answerer = build_answerer(server, directory)
+            started = time.perf_counter()
+            for index in range(args.jobs):
+                job = build_job(index)
+                answerer.summarize_job_description(job.description)
+                for question in job_questions(index):
+                    answerer.answer_questions_batch([question])
+            sequential = (time.perf_counter() - started) / args.jobs
+
+        with tempfile.TemporaryDirectory() as directory:
+            async_answerer = AsyncAnswerer(build_answerer(server, directory), max_concurrency=args.max_concurrency)
+            server.max_in_flight = 0
+            started = time.perf_counter()
+            for index in range(args.jobs):
+                async_answerer.prepare_job_sync(build_job(args.jobs + index), job_questions(args.jobs + index))
+            concurrent = (time.perf_counter() - started) / args.jobs
+            async_answerer.close()
+    finally:
+        server.stop()
+        LLMLogger.calls_log_writer.close()
+        LLMLogger.calls_log_writer = real_calls_log_writer
+        log_directory.cleanup()
+
+    print(f"{'requests per job':<24} {1 + args.questions}")
+    print(f"{'sequential (s/job)':<24} {sequential:.2f}")
+    print(f"{'concurrent (s/job)':<24} {concurrent:.2f}")
+    print(f"{'max in flight':<24} {server.max_in_flight}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Micro-benchmark for BlacklistMatcher.
+
+Run from the repository root with: python -m benchmarks.bench_blacklist
+"""
+import timeit
+
+from benchmarks.generators import blacklists
+from src.blacklist_matcher import BlacklistMatcher
+
+SIZES = [10, 100, 1000, 10000]
+TITLES = [
+    "Senior/Lead Software Engineer, Platform",
+    "Staff Data Scientist - Machine Learning",
+    "Junior QA Automation Engineer (Remote)",
+    "Full Stack Developer | React & Node.js",
+    "Ingénieur Logiciel Senior",
+]
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella", "Hooli"]
+
+
+def build_matcher(size, seed=0):
+    titles, companies = blacklists(size, seed)
+    return BlacklistMatcher(titles, companies)
+
+
+def per_job_seconds(matcher, number=2000):
+    jobs = list(zip(TITLES, COMPANIES))
+
+    def run():
+        for title, company in jobs:
+            matcher.matches(title, company)
+
+    return min(timeit.repeat(run, number=number, repeat=5)) / (number * len(jobs))
+
+
+def main():
+    print(f"{'entries':>10} {'per job (us)':>14}")
+    for size in SIZES:
+        matcher = build_matcher(size)
+        print(f"{size:>10} {per_job_seconds(matcher) * 1e6:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Page weight and load time per browser profile.
+
+Loads the same pages in a fresh Chrome for every profile in src.browser_profile and
+prints time to interactive, load time (Navigation Timing API), and kilobytes and
+requests per page (encoded sizes of finished requests in Chrome's performance log). Pages that need a login should be run
+with a logged-in Chrome profile (``--chrome-profile``). Run from the repository root with:
+python -m benchmarks.bench_browser_profile <url> [<url> ...] [--repeat 3] [--profiles default lean headless]
+"""
+import argparse
+import tempfile
+
+from selenium import webdriver
+
+from src.browser_profile import PROFILES, BrowserProfile
+from src.utils import chromeBrowserOptions
+
+
+def measure(profile, urls, repeat, chrome_profile):
+    driver = webdriver.Chrome(options=chromeBrowserOptions(chrome_profile, headless=profile.headless,
+                                                           performance_logging=profile.performance_logging))
+    try:
+        profile.install(driver)
+        for _ in range(repeat):
+            for url in urls:
+                driver.get(url)
+                profile.record_page_load(driver)
+    finally:
+        driver.quit()
+    return profile.stats()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare page weight and load time across browser profiles.")
+    parser.add_argument("urls", nargs="+")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--profiles", nargs="+", default=list(PROFILES), choices=list(PROFILES))
+    parser.add_argument("--chrome-profile", help="Chrome profile path; a throwaway one is used by default.")
+    args = parser.parse_args()
+
+    results = []
+    for name in args.profiles:
+        with tempfile.TemporaryDirectory() as directory:
+            chrome_profile = args.chrome_profile or f"{directory}/profile"
+            results.append(measure(BrowserProfile.from_config({'name': name, 'measureTransfers': True}),
+                                   args.urls, args.repeat, chrome_profile))
+
+    print(f"{'profile':<12} {'loads':>6} {'interactive p50 (s)':>20} {'load p50 (s)':>13} {'KB/page':>9} {'requests/page':>14}")
+    for stats in results:
+        print(f"{stats['profile']:<12} {stats['page_loads']:>6} {stats['interactive_p50']:>20.3f} {stats['load_p50']:>13.3f} "
+              f"{stats['kb_per_page']:>9.1f} {stats['requests_per_page']:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
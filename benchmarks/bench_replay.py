@@ -0,0 +1,94 @@
+"""
+End-to-end jobs-per-minute benchmark against recorded fixtures.
+
+Record fixtures by running the bot with ``recordFixtures: fixtures/<name>`` in
+config.yaml, then run from the repository root with:
+python -m benchmarks.bench_replay fixtures/<name> "<position>" "<location>" [--latency 0.2]
+
+The real LinkedInJobManager and LinkedInEasyApplier code paths run in headless
+Chrome against the local fake server. The answerer returns fixed answers, so the
+result measures browser and bot overhead only, not LLM latency.
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from selenium import webdriver
+
+from benchmarks.fake_linkedin import FakeLinkedInServer
+from src.answer_store import AnswerStore
+from src.linkedIn_job_manager import LinkedInJobManager
+
+
+class ReplayAnswerer:
+    def __init__(self):
+        self.cache = type("NoCache", (), {"stats": staticmethod(lambda: {})})()
+        self.llm_call_count = 0
+        self.accounting = type("NoAccounting", (), {"stats": staticmethod(lambda: {})})()
+
+    def set_job(self, job):
+        self.job = job
+
+    def summarize_job_description(self, text):
+        return ""
+
+    def answer_question_textual_wide_range(self, question):
+        return "Yes"
+
+    def answer_questions_batch(self, questions):
+        return ["Yes"] * len(questions)
+
+
+def build_parameters(base_url, output_directory):
+    return {
+        'remote': False,
+        'experienceLevel': {},
+        'jobTypes': {},
+        'date': {'all time': True},
+        'positions': [],
+        'locations': [],
+        'distance': 0,
+        'companyBlacklist': [],
+        'titleBlacklist': [],
+        'outputFileDirectory': output_directory,
+        'linkedinBaseUrl': base_url,
+        'scrollPacing': {'min_delay': 0, 'max_delay': 0},
+        'pacing': {'pageLoadsPerHour': 0, 'applicationsPerHour': 0},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorded LinkedIn fixtures and measure jobs per minute.")
+    parser.add_argument("fixtures")
+    parser.add_argument("position")
+    parser.add_argument("location")
+    parser.add_argument("--latency", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = FakeLinkedInServer(args.fixtures, latency=(args.latency, args.latency)).start()
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    driver = webdriver.Chrome(options=options)
+    try:
+        with tempfile.TemporaryDirectory() as output_directory:
+            manager = LinkedInJobManager(driver)
+            # Answers given during the replay stay in the temporary directory, not in the real answers.jsonl.
+            manager.answer_store = AnswerStore(Path(output_directory) / "answers.json", Path(output_directory) / "answers.jsonl")
+            manager.set_parameters(build_parameters(server.base_url, Path(output_directory)))
+            manager.set_gpt_answerer(ReplayAnswerer())
+            manager.prepare_applying()
+            started_at = time.perf_counter()
+            manager.apply_search(args.position, args.location)
+            elapsed = time.perf_counter() - started_at
+            processed = manager.ledger.count()
+            print(f"processed jobs: {processed} ({manager.ledger.count('success')} successful)")
+            print(f"elapsed: {elapsed:.1f}s")
+            print(f"jobs per minute: {processed / (elapsed / 60) if elapsed else 0:.2f}")
+    finally:
+        driver.quit()
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Compares per-element tile extraction with the single execute_script extraction
+on a saved LinkedIn search results page.
+
+Save a results page from the browser ("Save page as... > Webpage, HTML only"), then run
+from the repository root with: python -m benchmarks.bench_tile_extraction path/to/page.html
+"""
+import sys
+import time
+from pathlib import Path
+
+from selenium import webdriver
+
+from src.linkedIn_job_manager import LinkedInJobManager
+
+
+def time_call(function, repeat=5):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main(page_path):
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    driver = webdriver.Chrome(options=options)
+    try:
+        driver.get(Path(page_path).resolve().as_uri())
+        manager = LinkedInJobManager(driver)
+        old_time, old_jobs = time_call(manager.extract_jobs_from_page_elements)
+        new_time, new_jobs = time_call(manager.extract_jobs_from_page)
+        print(f"tiles: {len(new_jobs)}")
+        print(f"per-element extraction: {old_time * 1000:8.1f} ms")
+        print(f"single-script extraction: {new_time * 1000:8.1f} ms")
+        mismatches = [(old, new) for old, new in zip(old_jobs, new_jobs)
+                      if (old.title, old.company, old.link) != (new.title, new.company, new.link)]
+        print(f"mismatched tiles: {len(mismatches) + abs(len(old_jobs) - len(new_jobs))}")
+    finally:
+        driver.quit()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        sys.exit("usage: python -m benchmarks.bench_tile_extraction path/to/page.html")
+    main(sys.argv[1])
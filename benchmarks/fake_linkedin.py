@@ -0,0 +1,149 @@
+"""
+Local stand-in for LinkedIn that serves fixtures saved by src.fixture_recorder.
+
+Pages are served with their scripts removed and www.linkedin.com links rewritten to
+this server. Job pages get a small script that plays back the recorded Easy Apply
+modal steps: clicking the Easy Apply button shows step 0, and each primary button
+inside the modal loads the next step.
+
+Run from the repository root with:
+python -m benchmarks.fake_linkedin path/to/fixtures [--port 8765] [--latency 0.2]
+"""
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from src.fixture_recorder import page_key
+from src.job import parse_job_id
+
+SCRIPT_PATTERN = re.compile(r"<script\b[^>]*>.*?</script>", re.IGNORECASE | re.DOTALL)
+ORIGIN_PATTERN = re.compile(r"https?://(?:www\.)?linkedin\.com")
+MODAL_PLAYER = """
+<div id="replay-modal-host"></div>
+<script>
+(function () {
+    var jobId = "%s", step = 0;
+    var host = document.getElementById('replay-modal-host');
+    function load(n) {
+        fetch('/__replay/modal/' + jobId + '/' + n).then(function (response) {
+            return response.ok ? response.text() : '';
+        }).then(function (html) { host.innerHTML = html; });
+    }
+    document.addEventListener('click', function (event) {
+        var button = event.target.closest('button');
+        if (!button) { return; }
+        if (button.classList.contains('jobs-apply-button')) {
+            event.preventDefault(); step = 0; load(step);
+        } else if (host.contains(button) && button.classList.contains('artdeco-button--primary')) {
+            event.preventDefault(); step += 1; load(step);
+        } else if (host.contains(button) && button.classList.contains('artdeco-modal__dismiss')) {
+            event.preventDefault(); host.innerHTML = '';
+        }
+    }, true);
+})();
+</script>
+"""
+
+
+class FixtureStore:
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        with open(self.directory / "index.json", 'r', encoding='utf-8') as f:
+            index = json.load(f)
+        self.pages = index.get("pages", {})
+        self.modals = index.get("modals", {})
+
+    def page(self, path):
+        relative = self.pages.get(page_key(path))
+        if relative is None:
+            return None
+        return (self.directory / relative).read_text(encoding='utf-8')
+
+    def modal_step(self, job_id, step):
+        steps = self.modals.get(job_id, [])
+        if step >= len(steps):
+            return None
+        return (self.directory / steps[step]).read_text(encoding='utf-8')
+
+
+class FakeLinkedInServer:
+    def __init__(self, fixtures_directory, host="127.0.0.1", port=0, latency=(0.0, 0.0)):
+        self.store = FixtureStore(fixtures_directory)
+        self.latency = latency
+        self.httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="fake-linkedin", daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def render(self, html, job_id=""):
+        html = ORIGIN_PATTERN.sub(self.base_url, SCRIPT_PATTERN.sub("", html))
+        if job_id:
+            player = MODAL_PLAYER % job_id
+            html = html.replace("</body>", player + "</body>") if "</body>" in html else html + player
+        return html
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                time.sleep(random.uniform(*server.latency))
+                body = self._route()
+                if body is None:
+                    self.send_error(404)
+                    return
+                payload = body.encode('utf-8')
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def _route(self):
+                match = re.match(r"^/__replay/modal/(\d+)/(\d+)$", self.path)
+                if match:
+                    return server.store.modal_step(match.group(1), int(match.group(2)))
+                html = server.store.page(self.path)
+                if html is None:
+                    return None
+                job_id = parse_job_id(self.path) if "/jobs/view/" in self.path else ""
+                return server.render(html, job_id)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve recorded LinkedIn fixtures locally.")
+    parser.add_argument("fixtures")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, nargs="+", default=[0.0],
+                        help="Fixed latency in seconds, or a min and max for a random latency.")
+    args = parser.parse_args()
+    latency = (args.latency[0], args.latency[-1])
+    server = FakeLinkedInServer(args.fixtures, port=args.port, latency=latency)
+    print(f"Serving {args.fixtures} at {server.base_url}")
+    server.httpd.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Local OpenAI-compatible stub for exercising the LLM code paths without the API.
+
+Serves POST /v1/chat/completions with a fixed latency. JSON-mode requests get an
+``{"answers": [...]}`` object answering every question id found in the prompt;
+other requests get a short canned reply. Point GPTAnswerer at it with
+``base_url=server.base_url`` (or ``llmBaseUrl`` in config.yaml).
+
+Run from the repository root with:
+python -m benchmarks.fake_openai [--port 8766] [--latency 0.5]
+"""
+import argparse
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+QUESTION_ID_PATTERN = re.compile(r'"id":\s*(\d+)')
+
+
+class FakeOpenAIServer:
+    def __init__(self, host="127.0.0.1", port=0, latency=(0.0, 0.0), answer="Yes"):
+        self.latency = latency
+        self.answer = answer
+        self.request_count = 0
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="fake-openai", daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def completion(self, request):
+        prompt = "\n".join(str(message.get("content", "")) for message in request.get("messages", []))
+        if (request.get("response_format") or {}).get("type") == "json_object":
+            ids = sorted({int(i) for i in QUESTION_ID_PATTERN.findall(prompt)})
+            content = json.dumps({"answers": [{"id": i, "answer": self.answer} for i in ids]})
+        else:
+            content = f"{self.answer}."
+        prompt_tokens, completion_tokens = len(prompt.split()), len(content.split())
+        return {
+            "id": f"chatcmpl-{uuid.uuid4().hex}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.get("model", "stub"),
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens,
+                      "total_tokens": prompt_tokens + completion_tokens},
+        }
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                request = json.loads(self.rfile.read(length) or b"{}")
+                if not self.path.rstrip("/").endswith("/chat/completions"):
+                    self.send_error(404)
+                    return
+                with server._lock:
+                    server.request_count += 1
+                    server._in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server._in_flight)
+                try:
+                    time.sleep(random.uniform(*server.latency))
+                finally:
+                    with server._lock:
+                        server._in_flight -= 1
+                payload = json.dumps(server.completion(request)).encode('utf-8')
+                try:
+                    self.send_response(200)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(payload)))
+                    self.end_headers()
+                    self.wfile.write(payload)
+                except (BrokenPipeError, ConnectionResetError):
+                    # The client timed out or cancelled the request.
+                    pass
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve an OpenAI-compatible chat completions stub.")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--latency", type=float, nargs="+", default=[0.5],
+                        help="Fixed latency in seconds, or a min and max for a random latency.")
+    args = parser.parse_args()
+    server = FakeOpenAIServer(port=args.port, latency=(args.latency[0], args.latency[-1]))
+    print(f"Serving a chat completions stub at {server.base_url}")
+    server.httpd.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Deterministic synthetic data for the benchmarks."""
+import random
+import string
+
+QUESTION_WORDS = [
+    "how", "many", "years", "of", "experience", "do", "you", "have", "with", "are", "legally",
+    "authorized", "to", "work", "in", "the", "require", "sponsorship", "what", "is", "your",
+    "expected", "salary", "python", "java", "react", "aws", "remote", "relocate", "english",
+    "level", "notice", "period", "degree", "willing", "background", "check", "commute",
+]
+
+
+def random_word(rng, length=8):
+    return "".join(rng.choice(string.ascii_lowercase) for _ in range(length))
+
+
+def blacklists(size, seed=0):
+    rng = random.Random(seed)
+    titles = [random_word(rng) if i % 3 else f"{random_word(rng)} {random_word(rng)}" for i in range(size)]
+    companies = [f"{random_word(rng)} {random_word(rng, 5)}" for _ in range(size)]
+    return titles, companies
+
+
+def questions(size, seed=0):
+    rng = random.Random(seed)
+    return [
+        " ".join(rng.choice(QUESTION_WORDS) for _ in range(rng.randint(6, 14))) + f" {random_word(rng, 5)}?"
+        for _ in range(size)
+    ]
+
+
+def answers(size, seed=0):
+    rng = random.Random(seed)
+    return [
+        {"question": question, "answer": rng.choice(["Yes", "No", "3", "English"]),
+         "type": rng.choice(["radio", "textbox", "dropdown"])}
+        for question in questions(size, seed)
+    ]
+
+
+def options(size, seed=0):
+    rng = random.Random(seed)
+    return [f"{random_word(rng, rng.randint(3, 10))} {random_word(rng, 4)}" for _ in range(size)]
+
+
+def ledger_rows(size, seed=0):
+    rng = random.Random(seed)
+    for index in range(size):
+        job_id = str(3_000_000_000 + index)
+        data = {
+            "company": f"{random_word(rng, 6).title()} Inc",
+            "job_title": f"{random_word(rng).title()} Engineer",
+            "link": f"https://www.linkedin.com/jobs/view/{job_id}/",
+            "job_recruiter": "",
+            "job_location": "Remote",
+            "pdf_path": "",
+        }
+        yield job_id, rng.choice(["success", "failed", "skipped"]), data, None
@@ -0,0 +1,181 @@
+"""
+Micro-benchmarks for the per-job pure-Python code paths, with a stored baseline.
+
+Run from the repository root:
+    python -m benchmarks.suite --save-baseline     # record benchmarks/baseline.json
+    python -m benchmarks.suite                     # compare; exits 1 on a regression, 2 without a baseline
+
+A case fails when its time per call is more than ``--threshold`` (default 25%) slower
+than the baseline. Baselines depend on the machine, so record them on the machine
+that runs the comparison. Cases whose dependencies are not installed are skipped.
+"""
+import argparse
+import itertools
+import json
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+from benchmarks import generators
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+SIZES = [10, 100, 1000, 10000, 100000]
+
+
+def _job_manager(directory, title_blacklist=(), company_blacklist=()):
+    from src.linkedIn_job_manager import LinkedInJobManager
+    manager = LinkedInJobManager(driver=None)
+    manager.set_parameters({
+        'remote': True,
+        'experienceLevel': {'entry': True, 'associate': True, 'mid-senior level': True},
+        'jobTypes': {'full-time': True, 'contract': True},
+        'date': {'week': True},
+        'positions': [],
+        'locations': [],
+        'distance': 25,
+        'companyBlacklist': list(company_blacklist),
+        'titleBlacklist': list(title_blacklist),
+        'outputFileDirectory': directory,
+    })
+    return manager
+
+
+def setup_is_blacklisted(size, directory):
+    titles, companies = generators.blacklists(size)
+    manager = _job_manager(directory, titles, companies)
+    return lambda: manager.is_blacklisted("Senior/Lead Software Engineer, Platform", "Acme Corp")
+
+
+def setup_find_best_match(size, directory):
+    from src.gpt import GPTAnswerer
+    options = generators.options(size)
+    return lambda: GPTAnswerer.find_best_match("Yes, I am authorized", options)
+
+
+def setup_answer_lookup(size, directory):
+    from src.answer_store import AnswerStore
+    legacy_path = directory / "answers.json"
+    entries = generators.answers(size)
+    legacy_path.write_text(json.dumps(entries), encoding='utf-8')
+    store = AnswerStore(legacy_path, directory / "answers.jsonl")
+    exact = entries[size // 2]
+    near = exact["question"].rstrip("?") + " please?"
+
+    def run():
+        store.lookup(exact["question"], exact["type"])
+        store.lookup(near, exact["type"])
+        store.lookup("completely unrelated question about favourite colours", "radio")
+
+    return run
+
+
+def setup_write_to_file(size, directory):
+    from src.job import Job
+    manager = _job_manager(directory)
+    manager.ledger.record_many(generators.ledger_rows(size))
+    job_ids = itertools.count(4_000_000_000)
+
+    def run():
+        job_id = next(job_ids)
+        job = Job("Engineer", "Acme", "Remote", f"https://www.linkedin.com/jobs/view/{job_id}/", "Easy Apply")
+        manager.write_to_file(job, "success")
+
+    return run
+
+
+def setup_get_base_search_url(size, directory):
+    manager = _job_manager(directory)
+    parameters = {
+        'remote': True,
+        'experienceLevel': {'internship': False, 'entry': True, 'associate': True, 'mid-senior level': True,
+                            'director': False, 'executive': False},
+        'jobTypes': {'full-time': True, 'contract': True, 'part-time': False},
+        'date': {'all time': False, 'month': False, 'week': True, '24 hours': False},
+        'distance': 25,
+    }
+    return lambda: manager.get_base_search_url(parameters)
+
+
+def setup_formatted_job_information(size, directory):
+    from src.job import Job
+    description = " ".join(generators.questions(max(1, size // 10)))
+    job = Job("Engineer", "Acme", "Remote", "https://www.linkedin.com/jobs/view/1/", "Easy Apply",
+              description=description)
+    return job.formatted_job_information
+
+
+CASES = {
+    "is_blacklisted": (setup_is_blacklisted, SIZES),
+    "find_best_match": (setup_find_best_match, SIZES),
+    "answer_lookup": (setup_answer_lookup, SIZES),
+    "write_to_file": (setup_write_to_file, SIZES),
+    "get_base_search_url": (setup_get_base_search_url, [1]),
+    "formatted_job_information": (setup_formatted_job_information, SIZES),
+}
+
+
+def seconds_per_call(function, repeat=7):
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run_cases(max_size, name_filter):
+    results = {}
+    for name, (setup, sizes) in CASES.items():
+        if name_filter and name_filter not in name:
+            continue
+        for size in sizes:
+            if size > max_size:
+                continue
+            key = f"{name}[{size}]"
+            with tempfile.TemporaryDirectory() as directory:
+                try:
+                    function = setup(size, Path(directory))
+                except ImportError as e:
+                    print(f"{key:<36} skipped ({e})")
+                    break
+                results[key] = seconds_per_call(function)
+            print(f"{key:<36} {results[key] * 1e6:>12.2f} us")
+    return results
+
+
+def compare(results, baseline, threshold):
+    regressions = []
+    for key, seconds in results.items():
+        if key not in baseline:
+            continue
+        ratio = seconds / baseline[key]
+        if ratio > 1 + threshold:
+            regressions.append((key, ratio))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the hot-path micro-benchmarks.")
+    parser.add_argument("--save-baseline", "--update-baseline", action="store_true")
+    parser.add_argument("--threshold", type=float, default=0.25)
+    parser.add_argument("--max-size", type=int, default=max(SIZES))
+    parser.add_argument("--filter", default="")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    args = parser.parse_args()
+
+    results = run_cases(args.max_size, args.filter)
+    if args.save_baseline:
+        baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+        baseline.update(results)
+        args.baseline.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        print(f"Saved {len(results)} results to {args.baseline}")
+        return 0
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; run with --save-baseline first.")
+        return 2
+    regressions = compare(results, json.loads(args.baseline.read_text()), args.threshold)
+    for key, ratio in regressions:
+        print(f"REGRESSION {key}: {ratio:.2f}x the baseline")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,11 +9,16 @@ from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.common.exceptions import WebDriverException
-from src.utils import chromeBrowserOptions
-from src.gpt import GPTAnswerer
+from src.utils import chromeBrowserOptions, chromeProfilePath, worker_chrome_profile_path
+from src.browser_profile import PROFILES, BrowserProfile
+from src.gpt import GPTAnswerer, LLMLogger
+from src.llm_accounting import CACHE_ONLY, PAUSE, LLMAccounting
 from src.linkedIn_authenticator import LinkedInAuthenticator
 from src.linkedIn_bot_facade import LinkedInBotFacade
 from src.linkedIn_job_manager import LinkedInJobManager
+from src.metrics import start_exporters
+from src.tracing import TRACER
+from src.worker_pool import SearchWorkerPool
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -94,6 +99,133 @@ class ConfigValidator:
             if parameters[blacklist] is None:
                 parameters[blacklist] = []
 
+        if parameters.get('scrollMode', 'event') not in {'event', 'slow'}:
+            raise ConfigError(f"'scrollMode' must be 'event' or 'slow' in config file {config_yaml_path}")
+        if not isinstance(parameters.get('scrollPacing', {}), dict):
+            raise ConfigError(f"'scrollPacing' must be a dictionary in config file {config_yaml_path}")
+
+        worker_pool = parameters.get('workerPool', {})
+        if not isinstance(worker_pool, dict):
+            raise ConfigError(f"'workerPool' must be a dictionary in config file {config_yaml_path}")
+        for key in ['workers', 'maxConcurrentSearches']:
+            if key in worker_pool and (not isinstance(worker_pool[key], int) or worker_pool[key] < 1):
+                raise ConfigError(f"'workerPool.{key}' must be a positive integer in config file {config_yaml_path}")
+        for key in ['minTaskDelay', 'maxTaskDelay']:
+            if key in worker_pool and not isinstance(worker_pool[key], (int, float)):
+                raise ConfigError(f"'workerPool.{key}' must be a number in config file {config_yaml_path}")
+
+        pacing = parameters.get('pacing', {})
+        if not isinstance(pacing, dict):
+            raise ConfigError(f"'pacing' must be a dictionary in config file {config_yaml_path}")
+        for key in ['pageLoadsPerHour', 'applicationsPerHour', 'maxPageLoadsPerDay', 'maxApplicationsPerDay', 'burst']:
+            if pacing.get(key) is not None and (not isinstance(pacing[key], (int, float)) or pacing[key] <= 0):
+                raise ConfigError(f"'pacing.{key}' must be a positive number in config file {config_yaml_path}")
+
+        search_sweep = parameters.get('searchSweep', {})
+        if not isinstance(search_sweep, dict):
+            raise ConfigError(f"'searchSweep' must be a dictionary in config file {config_yaml_path}")
+        stale_after = search_sweep.get('staleAfterHours')
+        if stale_after is not None and (not isinstance(stale_after, (int, float)) or stale_after <= 0):
+            raise ConfigError(f"'searchSweep.staleAfterHours' must be a positive number in config file {config_yaml_path}")
+        max_page_failures = search_sweep.get('maxPageFailures', 3)
+        if not isinstance(max_page_failures, int) or max_page_failures < 1:
+            raise ConfigError(f"'searchSweep.maxPageFailures' must be a positive integer in config file {config_yaml_path}")
+
+        if parameters.get('jobExtraction', 'dom') not in ('dom', 'network'):
+            raise ConfigError(f"'jobExtraction' must be 'dom' or 'network' in config file {config_yaml_path}")
+
+        browser_profile = parameters.get('browserProfile', {})
+        if not isinstance(browser_profile, dict):
+            raise ConfigError(f"'browserProfile' must be a dictionary in config file {config_yaml_path}")
+        if browser_profile.get('name', 'default') not in PROFILES:
+            raise ConfigError(f"'browserProfile.name' must be one of {', '.join(PROFILES)} in config file {config_yaml_path}")
+        if not isinstance(browser_profile.get('headless', False), bool):
+            raise ConfigError(f"'browserProfile.headless' must be a boolean in config file {config_yaml_path}")
+        if not isinstance(browser_profile.get('measureTransfers', False), bool):
+            raise ConfigError(f"'browserProfile.measureTransfers' must be a boolean in config file {config_yaml_path}")
+        blocked_urls = browser_profile.get('blockedUrls', [])
+        if not isinstance(blocked_urls, list) or not all(isinstance(url, str) for url in blocked_urls):
+            raise ConfigError(f"'browserProfile.blockedUrls' must be a list of URL patterns in config file {config_yaml_path}")
+
+        incremental_search = parameters.get('incrementalSearch', {})
+        if not isinstance(incremental_search, dict):
+            raise ConfigError(f"'incrementalSearch' must be a dictionary in config file {config_yaml_path}")
+        if not isinstance(incremental_search.get('enabled', False), bool):
+            raise ConfigError(f"'incrementalSearch.enabled' must be a boolean in config file {config_yaml_path}")
+        overlap = incremental_search.get('overlapMinutes')
+        if overlap is not None and (not isinstance(overlap, (int, float)) or overlap < 0):
+            raise ConfigError(f"'incrementalSearch.overlapMinutes' must be a non-negative number in config file {config_yaml_path}")
+
+        for key in ['recordFixtures', 'linkedinBaseUrl', 'llmBaseUrl']:
+            if key in parameters and not isinstance(parameters[key], str):
+                raise ConfigError(f"'{key}' must be a string in config file {config_yaml_path}")
+
+        if not isinstance(parameters.get('batchAnswers', False), bool):
+            raise ConfigError(f"'batchAnswers' must be a boolean in config file {config_yaml_path}")
+
+        async_llm = parameters.get('asyncLLM', {})
+        if not isinstance(async_llm, dict):
+            raise ConfigError(f"'asyncLLM' must be a dictionary in config file {config_yaml_path}")
+        for key in ['enabled', 'coverLetter']:
+            if not isinstance(async_llm.get(key, False), bool):
+                raise ConfigError(f"'asyncLLM.{key}' must be a boolean in config file {config_yaml_path}")
+        if 'maxConcurrency' in async_llm and (not isinstance(async_llm['maxConcurrency'], int) or async_llm['maxConcurrency'] < 1):
+            raise ConfigError(f"'asyncLLM.maxConcurrency' must be a positive integer in config file {config_yaml_path}")
+        if 'timeout' in async_llm and (not isinstance(async_llm['timeout'], (int, float)) or async_llm['timeout'] <= 0):
+            raise ConfigError(f"'asyncLLM.timeout' must be a positive number in config file {config_yaml_path}")
+
+        llm_budget = parameters.get('llmBudget', {})
+        if not isinstance(llm_budget, dict):
+            raise ConfigError(f"'llmBudget' must be a dictionary in config file {config_yaml_path}")
+        for key in ['hourlyBudget', 'dailyBudget']:
+            if llm_budget.get(key) is not None and (not isinstance(llm_budget[key], (int, float)) or llm_budget[key] <= 0):
+                raise ConfigError(f"'llmBudget.{key}' must be a positive number in config file {config_yaml_path}")
+        if llm_budget.get('onExhausted', CACHE_ONLY) not in {CACHE_ONLY, PAUSE}:
+            raise ConfigError(f"'llmBudget.onExhausted' must be '{CACHE_ONLY}' or '{PAUSE}' in config file {config_yaml_path}")
+        for model_name, price in (llm_budget.get('prices') or {}).items():
+            if not isinstance(price, dict) or not all(isinstance(price.get(k, 0), (int, float)) for k in ['input', 'output']):
+                raise ConfigError(f"'llmBudget.prices.{model_name}' must map 'input' and 'output' to USD per million tokens in config file {config_yaml_path}")
+
+        metrics_config = parameters.get('metrics', {})
+        if not isinstance(metrics_config, dict):
+            raise ConfigError(f"'metrics' must be a dictionary in config file {config_yaml_path}")
+        if 'port' in metrics_config and (not isinstance(metrics_config['port'], int) or not 0 < metrics_config['port'] < 65536):
+            raise ConfigError(f"'metrics.port' must be a TCP port number in config file {config_yaml_path}")
+        if 'file' in metrics_config and not isinstance(metrics_config['file'], str):
+            raise ConfigError(f"'metrics.file' must be a string in config file {config_yaml_path}")
+        if 'interval' in metrics_config and (not isinstance(metrics_config['interval'], (int, float)) or metrics_config['interval'] <= 0):
+            raise ConfigError(f"'metrics.interval' must be a positive number in config file {config_yaml_path}")
+
+        tracing_config = parameters.get('tracing', {})
+        if not isinstance(tracing_config, dict):
+            raise ConfigError(f"'tracing' must be a dictionary in config file {config_yaml_path}")
+        if 'file' in tracing_config and not isinstance(tracing_config['file'], str):
+            raise ConfigError(f"'tracing.file' must be a string in config file {config_yaml_path}")
+        if 'maxEvents' in tracing_config and (not isinstance(tracing_config['maxEvents'], int) or tracing_config['maxEvents'] < 1):
+            raise ConfigError(f"'tracing.maxEvents' must be a positive integer in config file {config_yaml_path}")
+
+        pipeline = parameters.get('pipeline', {})
+        if not isinstance(pipeline, dict):
+            raise ConfigError(f"'pipeline' must be a dictionary in config file {config_yaml_path}")
+        if not isinstance(pipeline.get('enabled', False), bool):
+            raise ConfigError(f"'pipeline.enabled' must be a boolean in config file {config_yaml_path}")
+        for key in ['queueSize', 'summarizerThreads']:
+            if key in pipeline and (not isinstance(pipeline[key], int) or pipeline[key] < 1):
+                raise ConfigError(f"'pipeline.{key}' must be a positive integer in config file {config_yaml_path}")
+
+        description_filter = parameters.get('descriptionFilter', {})
+        if not isinstance(description_filter, dict):
+            raise ConfigError(f"'descriptionFilter' must be a dictionary in config file {config_yaml_path}")
+        for key in ['requiredKeywords', 'excludedKeywords', 'languages']:
+            if key in description_filter and not isinstance(description_filter[key], list):
+                raise ConfigError(f"'descriptionFilter.{key}' must be a list in config file {config_yaml_path}")
+        years = description_filter.get('maxYearsOfExperience')
+        if years is not None and (not isinstance(years, int) or years < 0):
+            raise ConfigError(f"'descriptionFilter.maxYearsOfExperience' must be a non-negative integer in config file {config_yaml_path}")
+        similarity = description_filter.get('minResumeSimilarity')
+        if similarity is not None and (not isinstance(similarity, (int, float)) or not 0 <= similarity <= 1):
+            raise ConfigError(f"'descriptionFilter.minResumeSimilarity' must be a number between 0 and 1 in config file {config_yaml_path}")
+
         return parameters
 
     @staticmethod
@@ -143,11 +275,15 @@ class FileManager:
         output_folder.mkdir(exist_ok=True)
         return (app_data_folder / 'secrets.yaml', app_data_folder / 'config.yaml', app_data_folder )
 
-def init_browser() -> webdriver.Chrome:
+def init_browser(profile_path: str = chromeProfilePath, browser_profile: BrowserProfile = None) -> webdriver.Chrome:
+    browser_profile = browser_profile if browser_profile is not None else BrowserProfile()
     try:
-        options = chromeBrowserOptions()
+        options = chromeBrowserOptions(profile_path, headless=browser_profile.headless,
+                                       performance_logging=browser_profile.performance_logging)
         service = ChromeService(ChromeDriverManager().install())
-        return webdriver.Chrome(service=service, options=options)
+        browser = webdriver.Chrome(service=service, options=options)
+        browser_profile.install(browser)
+        return browser
     except Exception as e:
         logging.error(f"Failed to initialize browser: {str(e)}")
         raise RuntimeError(f"Failed to initialize browser: {str(e)}")
@@ -155,17 +291,36 @@ def init_browser() -> webdriver.Chrome:
 def create_and_run_bot(email: str, password: str, parameters: dict, openai_api_key: str):
     try:
         os.system('cls' if os.name == 'nt' else 'clear')
+        start_exporters(parameters.get('metrics', {}))
+        if parameters.get('tracing', {}).get('file'):
+            TRACER.enable(parameters['tracing']['file'], parameters['tracing'].get('maxEvents', 200_000))
+
+        browser_profile = BrowserProfile.from_config(parameters.get('browserProfile', {}),
+                                                     performance_logging=parameters.get('jobExtraction', 'dom') == 'network')
+        logging.info(f"Browser profile: {browser_profile}")
+
+        if parameters.get('workerPool', {}).get('workers', 1) > 1:
+            SearchWorkerPool(email, password, parameters, openai_api_key,
+                             lambda profile_path: init_browser(profile_path, browser_profile)).run()
+            return
 
-        browser = init_browser()
+        browser = init_browser(browser_profile=browser_profile)
         login_component = LinkedInAuthenticator(browser)
         apply_component = LinkedInJobManager(browser)
-        gpt_answerer_component = GPTAnswerer(openai_api_key)
+        gpt_answerer_component = GPTAnswerer(openai_api_key, base_url=parameters.get('llmBaseUrl'),
+                                             accounting=LLMAccounting.from_config(parameters.get('llmBudget', {}),
+                                                                                  LLMLogger.calls_log_writer.file_path))
         bot = LinkedInBotFacade(login_component, apply_component)
         bot.set_secrets(email, password)
+        bot.load_job_application_profile(Path(parameters['outputFileDirectory']) / 'plain_text_resume.yaml')
         bot.set_gpt_answerer_and_resume_generator(gpt_answerer_component)
         bot.set_parameters(parameters)
         bot.start_login()
-        bot.start_apply()
+        if parameters.get('pipeline', {}).get('enabled', False):
+            harvest_browser = init_browser(worker_chrome_profile_path("harvester"), browser_profile)
+            bot.start_pipeline(LinkedInAuthenticator(harvest_browser), LinkedInJobManager(harvest_browser))
+        else:
+            bot.start_apply()
     except yaml.YAMLError as exc:
         logging.error(f"Error parsing YAML content: {exc}")
     except WebDriverException as e:
@@ -0,0 +1,133 @@
+import json
+import math
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Union
+
+WORD_PATTERN = re.compile(r"\w+")
+
+
+def normalize_question(question: str) -> str:
+    return " ".join(WORD_PATTERN.findall((question or "").casefold()))
+
+
+def trigrams(text: str) -> Set[str]:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class _TypeIndex:
+    def __init__(self):
+        self.exact: Dict[str, str] = {}
+        self.questions: List[str] = []
+        self.grams: List[Set[str]] = []
+        self.postings: Dict[str, List[int]] = {}
+
+    def add(self, normalized: str, answer: str):
+        if normalized not in self.exact:
+            entry_id = len(self.questions)
+            grams = trigrams(normalized)
+            self.questions.append(normalized)
+            self.grams.append(grams)
+            for gram in grams:
+                self.postings.setdefault(gram, []).append(entry_id)
+        self.exact[normalized] = answer
+
+    def nearest(self, normalized: str, threshold: float) -> Optional[str]:
+        query = trigrams(normalized)
+        if not query:
+            return None
+        # Prefix filter: any entry with Jaccard >= threshold shares at least one of the
+        # rarest len(query) - ceil(threshold * len(query)) + 1 query trigrams.
+        ordered = sorted(query, key=lambda gram: len(self.postings.get(gram, ())))
+        prefix_length = len(query) - math.ceil(threshold * len(query)) + 1
+        candidates = set()
+        for gram in ordered[:prefix_length]:
+            candidates.update(self.postings.get(gram, ()))
+        min_size, max_size = threshold * len(query), len(query) / threshold
+        best_score, best_question = 0.0, None
+        for entry_id in candidates:
+            grams = self.grams[entry_id]
+            if not min_size <= len(grams) <= max_size:
+                continue
+            overlap = len(query & grams)
+            score = overlap / (len(query) + len(grams) - overlap)
+            if score > best_score:
+                best_score, best_question = score, self.questions[entry_id]
+        if best_question is not None and best_score >= threshold:
+            return self.exact[best_question]
+        return None
+
+
+class AnswerStore:
+    """
+    Indexed store of answers to Easy Apply form questions, separated by field type.
+
+    Exact hits go through a hash of the normalized question; near-duplicates are
+    found through a trigram index. Answers from the legacy ``answers.json`` list are
+    loaded as a seed, and every new answer is appended as one JSON line to the
+    journal file so it survives the next run.
+    """
+
+    def __init__(self, legacy_path: Union[str, Path] = "answers.json",
+                 journal_path: Union[str, Path] = "answers.jsonl", similarity_threshold: float = 0.85):
+        self.legacy_path = Path(legacy_path)
+        self.journal_path = Path(journal_path)
+        self.similarity_threshold = similarity_threshold
+        self._indexes: Dict[str, _TypeIndex] = {}
+        self._lock = threading.Lock()
+        for item in self._read_legacy() + self._read_journal():
+            if isinstance(item, dict) and item.get('question') and 'answer' in item:
+                self._index(item['question'], str(item['answer']), item.get('type', ''))
+
+    def _read_legacy(self) -> List[dict]:
+        try:
+            with open(self.legacy_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return []
+        return data if isinstance(data, list) else []
+
+    def _read_journal(self) -> List[dict]:
+        items = []
+        try:
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        items.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        # A torn final line from an interrupted write is simply ignored.
+                        continue
+        except FileNotFoundError:
+            pass
+        return items
+
+    def _index(self, question: str, answer: str, field_type: str):
+        normalized = normalize_question(question)
+        if normalized:
+            self._indexes.setdefault(field_type, _TypeIndex()).add(normalized, answer)
+
+    def __len__(self) -> int:
+        return sum(len(index.exact) for index in self._indexes.values())
+
+    def lookup(self, question: str, field_type: str) -> Optional[str]:
+        index = self._indexes.get(field_type)
+        normalized = normalize_question(question)
+        if index is None or not normalized:
+            return None
+        if normalized in index.exact:
+            return index.exact[normalized]
+        return index.nearest(normalized, self.similarity_threshold)
+
+    def add(self, question: str, answer: str, field_type: str):
+        if not normalize_question(question) or not answer:
+            return
+        line = json.dumps({"question": question, "answer": answer, "type": field_type}, ensure_ascii=False) + "\n"
+        with self._lock:
+            self._index(question, answer, field_type)
+            with open(self.journal_path, 'a', encoding='utf-8') as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
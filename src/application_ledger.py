@@ -0,0 +1,185 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+from src.job import parse_job_id
+
+# Imported in this order so a later "success" overrides an earlier "failed" for the same job.
+LEGACY_STATUSES = ("skipped", "failed", "success")
+
+
+class ApplicationLedger:
+    """
+    Latest outcome of every job the bot has processed, stored in SQLite (WAL mode).
+
+    Each record is keyed by the LinkedIn job ID, so recording a job is a single
+    indexed upsert instead of re-reading and rewriting a whole JSON array. Recording
+    a job again replaces its earlier outcome.
+    """
+
+    def __init__(self, db_path: Union[str, Path]):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+
+    def _create_schema(self):
+        with self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS applications (
+                    job_id TEXT PRIMARY KEY,
+                    status TEXT NOT NULL,
+                    company TEXT,
+                    job_title TEXT,
+                    link TEXT,
+                    job_recruiter TEXT,
+                    job_location TEXT,
+                    pdf_path TEXT,
+                    recorded_at REAL NOT NULL
+                )
+                """
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_applications_status ON applications(status)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_applications_company ON applications(company COLLATE NOCASE)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_applications_recorded_at ON applications(recorded_at)")
+
+    def record(self, job_id: str, status: str, data: Dict[str, str], recorded_at: Optional[float] = None):
+        self.record_many([(job_id, status, data, recorded_at)])
+
+    def record_many(self, records: Iterable[Tuple[str, str, Dict[str, str], Optional[float]]]):
+        """Records several (job_id, status, data, recorded_at) entries in one transaction."""
+        rows = []
+        for job_id, status, data, recorded_at in records:
+            if not job_id:
+                raise ValueError("A job ID or link is required to record an application.")
+            rows.append((
+                job_id,
+                status,
+                data.get("company", ""),
+                data.get("job_title", ""),
+                data.get("link", ""),
+                data.get("job_recruiter", ""),
+                data.get("job_location", ""),
+                data.get("pdf_path", ""),
+                recorded_at if recorded_at is not None else time.time(),
+            ))
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO applications "
+                "(job_id, status, company, job_title, link, job_recruiter, job_location, pdf_path, recorded_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM applications WHERE job_id = ?", (job_id,)).fetchone()
+        return dict(row) if row else None
+
+    def find(self, status: Optional[str] = None, company: Optional[str] = None,
+             since: Optional[float] = None, until: Optional[float] = None,
+             limit: Optional[int] = None) -> List[Dict]:
+        clauses, params = [], []
+        if status is not None:
+            clauses.append("status = ?")
+            params.append(status)
+        if company is not None:
+            clauses.append("company = ? COLLATE NOCASE")
+            params.append(company.strip())
+        if since is not None:
+            clauses.append("recorded_at >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("recorded_at < ?")
+            params.append(until)
+        query = "SELECT * FROM applications"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY recorded_at"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [dict(row) for row in rows]
+
+    def job_ids(self, statuses: Optional[List[str]] = None) -> List[str]:
+        query = "SELECT job_id FROM applications"
+        params = []
+        if statuses:
+            query += f" WHERE status IN ({', '.join('?' for _ in statuses)})"
+            params.extend(statuses)
+        with self._lock:
+            return [row[0] for row in self._conn.execute(query, params)]
+
+    def count(self, status: Optional[str] = None, since: Optional[float] = None) -> int:
+        clauses, params = [], []
+        if status is not None:
+            clauses.append("status = ?")
+            params.append(status)
+        if since is not None:
+            clauses.append("recorded_at >= ?")
+            params.append(since)
+        query = "SELECT COUNT(*) FROM applications"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        with self._lock:
+            return self._conn.execute(query, params).fetchone()[0]
+
+    def import_legacy_json(self, directory: Union[str, Path]) -> int:
+        """
+        One-shot import of the old success/failed/skipped JSON arrays.
+
+        Imported files are renamed to ``<name>.json.imported`` so they are never read twice.
+        Files that cannot be parsed are logged and left in place.
+        """
+        directory = Path(directory)
+        imported = 0
+        for status in LEGACY_STATUSES:
+            file_path = directory / f"{status}.json"
+            if not file_path.exists():
+                continue
+            try:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    records = json.load(f)
+            except json.JSONDecodeError as e:
+                logging.warning(f"Could not import {file_path} into the application ledger, leaving it in place: {e}")
+                continue
+            if not isinstance(records, list):
+                logging.warning(f"Could not import {file_path} into the application ledger, leaving it in place: "
+                                f"expected a JSON array")
+                continue
+            recorded_at = file_path.stat().st_mtime
+            entries = []
+            for data in records:
+                if not isinstance(data, dict):
+                    continue
+                job_id = parse_job_id(data.get("link", "")) or data.get("link", "")
+                if job_id:
+                    entries.append((job_id, status, data, recorded_at))
+            self.record_many(entries)
+            imported += len(entries)
+            file_path.rename(file_path.with_name(file_path.name + ".imported"))
+        return imported
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+if __name__ == "__main__":
+    import sys
+    # python -m src.application_ledger [data_folder]: the bot's outputFileDirectory, which
+    # holds success/failed/skipped.json and applications.db.
+    output_directory = Path(sys.argv[1]) if len(sys.argv) > 1 else Path("data_folder")
+    ledger = ApplicationLedger(output_directory / "applications.db")
+    print(f"Imported {ledger.import_legacy_json(output_directory)} records into {ledger.db_path}")
+    ledger.close()
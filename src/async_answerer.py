@@ -0,0 +1,137 @@
+import asyncio
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Dict, List, Optional, Sequence
+
+from src.gpt import NO_MATCHING_DATA
+from src.llm_accounting import current_call_labels, llm_call_labels
+
+
+@dataclass
+class JobPreparation:
+    summary: str = ""
+    cover_letter: str = ""
+    answers: List[str] = field(default_factory=list)
+
+
+class AsyncAnswerer:
+    """
+    asyncio front end to GPTAnswerer that overlaps LLM latency.
+
+    Every request holds a slot of a semaphore bounded by ``max_concurrency`` and is
+    cancelled after ``timeout`` seconds. prepare_job fans the summary and the cover
+    letter of a job out at once, and answer_questions does the same for the independent
+    questions of a form page, so each costs about one LLM round trip instead of one per
+    request.
+
+    Synchronous callers go through prepare_job_sync and answer_questions_sync, which run
+    the coroutines on one background event loop. The OpenAI async client keeps its
+    connections on that loop, and the semaphore bounds requests from every calling thread.
+    """
+
+    def __init__(self, gpt_answerer: Any, max_concurrency: int = 4, timeout: float = 60.0, cover_letter: bool = False):
+        self.gpt_answerer = gpt_answerer
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.cover_letter = cover_letter
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, gpt_answerer: Any, config: Optional[dict]) -> "AsyncAnswerer":
+        config = config or {}
+        return cls(
+            gpt_answerer,
+            max_concurrency=int(config.get('maxConcurrency', 4)),
+            timeout=float(config.get('timeout', 60)),
+            cover_letter=bool(config.get('coverLetter', False)),
+        )
+
+    async def _bounded(self, request: Awaitable):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._semaphore:
+            return await asyncio.wait_for(request, self.timeout)
+
+    async def summarize(self, text: str) -> str:
+        return await self._bounded(self.gpt_answerer.asummarize_job_description(text))
+
+    async def write_cover_letter(self, job_description: str) -> str:
+        return await self._bounded(self.gpt_answerer.awrite_cover_letter(job_description))
+
+    async def answer_question(self, question: Dict) -> str:
+        answers = await self._bounded(self.gpt_answerer.aanswer_questions_batch([question]))
+        return answers[0]
+
+    async def answer_questions(self, questions: Sequence[Dict]) -> List[str]:
+        """Answers each question in its own concurrent request; failed ones get NO_MATCHING_DATA."""
+        results = await asyncio.gather(*(self.answer_question(q) for q in questions), return_exceptions=True)
+        return [NO_MATCHING_DATA if isinstance(result, BaseException) else result for result in results]
+
+    async def prepare_job(self, job: Any, questions: Sequence[Dict] = ()) -> JobPreparation:
+        """
+        Runs the summary, the cover letter (if enabled) and the questions concurrently,
+        and stores the summary and cover letter on the job. A failed or timed out cover
+        letter or question is logged and left empty; a failed summary is raised.
+        """
+        # Tasks copy the current context, so every request is accounted to this job.
+        with llm_call_labels(job=job.job_id or job.link):
+            summary_task = asyncio.ensure_future(self.summarize(job.description))
+            cover_letter_task = asyncio.ensure_future(self.write_cover_letter(job.description)) if self.cover_letter else None
+            answers_task = asyncio.ensure_future(self.answer_questions(questions))
+        try:
+            summary = await summary_task
+        except BaseException:
+            for task in (cover_letter_task, answers_task):
+                if task is not None:
+                    task.cancel()
+            raise
+        preparation = JobPreparation(summary=summary, answers=await answers_task)
+        if cover_letter_task is not None:
+            try:
+                preparation.cover_letter = await cover_letter_task
+            except Exception as e:
+                logging.warning(f"Cover letter failed for {job.link}: {e!r}")
+        job.set_summarize_job_description(preparation.summary)
+        if preparation.cover_letter:
+            job.set_cover_letter(preparation.cover_letter)
+        return preparation
+
+    def prepare_job_sync(self, job: Any, questions: Sequence[Dict] = ()) -> JobPreparation:
+        """Blocking prepare_job; safe to call from several threads at once."""
+        return self._run_sync(self.prepare_job(job, questions))
+
+    def answer_questions_sync(self, questions: Sequence[Dict]) -> List[str]:
+        """Blocking answer_questions for the questions of one form page."""
+        return self._run_sync(self.answer_questions(questions))
+
+    def _run_sync(self, coroutine: Awaitable):
+        # The event loop thread does not see the caller's context, so carry its LLM call labels over.
+        labels = current_call_labels()
+
+        async def labelled():
+            with llm_call_labels(**labels):
+                return await coroutine
+
+        future = asyncio.run_coroutine_threadsafe(labelled(), self._event_loop())
+        try:
+            return future.result()
+        except BaseException:
+            future.cancel()
+            raise
+
+    def _event_loop(self) -> asyncio.AbstractEventLoop:
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, name="async-answerer", daemon=True).start()
+            return self._loop
+
+    def close(self):
+        with self._loop_lock:
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._loop = None
+                self._semaphore = None
@@ -0,0 +1,62 @@
+import re
+import unicodedata
+from typing import Dict, Iterable, List, Tuple
+
+# Words, keeping trailing '+'/'#' so entries like "C++" or "C#" survive tokenization.
+TOKEN_PATTERN = re.compile(r"\w+[+#]*")
+
+
+def normalize_text(text: str) -> str:
+    return unicodedata.normalize("NFKC", text or "").casefold()
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_PATTERN.findall(normalize_text(text))
+
+
+def normalize_company(company: str) -> str:
+    return " ".join(normalize_text(company).split())
+
+
+class BlacklistMatcher:
+    """
+    Title and company blacklists compiled once so each job check costs the same
+    regardless of how many entries the lists contain.
+
+    Company names are compared exactly (after case folding and whitespace
+    normalization) through a frozenset. Title entries are tokenized the same way
+    as job titles: single words go into a frozenset and multi-word phrases are
+    indexed by their first token, so a title is checked with one pass over its
+    own tokens.
+    """
+
+    def __init__(self, title_blacklist: Iterable[str], company_blacklist: Iterable[str]):
+        self.companies = frozenset(
+            name for name in (normalize_company(str(c)) for c in company_blacklist or []) if name
+        )
+        words = set()
+        phrases: Dict[str, List[Tuple[str, ...]]] = {}
+        for entry in title_blacklist or []:
+            tokens = tokenize(str(entry))
+            if len(tokens) == 1:
+                words.add(tokens[0])
+            elif tokens:
+                phrases.setdefault(tokens[0], []).append(tuple(tokens[1:]))
+        self.title_words = frozenset(words)
+        self.title_phrases = phrases
+
+    def is_company_blacklisted(self, company: str) -> bool:
+        return normalize_company(company) in self.companies
+
+    def is_title_blacklisted(self, title: str) -> bool:
+        tokens = tokenize(title)
+        for index, token in enumerate(tokens):
+            if token in self.title_words:
+                return True
+            for rest in self.title_phrases.get(token, ()):
+                if tuple(tokens[index + 1:index + 1 + len(rest)]) == rest:
+                    return True
+        return False
+
+    def matches(self, title: str, company: str) -> bool:
+        return self.is_title_blacklisted(title) or self.is_company_blacklisted(company)
@@ -0,0 +1,143 @@
+import threading
+import weakref
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+import src.metrics as metrics
+from src.llm_accounting import percentile
+from src.performance_log import PerformanceLog
+
+# URL patterns for Network.setBlockedURLs ("*" is a wildcard). Images and stylesheets
+# are already turned off through Chrome prefs in chromeBrowserOptions.
+FONT_URLS = ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"]
+MEDIA_URLS = ["*.mp4", "*.webm", "*.m3u8", "*.mp3", "*.gif", "*.svg"]
+TRACKING_URLS = [
+    "*://px.ads.linkedin.com/*",
+    "*://www.linkedin.com/li/track*",
+    "*://www.linkedin.com/li/tscp/*",
+    "*://www.linkedin.com/sensorCollect/*",
+    "*://*.doubleclick.net/*",
+    "*://*.google-analytics.com/*",
+    "*://*.googletagmanager.com/*",
+    "*://*.bing.com/*",
+    "*://*.facebook.net/*",
+]
+
+PROFILES = {
+    "default": {"headless": False, "blockedUrls": []},
+    "lean": {"headless": False, "blockedUrls": FONT_URLS + MEDIA_URLS + TRACKING_URLS},
+    "headless": {"headless": True, "blockedUrls": FONT_URLS + MEDIA_URLS + TRACKING_URLS},
+}
+
+# Navigation timing of the current document. Bytes are not taken from Resource Timing:
+# cross-origin resources without Timing-Allow-Origin report a transferSize of 0 there.
+PAGE_LOAD_SCRIPT = """
+var navigation = performance.getEntriesByType('navigation')[0];
+if (!navigation) { return null; }
+return {
+    interactive: navigation.domInteractive / 1000,
+    load: navigation.loadEventEnd / 1000
+};
+"""
+
+PAGE_LOAD_DURATION = metrics.REGISTRY.histogram(
+    "bot_page_load_seconds", "Page load milestones by browser profile.", ["profile", "milestone"])
+PAGE_TRANSFER_BYTES = metrics.REGISTRY.counter(
+    "bot_page_transfer_bytes", "Bytes transferred for page loads by browser profile.", ["profile"])
+PAGE_LOADS = metrics.REGISTRY.counter("bot_page_loads", "Timed page loads by browser profile.", ["profile"])
+
+# Per browser: [bytes, requests] finished since its last recorded page load. Kept per driver
+# rather than per BrowserProfile, since the profile that installs the counters at startup is
+# not necessarily the instance that records the page loads.
+_TRANSFERS: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_TRANSFERS_LOCK = threading.Lock()
+
+
+@dataclass
+class BrowserProfile:
+    """
+    How Chrome is started and what it may download.
+
+    ``name`` picks one of PROFILES; ``headless`` and ``blockedUrls`` in the
+    ``browserProfile`` config section override or extend it. Blocked URL patterns are
+    installed through the DevTools protocol, and every page load recorded with
+    record_page_load() is timed per profile, so profiles can be compared on
+    bytes transferred and time to interactive. Bytes and requests are only measured
+    when the browser has a performance log (``measureTransfers``, or the network job
+    extraction backend, which needs one anyway): the encoded size of every finished
+    request since the previous recorded page load, cross-origin ones included.
+    """
+    name: str = "default"
+    headless: bool = False
+    blocked_urls: List[str] = field(default_factory=list, repr=False)
+    performance_logging: bool = False
+    timings: List[Dict[str, float]] = field(default_factory=list, repr=False)
+
+    def __post_init__(self):
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config, performance_logging: bool = False):
+        config = config or {}
+        name = config.get('name', 'default')
+        preset = PROFILES[name]
+        return cls(
+            name=name,
+            headless=config.get('headless', preset["headless"]),
+            blocked_urls=preset["blockedUrls"] + list(config.get('blockedUrls', [])),
+            performance_logging=performance_logging or config.get('measureTransfers', False),
+        )
+
+    def install(self, driver):
+        """Blocks the profile's URL patterns and starts counting transfers in a freshly started browser."""
+        if self.performance_logging:
+            with _TRANSFERS_LOCK:
+                transfers = _TRANSFERS[driver] = [0, 0]
+
+            def on_loading_finished(params):
+                with _TRANSFERS_LOCK:
+                    transfers[0] += params.get("encodedDataLength", 0)
+                    transfers[1] += 1
+
+            PerformanceLog.for_driver(driver).subscribe("Network.loadingFinished", on_loading_finished)
+        if not self.blocked_urls:
+            return
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.blocked_urls})
+
+    def record_page_load(self, driver):
+        try:
+            timing = driver.execute_script(PAGE_LOAD_SCRIPT)
+        except Exception:
+            return
+        if not timing:
+            return
+        with _TRANSFERS_LOCK:
+            transfers = _TRANSFERS.get(driver)
+        if transfers is not None:
+            PerformanceLog.for_driver(driver).poll()
+            with _TRANSFERS_LOCK:
+                timing["bytes"], timing["requests"] = transfers
+                transfers[0] = transfers[1] = 0
+        with self._lock:
+            self.timings.append(timing)
+        PAGE_LOADS.inc(profile=self.name)
+        if "bytes" in timing:
+            PAGE_TRANSFER_BYTES.inc(timing["bytes"], profile=self.name)
+        PAGE_LOAD_DURATION.observe(timing["interactive"], profile=self.name, milestone="interactive")
+        if timing["load"] > 0:
+            PAGE_LOAD_DURATION.observe(timing["load"], profile=self.name, milestone="load")
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            timings = list(self.timings)
+        count = len(timings)
+        measured = [t for t in timings if "bytes" in t]
+        return {
+            "profile": self.name,
+            "page_loads": count,
+            "interactive_p50": round(percentile([t["interactive"] for t in timings], 0.5), 3),
+            "load_p50": round(percentile([t["load"] for t in timings if t["load"] > 0], 0.5), 3),
+            "kb_per_page": round(sum(t["bytes"] for t in measured) / 1024 / len(measured), 1) if measured else 0.0,
+            "requests_per_page": round(sum(t["requests"] for t in measured) / len(measured), 1) if measured else 0.0,
+        }
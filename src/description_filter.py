@@ -0,0 +1,160 @@
+import math
+import re
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import yaml
+
+from src.blacklist_matcher import tokenize
+
+LANGUAGES = [
+    "english", "spanish", "portuguese", "french", "german", "italian", "dutch", "polish", "swedish",
+    "danish", "norwegian", "finnish", "czech", "russian", "ukrainian", "turkish", "arabic", "hebrew",
+    "hindi", "chinese", "mandarin", "cantonese", "japanese", "korean", "vietnamese", "thai",
+]
+_LANGUAGE_ALTERNATION = "|".join(LANGUAGES)
+# Separators that stay within one clause, so a cue in one sentence never pairs with a number or
+# language in the next ("native Spanish speakers; English required" only requires English).
+_CLAUSE_GAP = r"[^\w.!?;\n]+"
+# Requirements aimed at the candidate: "fluent in German", "native-level Japanese",
+# "German speaker required", "Dutch is mandatory". A bare "native Spanish speakers" does
+# not count, as it usually describes the customers or the team.
+LANGUAGE_REQUIREMENT_PATTERN = re.compile(
+    rf"\b(?:fluent|fluency|proficien\w*|business[- ]level|native[- ]level|c1|c2|you\s+speak)"
+    rf"{_CLAUSE_GAP}(?:\w+{_CLAUSE_GAP}){{0,3}}?({_LANGUAGE_ALTERNATION})\b"
+    rf"|\b({_LANGUAGE_ALTERNATION}){_CLAUSE_GAP}(?:\w+{_CLAUSE_GAP}){{0,2}}?(?:is\s+)?(?:required|mandatory|a\s+must)\b",
+    re.IGNORECASE,
+)
+_YEARS = r"(\d{1,2})\s*\+?\s*(?:(?:-|–|to)\s*\d{1,2}\s*\+?\s*)?years?\b"
+_YEARS_EXPERIENCE = rf"{_YEARS}(?:{_CLAUSE_GAP}\w+){{0,4}}?{_CLAUSE_GAP}(?:experience|exp)\b"
+# Experience asked of the candidate: "you have 5+ years of experience", "requires at least
+# 3 years of Python experience", "minimum 2-4 years experience", "5 years of experience required",
+# or the first line under a "Requirements:" heading.
+# Company boilerplate such as "20 years of experience in the industry" has no such cue.
+YEARS_OF_EXPERIENCE_PATTERN = re.compile(
+    rf"\b(?:you\s+(?:have|bring|need|possess|should\s+have|must\s+have|will\s+have)|you'll\s+(?:have|need|bring)"
+    rf"|requir\w*|minimum(?:\s+of)?|at\s+least|must\s+have|min\.?)"
+    rf"(?:{_CLAUSE_GAP}(?:\w+{_CLAUSE_GAP}){{0,3}}?|[^\w.!?;]*\n[^\w.!?;]*){_YEARS_EXPERIENCE}"
+    rf"|\b{_YEARS_EXPERIENCE}{_CLAUSE_GAP}(?:\w+{_CLAUSE_GAP}){{0,3}}?(?:is\s+)?(?:required|mandatory|needed)\b",
+    re.IGNORECASE,
+)
+
+
+class DescriptionRejected(Exception):
+    pass
+
+
+def extract_years_of_experience(text: str) -> Optional[int]:
+    """
+    Returns the smallest number of years the description asks of the candidate, if any;
+    higher figures are usually for a preferred profile or a single skill.
+    """
+    years = [int(match.group(1) or match.group(2)) for match in YEARS_OF_EXPERIENCE_PATTERN.finditer(text or "")]
+    return min(years) if years else None
+
+
+def extract_required_languages(text: str) -> List[str]:
+    languages = set()
+    for match in LANGUAGE_REQUIREMENT_PATTERN.finditer(text or ""):
+        languages.add((match.group(1) or match.group(2)).lower())
+    return sorted(languages)
+
+
+def flatten_yaml_text(data) -> Iterable[str]:
+    if isinstance(data, dict):
+        for key, value in data.items():
+            yield str(key)
+            yield from flatten_yaml_text(value)
+    elif isinstance(data, list):
+        for item in data:
+            yield from flatten_yaml_text(item)
+    elif data is not None:
+        yield str(data)
+
+
+class DescriptionFilter:
+    """
+    Cheap local checks on a scraped job description, run before any LLM call.
+
+    A description is rejected when it misses a required keyword, contains an excluded
+    keyword, asks the candidate for more years of experience than ``maxYearsOfExperience``,
+    requires a language outside ``languages``, or its TF-IDF cosine similarity to the plain text
+    resume falls below ``minResumeSimilarity``. Document frequencies are learned from
+    the descriptions seen during the run.
+    """
+
+    def __init__(self, config: Optional[dict], resume_path: Union[str, Path, None]):
+        config = config or {}
+        self.required_keywords = [tuple(tokenize(k)) for k in config.get('requiredKeywords', []) or [] if tokenize(k)]
+        self.excluded_keywords = [tuple(tokenize(k)) for k in config.get('excludedKeywords', []) or [] if tokenize(k)]
+        self.max_years_of_experience = config.get('maxYearsOfExperience')
+        self.languages = {language.lower() for language in config.get('languages', []) or []}
+        self.min_resume_similarity = config.get('minResumeSimilarity')
+        self.resume_terms = Counter()
+        if self.min_resume_similarity is not None and resume_path and Path(resume_path).exists():
+            with open(resume_path, 'r', encoding='utf-8') as f:
+                self.resume_terms = Counter(tokenize(" ".join(flatten_yaml_text(yaml.safe_load(f)))))
+        self.document_count = 1
+        self.document_frequency = Counter(self.resume_terms.keys())
+        self.passed = 0
+        self.rejections = Counter()
+        # Worker pool managers share one filter, and with it the learned document frequencies.
+        self._lock = threading.Lock()
+
+    def check(self, description: str):
+        """Raises DescriptionRejected with the reason when the description should be skipped."""
+        with self._lock:
+            reason = self.rejection_reason(description)
+            if reason:
+                self.rejections[reason.split(":")[0]] += 1
+            else:
+                self.passed += 1
+        if reason:
+            raise DescriptionRejected(reason)
+
+    def rejection_reason(self, description: str) -> Optional[str]:
+        tokens = tokenize(description)
+        terms = Counter(tokens)
+        self.document_count += 1
+        self.document_frequency.update(terms.keys())
+
+        text = " " + " ".join(tokens) + " "
+        missing = [k for k in self.required_keywords if f" {' '.join(k)} " not in text]
+        if missing:
+            return f"missing keywords: {', '.join(' '.join(k) for k in missing)}"
+        excluded = [k for k in self.excluded_keywords if f" {' '.join(k)} " in text]
+        if excluded:
+            return f"excluded keywords: {', '.join(' '.join(k) for k in excluded)}"
+        if self.max_years_of_experience is not None:
+            years = extract_years_of_experience(description)
+            if years is not None and years > self.max_years_of_experience:
+                return f"years of experience: {years} required"
+        if self.languages:
+            unsupported = [language for language in extract_required_languages(description) if language not in self.languages]
+            if unsupported:
+                return f"languages: {', '.join(unsupported)} required"
+        if self.min_resume_similarity is not None and self.resume_terms:
+            similarity = self.resume_similarity(terms)
+            if similarity < self.min_resume_similarity:
+                return f"resume similarity: {similarity:.3f}"
+        return None
+
+    def _weights(self, terms: Counter) -> Dict[str, float]:
+        return {
+            term: (1 + math.log(count)) * (math.log((1 + self.document_count) / (1 + self.document_frequency[term])) + 1)
+            for term, count in terms.items()
+        }
+
+    def resume_similarity(self, terms: Counter) -> float:
+        description_weights = self._weights(terms)
+        resume_weights = self._weights(self.resume_terms)
+        dot = sum(weight * resume_weights.get(term, 0.0) for term, weight in description_weights.items())
+        norm = math.sqrt(sum(w * w for w in description_weights.values())) * math.sqrt(sum(w * w for w in resume_weights.values()))
+        return dot / norm if norm else 0.0
+
+    def report(self, llm_calls_per_job: float, seconds_per_job: float) -> Tuple[int, float, float]:
+        """Returns (rejected jobs, estimated LLM calls saved, estimated minutes saved)."""
+        rejected = sum(self.rejections.values())
+        return rejected, rejected * llm_calls_per_job, rejected * seconds_per_job / 60
@@ -0,0 +1,68 @@
+import json
+import threading
+from pathlib import Path
+from typing import Union
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from selenium.webdriver.common.by import By
+
+# Query parameters that identify a page; tracking and filter parameters are ignored.
+KEY_QUERY_PARAMETERS = ("keywords", "location", "start")
+
+
+def page_key(url: str) -> str:
+    parts = urlsplit(url)
+    path = parts.path if parts.path.endswith("/") else parts.path + "/"
+    query = sorted((k, v) for k, v in parse_qsl(parts.query) if k in KEY_QUERY_PARAMETERS)
+    return f"{path}?{urlencode(query)}" if query else path
+
+
+class FixtureRecorder:
+    """
+    Saves the pages the bot sees as replayable fixtures.
+
+    Search result pages and job pages are stored by ``page_key`` of their URL. Each
+    step of an Easy Apply modal is stored separately per job ID. The fixture server
+    in ``benchmarks/fake_linkedin.py`` serves them back.
+    """
+
+    def __init__(self, directory: Union[str, Path]):
+        self.directory = Path(directory)
+        self.index_path = self.directory / "index.json"
+        self._lock = threading.Lock()
+        if self.index_path.exists():
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                self.index = json.load(f)
+        else:
+            self.index = {"pages": {}, "modals": {}}
+
+    def record_page(self, driver):
+        key = page_key(driver.current_url)
+        with self._lock:
+            relative = self.index["pages"].get(key) or f"pages/{len(self.index['pages']):05d}.html"
+            self._write(relative, driver.page_source)
+            self.index["pages"][key] = relative
+            self._save_index()
+
+    def record_modal_step(self, driver, job_id: str, step: int):
+        modals = driver.find_elements(By.CLASS_NAME, 'artdeco-modal')
+        if not modals or not job_id:
+            return
+        relative = f"modals/{job_id}/{step:02d}.html"
+        with self._lock:
+            self._write(relative, modals[0].get_attribute('outerHTML'))
+            steps = self.index["modals"].setdefault(job_id, [])
+            if relative not in steps:
+                steps.append(relative)
+            self._save_index()
+
+    def _write(self, relative: str, content: str):
+        path = self.directory / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding='utf-8')
+
+    def _save_index(self):
+        temporary = self.index_path.with_suffix(".tmp")
+        with open(temporary, 'w', encoding='utf-8') as f:
+            json.dump(self.index, f, indent=2)
+        temporary.replace(self.index_path)
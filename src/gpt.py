@@ -1,7 +1,8 @@
+import asyncio
 import json
-import os
 import re
 import textwrap
+import time
 from datetime import datetime
 from typing import Dict, List, Optional, Union
 from pathlib import Path
@@ -10,23 +11,111 @@ from langchain_core.messages.ai import AIMessage
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.prompt_values import StringPromptValue
 from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.runnables import RunnableLambda
 from langchain_openai import ChatOpenAI
-from Levenshtein import distance
+from rapidfuzz import process
+from rapidfuzz.distance import Levenshtein
+from rapidfuzz.utils import default_process
 
+import src.metrics as metrics
+import src.tracing as tracing
 import src.strings as strings
+from src.llm_accounting import LLMAccounting, LLMBudgetExceeded, current_call_labels, llm_call_labels, price_of
+from src.llm_cache import LLMResponseCache, cache_key
+from src.log_writer import BackgroundJsonlWriter
 
 load_dotenv()
 
+NO_MATCHING_DATA = "No matching data found."
+
+# Fixed answers for the application form sections, used by answer_question_textual_wide_range
+# and included in the candidate profile sent with batched questions.
+CANDIDATE_PROFILE = {
+    "self_identification": {
+        "gender": "Female",
+        "pronouns": "She",
+        "veteran": "None",
+        "disability": "N/A",
+        "ethnicity": "Latin"
+    },
+    "legal_authorization": {
+        "eu_work_authorization": "No",
+        "us_work_authorization": "No",
+        "requires_us_visa": "No",
+        "requires_us_sponsorship": "No",
+        "requires_eu_visa": "No",
+        "legally_allowed_to_work_in_eu": "Yes",
+        "legally_allowed_to_work_in_us": "Yes",
+        "requires_eu_sponsorship": "No"
+    },
+    "work_preferences": {
+        "remote_work": "Yes",
+        "in_person_work": "No",
+        "open_to_relocation": "No",
+        "willing_to_complete_assessments": "Yes",
+        "willing_to_undergo_drug_tests": "Yes",
+        "willing_to_undergo_background_checks": "Yes"
+    },
+    "availability": {
+        "notice_period": "1 Week"
+    },
+    "salary_expectations": {
+        "salary_range_usd": "3000"
+    },
+    "education_details": [
+        {
+            "degree": "Bachelor in Computer Science",
+            "university": "University Of the People",
+            "gpa": "n/a",
+            "graduation_year": "2028",
+            "field_of_study": "Computer Science",
+            "exam": {"Engineering": "n/a"}
+        },
+        {
+            "degree": "Software Engineering",
+            "university": "IAE Colonia",
+            "gpa": "n/a",
+            "graduation_year": "2025",
+            "field_of_study": "Software Development",
+            "exam": {"Engineering": "n/a"}
+        },
+        {
+            "degree": "Analyst Programmer",
+            "university": "CEI Maldonado",
+            "gpa": "n/a",
+            "graduation_year": "2024",
+            "field_of_study": "Software Development",
+            "exam": {"Engineering": "100/100"}
+        },
+        {
+            "degree": "Quality Engineering",
+            "university": "Globant",
+            "gpa": "n/a",
+            "graduation_year": "2023",
+            "field_of_study": "Quality Engineering",
+            "exam": {"QE": "n/a"}
+        },
+        {
+            "degree": "English Language",
+            "university": "Dickens Institute",
+            "gpa": "n/a",
+            "graduation_year": "2017",
+            "field_of_study": "English Language",
+            "exam": {"Proficiency": "n/a"}
+        }
+    ]
+}
+
 
 class LLMLogger:
-    
+    calls_log_writer = BackgroundJsonlWriter(Path("data_folder/output") / "open_ai_calls.jsonl")
+
     def __init__(self, llm: ChatOpenAI):
         self.llm = llm
 
     @staticmethod
-    def log_request(prompts: Union[StringPromptValue, List[Dict]], parsed_reply: Dict[str, Dict]):
-        calls_log = os.path.join(Path("data_folder/output"), "open_ai_calls.json")
-        
+    def log_request(prompts: Union[StringPromptValue, List[Dict]], parsed_reply: Dict[str, Dict],
+                    total_cost: Optional[float] = None, latency: Optional[float] = None):
         prompts_dict = {}
 
         if isinstance(prompts, StringPromptValue):
@@ -53,11 +142,10 @@ class LLMLogger:
         # Extract model details from the response
         response_metadata = parsed_reply.get("response_metadata", {})
         model_name = response_metadata.get("model_name", "")
-        prompt_price_per_token = 0.00000015
-        completion_price_per_token = 0.0000006
 
-        # Calculate the total cost of the API call
-        total_cost = (input_tokens * prompt_price_per_token) + (output_tokens * completion_price_per_token)
+        # Calculate the total cost of the API call unless the caller already priced it
+        if total_cost is None:
+            total_cost = price_of(model_name, input_tokens, output_tokens)
 
         # Create a log entry with all relevant information
         log_entry = {
@@ -69,27 +157,61 @@ class LLMLogger:
             "input_tokens": input_tokens,
             "output_tokens": output_tokens,
             "total_cost": total_cost,
+            "latency": latency,
         }
 
-        # Write the log entry to the log file in JSON format
-        with open(calls_log, "a", encoding="utf-8") as f:
-            json_string = json.dumps(log_entry, ensure_ascii=False, indent=4)
-            f.write(json_string + "\n")
+        # Hand the entry to the background writer; it is written as one JSON line
+        LLMLogger.calls_log_writer.write(log_entry)
 
 
 
 class LoggerChatModel:
 
-    def __init__(self, llm: ChatOpenAI):
+    def __init__(self, llm: ChatOpenAI, accounting: Optional[LLMAccounting] = None):
         self.llm = llm
+        self.accounting = accounting
+        self.call_count = 0
 
     def __call__(self, messages: List[Dict[str, str]]) -> str:
         # Call the LLM with the provided messages and log the response.
-        reply = self.llm(messages)
-        parsed_reply = self.parse_llmresult(reply)
-        LLMLogger.log_request(prompts=messages, parsed_reply=parsed_reply)
+        while self.accounting and (wait := self.accounting.wait_seconds()):
+            time.sleep(wait)
+        self.call_count += 1
+        started = time.monotonic()
+        with metrics.stage("llm", template=current_call_labels().get("template", "other")):
+            reply = self.llm(messages)
+            self._account(messages, reply, time.monotonic() - started)
+        return reply
+
+    async def acall(self, messages: List[Dict[str, str]]) -> str:
+        # Same as __call__, but awaits the LLM so other requests can run meanwhile.
+        while self.accounting and (wait := self.accounting.wait_seconds()):
+            await asyncio.sleep(wait)
+        self.call_count += 1
+        started = time.monotonic()
+        with metrics.stage("llm", template=current_call_labels().get("template", "other")):
+            reply = await self.llm.ainvoke(messages)
+            self._account(messages, reply, time.monotonic() - started)
         return reply
 
+    def _account(self, messages, reply: AIMessage, latency: float):
+        parsed_reply = self.parse_llmresult(reply)
+        usage = parsed_reply["usage_metadata"]
+        template = current_call_labels().get("template", "other")
+        metrics.LLM_DURATION.observe(latency, template=template)
+        metrics.LLM_TOKENS.inc(usage["input_tokens"], template=template, direction="input")
+        metrics.LLM_TOKENS.inc(usage["output_tokens"], template=template, direction="output")
+        total_cost = None
+        if self.accounting:
+            model_name = parsed_reply["response_metadata"]["model_name"] or self.llm.model_name
+            total_cost = self.accounting.record(model_name, usage["input_tokens"], usage["output_tokens"], latency)
+        tracing.annotate(model=parsed_reply["response_metadata"]["model_name"], input_tokens=usage["input_tokens"],
+                         output_tokens=usage["output_tokens"], cost_usd=total_cost)
+        LLMLogger.log_request(prompts=messages, parsed_reply=parsed_reply, total_cost=total_cost, latency=latency)
+
+    def as_runnable(self) -> RunnableLambda:
+        return RunnableLambda(self.__call__, afunc=self.acall)
+
     def parse_llmresult(self, llmresult: AIMessage) -> Dict[str, Dict]:
         # Parse the LLM result into a structured format.
         content = llmresult.content
@@ -115,10 +237,26 @@ class LoggerChatModel:
 
 
 class GPTAnswerer:
-    def __init__(self, openai_api_key):
+    def __init__(self, openai_api_key, cache_path: Path = Path("data_folder/output") / "llm_cache.db",
+                 base_url: Optional[str] = None, accounting: Optional[LLMAccounting] = None):
+        # base_url points the client at any OpenAI-compatible server, e.g. benchmarks.fake_openai.
+        self.model_name = "gpt-4o-mini"
+        self.accounting = accounting if accounting is not None else LLMAccounting()
         self.llm_cheap = LoggerChatModel(
-            ChatOpenAI(model_name="gpt-4o-mini", openai_api_key=openai_api_key, temperature=0.4)
+            ChatOpenAI(model_name=self.model_name, openai_api_key=openai_api_key, temperature=0.4, base_url=base_url),
+            self.accounting,
+        )
+        self.llm_json = LoggerChatModel(
+            ChatOpenAI(model_name=self.model_name, openai_api_key=openai_api_key, temperature=0.4, base_url=base_url,
+                       model_kwargs={"response_format": {"type": "json_object"}}),
+            self.accounting,
         )
+        self.cache = LLMResponseCache(cache_path)
+        self.job_application_profile = None
+
+    @property
+    def llm_call_count(self) -> int:
+        return self.llm_cheap.call_count + self.llm_json.call_count
     
     @property
     def job_description(self):
@@ -126,10 +264,9 @@ class GPTAnswerer:
 
     @staticmethod
     def find_best_match(text: str, options: List[str]) -> str:
-        distances = [
-            (option, distance(text.lower(), option.lower())) for option in options
-        ]
-        best_option = min(distances, key=lambda x: x[1])[0]
+        best_option, _, _ = process.extractOne(
+            text, options, scorer=Levenshtein.distance, processor=default_process
+        )
         return best_option
 
     @staticmethod
@@ -142,10 +279,19 @@ class GPTAnswerer:
 
     def set_job(self, job):
         self.job = job
-        self.job.set_summarize_job_description(self.summarize_job_description(self.job.description))
+        if not self.job.summarize_job_description:
+            self.job.set_summarize_job_description(self.summarize_job_description(self.job.description))
 
     def set_job_application_profile(self, job_application_profile):
         self.job_application_profile = job_application_profile
+
+    def profile_context(self) -> str:
+        """The candidate profile for prompts: the plain text resume, if set, and the fixed form answers."""
+        sections = [json.dumps(CANDIDATE_PROFILE, indent=2)]
+        if self.job_application_profile:
+            sections.insert(0, str(self.job_application_profile))
+        return "\n\n".join(sections)
+
     def answer_question_numeric(self, question: str) -> str:
         # Define logic for answering numeric questions.
         # This could involve specific prompt templates or handling.
@@ -154,99 +300,122 @@ class GPTAnswerer:
         chain = self._create_chain(prompt)
         return chain.invoke({"question": question})
     def summarize_job_description(self, text: str) -> str:
-        strings.summarize_prompt_template = self._preprocess_template_string(
-            strings.summarize_prompt_template
-        )
+        key = self._summary_cache_key(text)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
         prompt = ChatPromptTemplate.from_template(strings.summarize_prompt_template)
         chain = prompt | self.llm_cheap | StrOutputParser()
-        output = chain.invoke({"text": text})
+        try:
+            with llm_call_labels(template="summarize"):
+                output = chain.invoke({"text": text})
+        except LLMBudgetExceeded:
+            return ""
+        self.cache.put(key, output, self.model_name)
+        return output
+
+    async def asummarize_job_description(self, text: str) -> str:
+        key = self._summary_cache_key(text)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        try:
+            with llm_call_labels(template="summarize"):
+                output = await self._create_async_chain(strings.summarize_prompt_template, self.llm_cheap).ainvoke({"text": text})
+        except LLMBudgetExceeded:
+            return ""
+        self.cache.put(key, output, self.model_name)
         return output
-            
+
+    def _summary_cache_key(self, text: str) -> str:
+        strings.summarize_prompt_template = self._preprocess_template_string(
+            strings.summarize_prompt_template
+        )
+        return cache_key(text, strings.summarize_prompt_template, self.model_name)
+
+    async def awrite_cover_letter(self, job_description: str) -> str:
+        strings.coverletter_template = self._preprocess_template_string(strings.coverletter_template)
+        chain = self._create_async_chain(strings.coverletter_template, self.llm_cheap)
+        try:
+            with llm_call_labels(template="cover_letter"):
+                return await chain.ainvoke({"job_description": job_description,
+                                            "resume": self.profile_context()})
+        except LLMBudgetExceeded:
+            return ""
+
     def _create_chain(self, template: str):
         prompt = ChatPromptTemplate.from_template(template)
         return prompt | self.llm_cheap | StrOutputParser()
+
+    @staticmethod
+    def _create_async_chain(template: str, llm: LoggerChatModel):
+        prompt = ChatPromptTemplate.from_template(template)
+        return prompt | llm.as_runnable() | StrOutputParser()
     
+    def answer_questions_batch(self, questions: List[Dict]) -> List[str]:
+        """
+        Answers every question of a form page with one JSON-mode request.
+
+        Each question is a dict with "question", "type" and "options" keys. Returns one
+        answer per question, in order; questions the model skipped get NO_MATCHING_DATA.
+        """
+        key, inputs = self._batch_questions_inputs(questions)
+        output = self.cache.get(key)
+        if output is None:
+            prompt = ChatPromptTemplate.from_template(strings.batch_questions_template)
+            chain = prompt | self.llm_json | StrOutputParser()
+            try:
+                with llm_call_labels(template="batch_questions"):
+                    output = chain.invoke(inputs)
+            except LLMBudgetExceeded:
+                return [NO_MATCHING_DATA] * len(questions)
+            self.cache.put(key, output, self.model_name)
+        return self._parse_batch_answers(output, len(questions))
+
+    async def aanswer_questions_batch(self, questions: List[Dict]) -> List[str]:
+        key, inputs = self._batch_questions_inputs(questions)
+        output = self.cache.get(key)
+        if output is None:
+            try:
+                with llm_call_labels(template="batch_questions"):
+                    output = await self._create_async_chain(strings.batch_questions_template, self.llm_json).ainvoke(inputs)
+            except LLMBudgetExceeded:
+                return [NO_MATCHING_DATA] * len(questions)
+            self.cache.put(key, output, self.model_name)
+        return self._parse_batch_answers(output, len(questions))
+
+    def _batch_questions_inputs(self, questions: List[Dict]):
+        strings.batch_questions_template = self._preprocess_template_string(strings.batch_questions_template)
+        payload = json.dumps([
+            {"id": index, "question": q["question"], "type": q["type"], "options": q.get("options") or []}
+            for index, q in enumerate(questions)
+        ], ensure_ascii=False, indent=2)
+        resume = self.profile_context()
+        job_description = getattr(getattr(self, "job", None), "summarize_job_description", "") or ""
+        key = cache_key(f"{resume}\n{job_description}\n{payload}", strings.batch_questions_template, self.model_name)
+        inputs = {"resume": resume, "job_description": job_description, "questions": payload,
+                  "no_matching_data": NO_MATCHING_DATA}
+        return key, inputs
+
+    @staticmethod
+    def _parse_batch_answers(output: str, count: int) -> List[str]:
+        answers = [NO_MATCHING_DATA] * count
+        try:
+            entries = json.loads(output).get("answers", [])
+        except (ValueError, AttributeError):
+            return answers
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            index, answer = entry.get("id"), entry.get("answer")
+            if isinstance(index, int) and 0 <= index < count and answer not in (None, ""):
+                answers[index] = str(answer).strip()
+        return answers
+
     def answer_question_textual_wide_range(self, question: str) -> str:
-        # Define chains with hardcoded data for each section
-        chains = {
-            "self_identification": {
-                "gender": "Female",
-                "pronouns": "She",
-                "veteran": "None",
-                "disability": "N/A",
-                "ethnicity": "Latin"
-            },
-            "legal_authorization": {
-                "eu_work_authorization": "No",
-                "us_work_authorization": "No",
-                "requires_us_visa": "No",
-                "requires_us_sponsorship": "No",
-                "requires_eu_visa": "No",
-                "legally_allowed_to_work_in_eu": "Yes",
-                "legally_allowed_to_work_in_us": "Yes",
-                "requires_eu_sponsorship": "No"
-            },
-            "work_preferences": {
-                "remote_work": "Yes",
-                "in_person_work": "No",
-                "open_to_relocation": "No",
-                "willing_to_complete_assessments": "Yes",
-                "willing_to_undergo_drug_tests": "Yes",
-                "willing_to_undergo_background_checks": "Yes"
-            },
-            "availability": {
-                "notice_period": "1 Week"
-            },
-            "salary_expectations": {
-                "salary_range_usd": "3000"
-            },
-            "education_details": [
-                {
-                    "degree": "Bachelor in Computer Science",
-                    "university": "University Of the People",
-                    "gpa": "n/a",
-                    "graduation_year": "2028",
-                    "field_of_study": "Computer Science",
-                    "exam": {"Engineering": "n/a"}
-                },
-                {
-                    "degree": "Software Engineering",
-                    "university": "IAE Colonia",
-                    "gpa": "n/a",
-                    "graduation_year": "2025",
-                    "field_of_study": "Software Development",
-                    "exam": {"Engineering": "n/a"}
-                },
-                {
-                    "degree": "Analyst Programmer",
-                    "university": "CEI Maldonado",
-                    "gpa": "n/a",
-                    "graduation_year": "2024",
-                    "field_of_study": "Software Development",
-                    "exam": {"Engineering": "100/100"}
-                },
-                {
-                    "degree": "Quality Engineering",
-                    "university": "Globant",
-                    "gpa": "n/a",
-                    "graduation_year": "2023",
-                    "field_of_study": "Quality Engineering",
-                    "exam": {"QE": "n/a"}
-                },
-                {
-                    "degree": "English Language",
-                    "university": "Dickens Institute",
-                    "gpa": "n/a",
-                    "graduation_year": "2017",
-                    "field_of_study": "English Language",
-                    "exam": {"Proficiency": "n/a"}
-                }
-            ]
-        }
-        
         # Check if the question matches any predefined categories
         matched_chain = None
-        for section, content in chains.items():
+        for section, content in CANDIDATE_PROFILE.items():
             if re.search(r'\b' + re.escape(section) + r'\b', question, re.IGNORECASE):
                 matched_chain = content
                 break
@@ -254,4 +423,4 @@ class GPTAnswerer:
         if matched_chain:
             return json.dumps(matched_chain, indent=2)
         else:
-            return "No matching data found."
+            return NO_MATCHING_DATA
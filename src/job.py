@@ -1,5 +1,17 @@
+import re
 from dataclasses import dataclass
 
+JOB_ID_PATTERN = re.compile(r"(?:/jobs/view/|currentJobId=)(\d+)")
+
+
+def parse_job_id(link: str) -> str:
+    """
+    Extracts the numeric LinkedIn job ID from a job link, or returns an empty string.
+    """
+    match = JOB_ID_PATTERN.search(link or "")
+    return match.group(1) if match else ""
+
+
 @dataclass
 class Job:
     title: str
@@ -11,6 +23,11 @@ class Job:
     summarize_job_description: str = ""
     pdf_path: str = ""
     recruiter_link: str = ""
+    cover_letter: str = ""
+
+    @property
+    def job_id(self):
+        return parse_job_id(self.link)
 
     def set_summarize_job_description(self, summarize_job_description):
         self.summarize_job_description = summarize_job_description
@@ -21,6 +38,9 @@ class Job:
     def set_recruiter_link(self, recruiter_link):
         self.recruiter_link = recruiter_link
 
+    def set_cover_letter(self, cover_letter):
+        self.cover_letter = cover_letter
+
     def formatted_job_information(self):
         """
         Formats the job information as a markdown string.
@@ -0,0 +1,235 @@
+import logging
+import queue
+import threading
+import traceback
+from itertools import product
+from typing import Any, Dict, List, Tuple
+
+import src.metrics as metrics
+import src.tracing as tracing
+import src.utils as utils
+from src.description_filter import DescriptionRejected
+from src.linkedIn_job_manager import FILTERED_STATUS, NoMoreJobs
+from src.llm_accounting import llm_call_labels
+from src.pacing import PacingBudgetExhausted
+
+# Marks the end of the stream on a stage's output queue.
+_DONE = object()
+# How long run() waits for a stage thread that is stuck, e.g. sleeping on the pacer.
+_JOIN_TIMEOUT = 10
+
+
+class _SearchProgress:
+    """
+    Moves the search cursor past a page only once every job harvested from it has been
+    handled by the applier, so jobs still queued when the process dies are harvested
+    again on resume. A search is completed (or abandoned, after a page kept failing) once
+    it is exhausted and all its pages are done.
+    """
+
+    def __init__(self, cursor):
+        self.cursor = cursor
+        self._pages: Dict[Tuple[str, str], Dict[int, int]] = {}
+        self._origins: Dict[int, Tuple[Tuple[str, str], int]] = {}
+        # Exhausted searches, mapped to whether they were abandoned rather than crawled to the end.
+        self._exhausted: Dict[Tuple[str, str], bool] = {}
+        self._lock = threading.Lock()
+
+    def page_harvested(self, search: Tuple[str, str], page: int, jobs: List):
+        with self._lock:
+            self._pages.setdefault(search, {})[page] = len(jobs)
+            for job in jobs:
+                self._origins[id(job)] = (search, page)
+            self._advance(search)
+
+    def search_exhausted(self, search: Tuple[str, str], abandoned: bool = False):
+        with self._lock:
+            self._exhausted[search] = abandoned
+            self._advance(search)
+
+    def job_handled(self, job):
+        with self._lock:
+            origin = self._origins.pop(id(job), None)
+            if origin is None:
+                return
+            search, page = origin
+            self._pages[search][page] -= 1
+            self._advance(search)
+
+    def _advance(self, search: Tuple[str, str]):
+        pages = self._pages.get(search, {})
+        # Pages are harvested in order, so the first entry is the lowest outstanding page.
+        while pages and pages[next(iter(pages))] == 0:
+            page = next(iter(pages))
+            del pages[page]
+            self.cursor.page_done(*search, page)
+        if not pages and search in self._exhausted:
+            abandoned = self._exhausted.pop(search)
+            self._pages.pop(search, None)
+            if abandoned:
+                self.cursor.abandon(*search)
+            else:
+                self.cursor.complete(*search)
+
+
+class JobPipeline:
+    """
+    Runs harvesting and applying as concurrent stages connected by bounded queues.
+
+    - harvester: pages through every search in its own browser (resuming where the
+      search cursor left off), drops seen, blacklisted and non-Easy-Apply jobs, and
+      reads each description from the search page's detail pane;
+    - summarizers: summarize descriptions with the LLM (through its cache);
+    - applier: applies to each prepared job in the main browser.
+
+    The bounded queues give backpressure, so the number of jobs handled per hour
+    is set by the slowest stage instead of the sum of all stages.
+    """
+
+    def __init__(self, harvest_component: Any, apply_component: Any, gpt_answerer: Any, pipeline_config: dict):
+        pipeline_config = pipeline_config or {}
+        self.harvest_component = harvest_component
+        self.apply_component = apply_component
+        self.gpt_answerer = gpt_answerer
+        self.summarizer_count = int(pipeline_config.get('summarizerThreads', 2))
+        queue_size = int(pipeline_config.get('queueSize', 25))
+        self.harvested: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self.ready: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self.stop_event = threading.Event()
+        self.producers: List[threading.Thread] = []
+        metrics.QUEUE_DEPTH.set_function(self.harvested.qsize, queue="harvested")
+        metrics.QUEUE_DEPTH.set_function(self.ready.qsize, queue="ready")
+
+    def run(self):
+        self.apply_component.prepare_applying()
+        harvester = threading.Thread(target=self._harvest, name="pipeline-harvester", daemon=True)
+        summarizers = [
+            threading.Thread(target=self._summarize, name=f"pipeline-summarizer-{index}", daemon=True)
+            for index in range(self.summarizer_count)
+        ]
+        self.producers = [harvester, *summarizers]
+        self.progress = _SearchProgress(self.harvest_component.search_cursor)
+        for thread in self.producers:
+            thread.start()
+        try:
+            self._apply()
+        finally:
+            self.stop_event.set()
+        for thread in self.producers:
+            # Daemon threads: one blocked in a long pacing wait is left behind rather than waited on.
+            thread.join(timeout=_JOIN_TIMEOUT)
+            if thread.is_alive():
+                logging.warning(f"{thread.name} did not stop within {_JOIN_TIMEOUT}s, leaving it behind.")
+
+    def _put(self, stage_queue: "queue.Queue", item) -> bool:
+        while not self.stop_event.is_set():
+            try:
+                stage_queue.put(item, timeout=1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _harvest(self):
+        manager = self.harvest_component
+        cursor = manager.search_cursor
+        searches = cursor.plan(product(manager.positions, manager.locations))
+        try:
+            for position, location in searches:
+                utils.printyellow(f"Harvesting {position} in {location}.")
+                job_page_number, _ = cursor.position(position, location)
+                cursor.start(position, location)
+                time_window = manager.search_window(position, location)
+                while not self.stop_event.is_set():
+                    manager.next_job_page(position, "&location=" + location, job_page_number, time_window)
+                    try:
+                        job_list = manager.harvest_page()
+                        if manager.is_exhausted_page(job_list):
+                            raise NoMoreJobs("Only already seen jobs on this page")
+                    except NoMoreJobs:
+                        self.progress.search_exhausted((position, location))
+                        break
+                    except Exception:
+                        logging.error(f"Harvesting {position} in {location} stopped at page {job_page_number}:\n"
+                                      f"{traceback.format_exc()}")
+                        if cursor.page_failed(position, location, job_page_number):
+                            logging.error(f"Page {job_page_number} of {position} in {location} keeps failing, "
+                                          f"giving the search up.")
+                            self.progress.search_exhausted((position, location), abandoned=True)
+                        break
+                    queued = []
+                    for job in job_list:
+                        if job.job_id in manager.seen_jobs or not manager.is_applicable(job):
+                            continue
+                        if manager.is_blacklisted(job.title, job.company):
+                            manager.write_to_file(job, "skipped")
+                            continue
+                        job.set_job_description(manager.read_description_from_pane(job))
+                        if job.description and manager.description_filter:
+                            try:
+                                manager.description_filter.check(job.description)
+                            except DescriptionRejected as e:
+                                utils.printyellow(f"Filtered out {job.title} at {job.company} ({e}), skipping...")
+                                manager.write_to_file(job, FILTERED_STATUS)
+                                continue
+                        queued.append(job)
+                    self.progress.page_harvested((position, location), job_page_number, queued)
+                    for job in queued:
+                        if not self._put(self.harvested, job):
+                            return
+                    job_page_number += 1
+        except PacingBudgetExhausted as e:
+            utils.printyellow(f"Harvester stopping: {e}")
+        except Exception:
+            logging.error(f"Harvester stopped:\n{traceback.format_exc()}")
+        finally:
+            for _ in range(self.summarizer_count):
+                self._put(self.harvested, _DONE)
+
+    def _summarize(self):
+        while not self.stop_event.is_set():
+            try:
+                job = self.harvested.get(timeout=1)
+            except queue.Empty:
+                continue
+            if job is _DONE:
+                self._put(self.ready, _DONE)
+                return
+            if job.description:
+                try:
+                    with llm_call_labels(job=job.job_id or job.link), tracing.span("summary", job_id=job.job_id):
+                        if self.apply_component.async_answerer:
+                            self.apply_component.async_answerer.prepare_job_sync(job)
+                        else:
+                            job.set_summarize_job_description(self.gpt_answerer.summarize_job_description(job.description))
+                except Exception:
+                    logging.error(f"Summary failed for {job.link}:\n{traceback.format_exc()}")
+            if not self._put(self.ready, job):
+                return
+
+    def _apply(self):
+        manager = self.apply_component
+        finished_summarizers = 0
+        while finished_summarizers < self.summarizer_count:
+            try:
+                job = self.ready.get(timeout=1)
+            except queue.Empty:
+                if not any(thread.is_alive() for thread in self.producers):
+                    logging.error("Pipeline stages stopped without finishing the queue, applier stopping.")
+                    break
+                continue
+            if job is _DONE:
+                finished_summarizers += 1
+                continue
+            if job.job_id not in manager.seen_jobs:
+                utils.printyellow(f"Applying to {job.title} at {job.company} ({self.ready.qsize()} ready, {self.harvested.qsize()} harvested).")
+                try:
+                    manager.apply_to_job(job)
+                except PacingBudgetExhausted as e:
+                    utils.printyellow(f"Applier stopping: {e}")
+                    return
+            self.progress.job_handled(job)
+        utils.printyellow(f"Pacing stats: {manager.pacer.stats()}")
+        utils.printyellow(f"LLM accounting: {self.gpt_answerer.accounting.stats()}")
+        manager.print_description_filter_report()
+        manager.print_description_filter_report(self.harvest_component.description_filter)
@@ -1,15 +1,29 @@
+import json
+import logging
+import os
 import time
+from pathlib import Path
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+import src.metrics as metrics
+import src.utils as utils
+
+# Shared by every browser profile, so worker and harvester browsers reuse one session.
+DEFAULT_COOKIES_PATH = Path(os.path.dirname(utils.chromeProfilePath)) / "linkedin_cookies.json"
+FEED_URL = 'https://www.linkedin.com/feed/'
+LOGGED_OUT_URL_PARTS = ('/login', '/authwall', '/uas/login', '/signup', '/checkpoint/lg/')
+
 class LinkedInAuthenticator:
-    
-    def __init__(self, driver=None):
+
+    def __init__(self, driver=None, cookies_path=DEFAULT_COOKIES_PATH):
         self.driver = driver
         self.email = ""
         self.password = ""
+        self.cookies_path = Path(cookies_path)
+        self.login_latency = None
 
     def set_secrets(self, email, password):
         self.email = email
@@ -17,10 +31,21 @@ class LinkedInAuthenticator:
 
     def start(self):
         print("Starting Chrome browser to log in to LinkedIn.")
-        self.driver.get('https://www.linkedin.com')
-        self.wait_for_page_load()
-        if not self.is_logged_in():
-            self.handle_login()
+        started_at = time.perf_counter()
+        with metrics.stage("login"):
+            self.driver.get(FEED_URL)
+            if self.is_logged_in(navigate=False):
+                method = "existing session"
+            elif self.restore_cookies() and self.is_logged_in():
+                method = "saved cookies"
+            else:
+                self.handle_login()
+                method = "credentials"
+            if self.is_logged_in(navigate=False):
+                self.save_cookies()
+        self.login_latency = time.perf_counter() - started_at
+        metrics.LOGIN_DURATION.observe(self.login_latency, method=method)
+        logging.info(f"LinkedIn login ready via {method} in {self.login_latency:.1f}s.")
 
     def handle_login(self):
         print("Navigating to the LinkedIn login page...")
@@ -30,8 +55,7 @@ class LinkedInAuthenticator:
             self.submit_login_form()
         except NoSuchElementException:
             print("Could not log in to LinkedIn. Please check your credentials.")
-        time.sleep(35) #TODO fix better
-        self.handle_security_check()
+        self.wait_for_login_result()
 
     def enter_credentials(self):
         try:
@@ -51,11 +75,24 @@ class LinkedInAuthenticator:
         except NoSuchElementException:
             print("Login button not found. Please verify the page structure.")
 
+    def wait_for_login_result(self, timeout=30):
+        # Resolves as soon as LinkedIn lands on the feed, asks for a security check or shows a form error.
+        try:
+            WebDriverWait(self.driver, timeout).until(EC.any_of(
+                EC.url_contains('/feed'),
+                EC.url_contains('/checkpoint/challenge'),
+                EC.visibility_of_element_located((By.CSS_SELECTOR, '#error-for-username, #error-for-password, .alert-content')),
+            ))
+        except TimeoutException:
+            print("No response to the login form. Please try again later.")
+            return
+        if '/checkpoint/challenge' in self.driver.current_url:
+            self.handle_security_check()
+        elif '/feed' not in self.driver.current_url:
+            print("Could not log in to LinkedIn. Please check your credentials.")
+
     def handle_security_check(self):
         try:
-            WebDriverWait(self.driver, 10).until(
-                EC.url_contains('https://www.linkedin.com/checkpoint/challengesV2/')
-            )
             print("Security checkpoint detected. Please complete the challenge.")
             WebDriverWait(self.driver, 300).until(
                 EC.url_contains('https://www.linkedin.com/feed/')
@@ -64,20 +101,53 @@ class LinkedInAuthenticator:
         except TimeoutException:
             print("Security check not completed. Please try again later.")
 
-    def is_logged_in(self):
-        self.driver.get('https://www.linkedin.com/feed')
+    def is_logged_in(self, navigate=True):
+        if navigate:
+            self.driver.get(FEED_URL)
+        # Without the session cookie there is nothing to wait for.
+        if self.driver.get_cookie('li_at') is None:
+            return False
         try:
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CLASS_NAME, 'share-box-feed-entry__trigger'))
-            )
-            buttons = self.driver.find_elements(By.CLASS_NAME, 'share-box-feed-entry__trigger')
-            if any(button.text.strip() == 'Start a post' for button in buttons):
-                print("User is already logged in.")
-                return True
+            WebDriverWait(self.driver, 10).until(EC.any_of(
+                EC.presence_of_element_located((By.CLASS_NAME, 'share-box-feed-entry__trigger')),
+                lambda d: any(part in d.current_url for part in LOGGED_OUT_URL_PARTS),
+            ))
         except TimeoutException:
-            pass
+            return False
+        if any(part in self.driver.current_url for part in LOGGED_OUT_URL_PARTS):
+            return False
+        buttons = self.driver.find_elements(By.CLASS_NAME, 'share-box-feed-entry__trigger')
+        if any(button.text.strip() == 'Start a post' for button in buttons):
+            print("User is already logged in.")
+            return True
         return False
 
+    def save_cookies(self):
+        try:
+            self.cookies_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cookies_path, 'w', encoding='utf-8') as f:
+                json.dump(self.driver.get_cookies(), f)
+        except OSError as e:
+            print(f"Could not save LinkedIn cookies: {e}")
+
+    def restore_cookies(self):
+        try:
+            with open(self.cookies_path, 'r', encoding='utf-8') as f:
+                cookies = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return False
+        now = time.time()
+        restored = False
+        for cookie in cookies:
+            if cookie.get('expiry') is not None and cookie['expiry'] < now:
+                continue
+            try:
+                self.driver.add_cookie(cookie)
+                restored = True
+            except Exception:
+                continue
+        return restored
+
     def wait_for_page_load(self, timeout=10):
         try:
             WebDriverWait(self.driver, timeout).until(
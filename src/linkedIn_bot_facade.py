@@ -1,5 +1,7 @@
 import logging
+from pathlib import Path
 from typing import Any
+from src.job_pipeline import JobPipeline
 class LinkedInBotState:
     def __init__(self):
         self.reset()
@@ -45,6 +47,13 @@ class LinkedInBotFacade:
         logging.info("Job application profile set.")
 
 
+    def load_job_application_profile(self, resume_path: Path):
+        """Sets the plain text resume as the job application profile, if the file exists."""
+        if resume_path.exists():
+            self.set_job_application_profile(resume_path.read_text(encoding='utf-8'))
+        else:
+            logging.warning(f"No plain text resume at {resume_path}; LLM answers will only use the fixed form answers.")
+
     def set_secrets(self, email, password):
         self._validate_non_empty(email, "Email")
         self._validate_non_empty(password, "Password")
@@ -101,6 +110,21 @@ class LinkedInBotFacade:
         except Exception as e:
             logging.error(f"An error occurred during application: {e}")
 
+    def start_pipeline(self, harvest_login_component, harvest_component):
+        try:
+            self.state.validate_state(['logged_in', 'job_application_profile_set', 'gpt_answerer_set', 'parameters_set'])
+            harvest_login_component.set_secrets(self.email, self.password)
+            harvest_login_component.start()
+            harvest_component.use_shared_state(self.apply_component.ledger, self.apply_component.seen_jobs, None,
+                                               self.apply_component.pacer, self.apply_component.search_cursor)
+            harvest_component.set_parameters(self.parameters)
+            pipeline = JobPipeline(harvest_component, self.apply_component, self.apply_component.gpt_answerer,
+                                   self.parameters.get('pipeline', {}))
+            logging.info("Harvest/apply pipeline started.")
+            pipeline.run()
+        except Exception as e:
+            logging.error(f"An error occurred during the pipeline run: {e}")
+
     def _validate_non_empty(self, value, name):
         if not value:
             raise ValueError(f"{name} cannot be empty.")
@@ -1,11 +1,11 @@
 import base64
-import json
 import os
 import random
 import re
 import tempfile
 import time
 import traceback
+from dataclasses import dataclass, field
 from datetime import date
 from typing import List, Optional, Any, Tuple
 from reportlab.lib.pagesizes import letter
@@ -17,46 +17,81 @@ from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import Select, WebDriverWait
 from selenium.webdriver import ActionChains
+import src.metrics as metrics
+import src.tracing as tracing
 import src.utils as utils
+from src.answer_store import AnswerStore
+from src.description_filter import DescriptionRejected
+from src.gpt import NO_MATCHING_DATA
+from src.option_resolver import OptionResolver
+from src.pacing import APPLICATION, PacingBudgetExhausted
+
+# Easy Apply document upload inputs have ids like "jobs-document-upload-file-input-upload-cover-letter".
+COVER_LETTER_INPUT_SELECTOR = 'input[type="file"][id*="cover-letter"]'
+
+@dataclass
+class PendingQuestion:
+    """A form question that has no stored answer yet, waiting for the page's LLM requests."""
+    field_type: str
+    question_text: str
+    element: Any
+    options: List[str] = field(default_factory=list)
+
 
 class LinkedInEasyApplier:
-    def __init__(self, driver: Any, resume_dir: Optional[str], set_old_answers: List[Tuple[str, str, str]], gpt_answerer: Any):
+    def __init__(self, driver: Any, resume_dir: Optional[str], set_old_answers: List[Tuple[str, str, str]], gpt_answerer: Any,
+                 fixture_recorder: Any = None, description_filter: Any = None, batch_answers: bool = False,
+                 async_answerer: Any = None, browser_profile: Any = None, answer_store: Optional[AnswerStore] = None,
+                 pacer: Any = None):
         self.driver = driver
+        self.browser_profile = browser_profile
+        self.batch_answers = batch_answers
+        self.async_answerer = async_answerer
+        self.pacer = pacer
+        self.fixture_recorder = fixture_recorder
+        self.description_filter = description_filter
         self.resume_path = resume_dir if resume_dir and os.path.exists(resume_dir) else None
         self.set_old_answers = set_old_answers
         self.gpt_answerer = gpt_answerer
-        self.all_data = self._load_questions_from_json()
-
-    def _load_questions_from_json(self) -> List[dict]:
-        output_file = 'answers.json'
-        try:
-            with open(output_file, 'r') as f:
-                data = json.load(f)
-                if not isinstance(data, list):
-                    raise ValueError("JSON file format is incorrect. Expected a list of questions.")
-        except (FileNotFoundError, json.JSONDecodeError, ValueError):
-            data = []
-        except Exception:
-            tb_str = traceback.format_exc()
-            raise Exception(f"Error loading questions data from JSON file: \nTraceback:\n{tb_str}")
-        return data
+        self.answer_store = answer_store if answer_store is not None else AnswerStore()
+        self.option_resolver = OptionResolver()
 
+    @metrics.timed("job_apply")
     def job_apply(self, job: Any):
-        self.driver.get(job.link)
-        time.sleep(random.uniform(3, 5))
+        with tracing.span("page_load", url=job.link):
+            self.driver.get(job.link)
+            time.sleep(random.uniform(3, 5))
+        if self.browser_profile:
+            self.browser_profile.record_page_load(self.driver)
         try:
             easy_apply_button = self._find_easy_apply_button()
-            job.set_job_description(self._get_job_description())
-            job.set_recruiter_link(self._get_job_recruiter())
+            if not job.description:
+                with tracing.span("description"):
+                    job.set_job_description(self._get_job_description())
+                if self.description_filter:
+                    self.description_filter.check(job.description)
+            # Only jobs that pass the description filter use up application budget.
+            if self.pacer:
+                self.pacer.acquire(APPLICATION)
+            with tracing.span("recruiter"):
+                job.set_recruiter_link(self._get_job_recruiter())
+            if self.fixture_recorder:
+                self.fixture_recorder.record_page(self.driver)
             actions = ActionChains(self.driver)
             actions.move_to_element(easy_apply_button).click().perform()
-            self.gpt_answerer.set_job(job)
+            with tracing.span("summary", prepared=bool(job.summarize_job_description)):
+                if self.async_answerer and not job.summarize_job_description:
+                    self.async_answerer.prepare_job_sync(job)
+                self.gpt_answerer.set_job(job)
             self._fill_application_form(job)
+        except (DescriptionRejected, PacingBudgetExhausted):
+            raise
         except Exception:
             tb_str = traceback.format_exc()
             self._discard_application()
             raise Exception(f"Failed to apply to job! Original exception: \nTraceback:\n{tb_str}")
 
+    @metrics.timed("find_easy_apply_button")
     def _find_easy_apply_button(self) -> WebElement:
         for attempt in range(2):
             self._scroll_page()
@@ -110,11 +145,18 @@ class LinkedInEasyApplier:
         utils.scroll_slow(self.driver, scrollable_element, step=300, reverse=True)
 
     def _fill_application_form(self, job):
+        step = 0
         while True:
-            self.fill_up(job)
-            if self._next_or_submit():
+            with tracing.span("form_page", step=step):
+                if self.fixture_recorder:
+                    self.fixture_recorder.record_modal_step(self.driver, job.job_id, step)
+                self.fill_up(job)
+                submitted = self._next_or_submit()
+            if submitted:
                 break
+            step += 1
 
+    @metrics.timed("next_or_submit")
     def _next_or_submit(self) -> bool:
         next_button = self.driver.find_element(By.CLASS_NAME, "artdeco-button--primary")
         button_text = next_button.text.lower()
@@ -152,17 +194,31 @@ class LinkedInEasyApplier:
         except Exception:
             pass
 
+    @metrics.timed("fill_up")
     def fill_up(self, job) -> None:
         easy_apply_content = self.driver.find_element(By.CLASS_NAME, 'jobs-easy-apply-content')
+        self._upload_cover_letter(easy_apply_content, job)
         pb4_elements = easy_apply_content.find_elements(By.CLASS_NAME, 'pb4')
+        if self.batch_answers or self.async_answerer:
+            # Every pass covers the whole page, so one pass is one LLM round trip per page.
+            if pb4_elements:
+                self._fill_additional_questions()
+            return
         for element in pb4_elements:
             self._process_form_element(element, job)
 
     def _process_form_element(self, element: WebElement, job: Any) -> None:
         self._fill_additional_questions()
 
-    def _create_and_upload_cover_letter(self, element: WebElement) -> None:
-        cover_letter = self.gpt_answerer.answer_question_textual_wide_range("Write a cover letter")
+    def _upload_cover_letter(self, easy_apply_content: WebElement, job: Any) -> None:
+        """Uploads the job's prepared cover letter where the form asks for one; without one the field is left alone."""
+        if not job.cover_letter:
+            return
+        for file_input in easy_apply_content.find_elements(By.CSS_SELECTOR, COVER_LETTER_INPUT_SELECTOR):
+            with tracing.span("cover_letter_upload"):
+                self._create_and_upload_cover_letter(file_input, job.cover_letter)
+
+    def _create_and_upload_cover_letter(self, element: WebElement, cover_letter: str) -> None:
         with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_pdf_file:
             letter_path = temp_pdf_file.name
             c = canvas.Canvas(letter_path, pagesize=letter)
@@ -176,8 +232,77 @@ class LinkedInEasyApplier:
 
     def _fill_additional_questions(self) -> None:
         form_sections = self.driver.find_elements(By.CLASS_NAME, 'jobs-easy-apply-form-section__grouping')
-        for section in form_sections:
-            self._process_form_section(section)
+        if not (self.batch_answers or self.async_answerer):
+            for index, section in enumerate(form_sections):
+                with tracing.span("form_section", index=index):
+                    self._process_form_section(section)
+            return
+
+        pending = []
+        for index, section in enumerate(form_sections):
+            with tracing.span("form_section", index=index):
+                question = self._collect_form_question(section)
+                tracing.annotate(pending=question is not None)
+            if question:
+                pending.append(question)
+        if not pending:
+            return
+        questions = [{"question": q.question_text, "type": q.field_type, "options": q.options} for q in pending]
+        if self.batch_answers:
+            answers = self.gpt_answerer.answer_questions_batch(questions)
+        else:
+            # One concurrent request per independent question of the page.
+            answers = self.async_answerer.answer_questions_sync(questions)
+        for question, answer in zip(pending, answers):
+            self._fill_pending_question(question, answer)
+
+    def _collect_form_question(self, section: WebElement) -> Optional[PendingQuestion]:
+        """
+        Fills the section right away when no LLM is needed (terms of service, dates, stored
+        answers) and otherwise returns it as a PendingQuestion. Field types are detected in
+        the same order as _process_form_section.
+        """
+        if self._handle_terms_of_service(section):
+            return None
+        question_text = section.text.lower()
+        form_element = section.find_elements(By.CLASS_NAME, 'jobs-easy-apply-form-element')
+        radios = form_element[0].find_elements(By.CLASS_NAME, 'fb-text-selectable__option') if form_element else []
+        if radios:
+            options = [radio.text.lower() for radio in radios]
+            existing_answer = self.answer_store.lookup(question_text, 'radio')
+            if existing_answer and self._select_radio(radios, options, question_text, existing_answer):
+                return None
+            return PendingQuestion('radio', question_text, radios, options)
+        if form_element:
+            existing_answer = self.answer_store.lookup(question_text, 'textbox')
+            if existing_answer:
+                form_element[0].send_keys(existing_answer)
+                return None
+            return PendingQuestion('textbox', question_text, form_element[0])
+        if self._find_and_handle_date_question(section):
+            return None
+        dropdown = section.find_elements(By.CLASS_NAME, 'artdeco-dropdown')
+        if dropdown:
+            select = Select(dropdown[0])
+            options = [opt.text for opt in select.options]
+            existing_answer = self.answer_store.lookup(question_text, 'dropdown')
+            if existing_answer and self._select_dropdown_option(select, options, question_text, existing_answer):
+                return None
+            return PendingQuestion('dropdown', question_text, select, options)
+        return None
+
+    def _fill_pending_question(self, question: PendingQuestion, answer: str) -> None:
+        if question.field_type == 'radio':
+            filled = self._select_radio(question.element, question.options, question.question_text, answer)
+        elif question.field_type == 'dropdown':
+            filled = self._select_dropdown_option(question.element, question.options, question.question_text, answer)
+        else:
+            if answer == NO_MATCHING_DATA:
+                return
+            question.element.send_keys(answer)
+            filled = True
+        if filled:
+            self._remember_answer(question.question_text, answer, question.field_type)
 
     def _process_form_section(self, section: WebElement) -> None:
         if self._handle_terms_of_service(section):
@@ -205,14 +330,13 @@ class LinkedInEasyApplier:
             question_text = section.text.lower()
             options = [radio.text.lower() for radio in radios]
 
-            existing_answer = next((item for item in self.all_data
-                                    if self._sanitize_text(question_text) in item['question'] and item['type'] == 'radio'), None)
-            if existing_answer:
-                self._select_radio(radios, existing_answer['answer'])
+            existing_answer = self.answer_store.lookup(question_text, 'radio')
+            if existing_answer and self._select_radio(radios, options, question_text, existing_answer):
                 return True
 
             answer = self.gpt_answerer.answer_question_textual_wide_range(question_text)
-            self._select_radio(radios, answer)
+            if self._select_radio(radios, options, question_text, answer):
+                self._remember_answer(question_text, answer, 'radio')
             return True
         return False
 
@@ -220,14 +344,14 @@ class LinkedInEasyApplier:
         textbox = section.find_elements(By.CLASS_NAME, 'jobs-easy-apply-form-element')
         if textbox:
             question_text = section.text.lower()
-            existing_answer = next((item for item in self.all_data
-                                    if self._sanitize_text(question_text) in item['question'] and item['type'] == 'textbox'), None)
+            existing_answer = self.answer_store.lookup(question_text, 'textbox')
             if existing_answer:
-                textbox[0].send_keys(existing_answer['answer'])
+                textbox[0].send_keys(existing_answer)
                 return True
 
             answer = self.gpt_answerer.answer_question_textual_wide_range(question_text)
             textbox[0].send_keys(answer)
+            self._remember_answer(question_text, answer, 'textbox')
             return True
         return False
 
@@ -243,24 +367,35 @@ class LinkedInEasyApplier:
         dropdown = section.find_elements(By.CLASS_NAME, 'artdeco-dropdown')
         if dropdown:
             select = Select(dropdown[0])
-            options = [opt.text.lower() for opt in select.options]
+            options = [opt.text for opt in select.options]
             question_text = section.text.lower()
-            existing_answer = next((item for item in self.all_data
-                                    if self._sanitize_text(question_text) in item['question'] and item['type'] == 'dropdown'), None)
-            if existing_answer:
-                select.select_by_visible_text(existing_answer['answer'])
+            existing_answer = self.answer_store.lookup(question_text, 'dropdown')
+            if existing_answer and self._select_dropdown_option(select, options, question_text, existing_answer):
                 return True
 
             answer = self.gpt_answerer.answer_question_textual_wide_range(question_text)
-            select.select_by_visible_text(answer)
+            if self._select_dropdown_option(select, options, question_text, answer):
+                self._remember_answer(question_text, answer, 'dropdown')
             return True
         return False
 
-    def _select_radio(self, radios: List[WebElement], answer: str) -> None:
-        for radio in radios:
-            if answer.lower() in radio.text.lower():
-                radio.click()
-                return
+    def _remember_answer(self, question_text: str, answer: str, field_type: str) -> None:
+        if answer and answer != NO_MATCHING_DATA:
+            self.answer_store.add(self._sanitize_text(question_text), answer, field_type)
+
+    def _select_radio(self, radios: List[WebElement], options: List[str], question_text: str, answer: str) -> bool:
+        index = self.option_resolver.resolve(question_text, answer, options)
+        if index is None:
+            return False
+        radios[index].click()
+        return True
+
+    def _select_dropdown_option(self, select: Select, options: List[str], question_text: str, answer: str) -> bool:
+        index = self.option_resolver.resolve(question_text, answer, options)
+        if index is None:
+            return False
+        select.select_by_index(index)
+        return True
 
     def _sanitize_text(self, text: str) -> str:
         return re.sub(r'\s+', ' ', text).strip()
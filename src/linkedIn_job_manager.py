@@ -1,15 +1,28 @@
 import os
-import random
 import time
 import traceback
 from itertools import product
 from pathlib import Path
 from selenium.common.exceptions import NoSuchElementException
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+import src.metrics as metrics
+import src.tracing as tracing
 import src.utils as utils
+from src.application_ledger import ApplicationLedger
+from src.async_answerer import AsyncAnswerer
+from src.blacklist_matcher import BlacklistMatcher
+from src.browser_profile import BrowserProfile
+from src.description_filter import DescriptionFilter, DescriptionRejected
+from src.fixture_recorder import FixtureRecorder
 from src.job import Job
 from src.linkedIn_easy_applier import LinkedInEasyApplier
-import json
+from src.llm_accounting import llm_call_labels
+from src.network_job_extractor import NetworkJobExtractor
+from src.pacing import PAGE_LOAD, PacingBudgetExhausted, PacingScheduler
+from src.search_cursor import SearchCursor
+from src.seen_jobs import SeenJobsIndex
 
 
 class EnvironmentKeys:
@@ -25,106 +38,321 @@ class EnvironmentKeys:
     def _read_env_key_bool(key: str) -> bool:
         return os.getenv(key) == "True"
 
+# Reads every job tile on the results page in a single round trip. Fields mirror
+# extract_job_information_from_tile; a missing apply-method badge means "Applied".
+EXTRACT_JOB_TILES_SCRIPT = """
+var container = document.querySelector('.scaffold-layout__list-container');
+if (!container) { return []; }
+var text = function (tile, cls) {
+    var el = tile.querySelector('.' + cls);
+    return el ? el.innerText.trim() : null;
+};
+return Array.prototype.map.call(container.querySelectorAll('.jobs-search-results__list-item'), function (tile) {
+    var titleElement = tile.querySelector('.job-card-list__title');
+    var link = titleElement && titleElement.href ? titleElement.href.split('?')[0] : '';
+    var applyMethod = text(tile, 'job-card-container__apply-method');
+    return {
+        job_id: tile.getAttribute('data-occludable-job-id') || '',
+        title: titleElement ? titleElement.innerText.trim() : '',
+        company: link ? (text(tile, 'job-card-container__primary-description') || '') : '',
+        location: text(tile, 'job-card-container__metadata-item') || '',
+        link: link,
+        apply_method: applyMethod === null ? 'Applied' : applyMethod
+    };
+});
+"""
+
+class NoMoreJobs(Exception):
+    """Raised when a search has no results left, i.e. it has been paged through to the end."""
+
+
+# Tiles exist upfront as placeholders; only these have been filled in with the job's content.
+RENDERED_TILE_SELECTOR = '.jobs-search-results__list-item .job-card-list__title'
+
+# Outcomes that mark a job as done for good; failed jobs stay eligible for another attempt.
+SEEN_STATUSES = ["success", "skipped"]
+# Jobs rejected by the description filter; not seen, so they are checked again once the filter changes.
+FILTERED_STATUS = "filtered"
+
+
+def print_description_filter_report(description_filter, applied_jobs, applied_seconds, applied_llm_calls):
+    """
+    Prints how many jobs the description filter skipped and estimates the LLM calls
+    and minutes saved from the averages of the applications made in this run.
+    """
+    if description_filter is None:
+        return
+    llm_calls_per_job = applied_llm_calls / applied_jobs if applied_jobs else 1
+    seconds_per_job = applied_seconds / applied_jobs if applied_jobs else 0
+    rejected, llm_calls, minutes = description_filter.report(llm_calls_per_job, seconds_per_job)
+    utils.printyellow(f"Description filter skipped {rejected} of {rejected + description_filter.passed} jobs "
+                      f"{dict(description_filter.rejections)}, saving about {llm_calls:.0f} LLM calls and {minutes:.1f} minutes.")
+
 class LinkedInJobManager:
     def __init__(self, driver):
         self.driver = driver
         self.set_old_answers = set()
         self.easy_applier_component = None
+        self.ledger = None
+        self.seen_jobs = None
+        self.job_claims = None
+        self.pacer = None
+        self.search_cursor = None
+        self.async_answerer = None
+        self.answer_store = None
+        self.description_filter = None
+        self.applied_jobs = 0
+        self.applied_seconds = 0.0
+        self.applied_llm_calls = 0
 
     def set_parameters(self, parameters):
         self.company_blacklist = parameters.get('companyBlacklist', []) or []
         self.title_blacklist = parameters.get('titleBlacklist', []) or []
+        self.blacklist_matcher = BlacklistMatcher(self.title_blacklist, self.company_blacklist)
         self.positions = parameters.get('positions', [])
         self.locations = parameters.get('locations', [])
+        self.base_url = parameters.get('linkedinBaseUrl', 'https://www.linkedin.com').rstrip('/')
         self.base_search_url = self.get_base_search_url(parameters)
-        self.seen_jobs = []
+        incremental_search = parameters.get('incrementalSearch', {}) or {}
+        self.incremental_search = incremental_search.get('enabled', False)
+        self.incremental_overlap = float(incremental_search.get('overlapMinutes', 60)) * 60
+        self.max_posting_age = self.get_max_posting_age(parameters)
+        record_directory = parameters.get('recordFixtures')
+        self.fixture_recorder = FixtureRecorder(record_directory) if record_directory else None
+        self.scroll_mode = parameters.get('scrollMode', 'event')
+        self.batch_answers = parameters.get('batchAnswers', False)
+        self.async_llm_config = parameters.get('asyncLLM', {}) or {}
+        self.scroll_pacing = utils.ScrollPacing.from_config(parameters.get('scrollPacing', {}))
+        self.browser_profile = BrowserProfile.from_config(parameters.get('browserProfile', {}))
+        if parameters.get('jobExtraction', 'dom') == 'network':
+            self.network_extractor = NetworkJobExtractor(self.driver, self.base_url)
+        else:
+            self.network_extractor = None
         resume_path = parameters.get('uploads', {}).get('resume', None)
         if resume_path is not None and Path(resume_path).exists():
             self.resume_path = Path(resume_path)
         else:
             self.resume_path = None
         self.output_file_directory = Path(parameters['outputFileDirectory'])
+        if self.ledger is None:
+            self.ledger = ApplicationLedger(self.output_file_directory / "applications.db")
+            imported = self.ledger.import_legacy_json(self.output_file_directory)
+            if imported:
+                utils.printyellow(f"Imported {imported} records from the old JSON result files into the application ledger.")
+        if self.seen_jobs is None:
+            self.seen_jobs = SeenJobsIndex(
+                self.output_file_directory / "seen_jobs.txt",
+                seed=lambda: self.ledger.job_ids(SEEN_STATUSES),
+            )
+        if self.pacer is None:
+            self.pacer = PacingScheduler.from_config(parameters.get('pacing', {}),
+                                                     self.output_file_directory / "pacing_state.json", self.ledger)
+        if self.search_cursor is None:
+            self.search_cursor = SearchCursor.from_config(self.output_file_directory / "search_cursor.db",
+                                                          self.base_search_url, parameters.get('searchSweep', {}))
         self.env_config = EnvironmentKeys()
+        if self.env_config.disable_description_filter:
+            self.description_filter = None
+        elif self.description_filter is None:
+            self.description_filter = DescriptionFilter(parameters.get('descriptionFilter', {}),
+                                                        self.output_file_directory / "plain_text_resume.yaml")
     
+    def use_shared_state(self, ledger, seen_jobs, job_claims, pacer=None, search_cursor=None,
+                         answer_store=None, description_filter=None):
+        """
+        Share the results ledger, seen-jobs index, in-flight job claims, pacing budget,
+        search sweep cursor, answer store and description filter with other managers
+        (one per browser worker). Must be called before set_parameters.
+        """
+        self.ledger = ledger
+        self.seen_jobs = seen_jobs
+        self.job_claims = job_claims
+        self.pacer = pacer
+        self.search_cursor = search_cursor
+        self.answer_store = answer_store
+        self.description_filter = description_filter
+
     def set_gpt_answerer(self, gpt_answerer):
         self.gpt_answerer = gpt_answerer
 
     def start_applying(self):
-        self.easy_applier_component = LinkedInEasyApplier(self.driver, self.resume_path, self.set_old_answers, self.gpt_answerer)
-        searches = list(product(self.positions, self.locations))
-        random.shuffle(searches)
-        page_sleep = 0
-        minimum_time = 60 * 5
-        minimum_page_time = time.time() + minimum_time
-
-        for position, location in searches:
-            location_url = "&location=" + location
-            job_page_number = -1
+        self.prepare_applying()
+        searches = self.search_cursor.plan(product(self.positions, self.locations))
+        utils.printyellow(f"Search sweep: {self.search_cursor.stats(product(self.positions, self.locations))}, "
+                          f"{len(searches)} searches to run.")
+
+        try:
+            for position, location in searches:
+                self.apply_search(position, location)
+        except PacingBudgetExhausted as e:
+            utils.printyellow(f"Stopping: {e}")
+        utils.printyellow(f"Pacing stats: {self.pacer.stats()}")
+        utils.printyellow(f"LLM cache stats: {self.gpt_answerer.cache.stats()}")
+        utils.printyellow(f"LLM accounting: {self.gpt_answerer.accounting.stats()}")
+        utils.printyellow(f"Page loads: {self.browser_profile.stats()}")
+        if self.network_extractor:
+            utils.printyellow(f"Network job extraction: {self.network_extractor.stats()}")
+        self.print_description_filter_report()
+
+    def prepare_applying(self):
+        if self.async_llm_config.get('enabled', False) and self.async_answerer is None:
+            self.async_answerer = AsyncAnswerer.from_config(self.gpt_answerer, self.async_llm_config)
+        self.easy_applier_component = LinkedInEasyApplier(self.driver, self.resume_path, self.set_old_answers, self.gpt_answerer,
+                                                          fixture_recorder=self.fixture_recorder,
+                                                          description_filter=self.description_filter,
+                                                          batch_answers=self.batch_answers,
+                                                          async_answerer=self.async_answerer,
+                                                          browser_profile=self.browser_profile,
+                                                          answer_store=self.answer_store,
+                                                          pacer=self.pacer)
+
+    def apply_search(self, position, location):
+        location_url = "&location=" + location
+        job_page_number, resume_after = self.search_cursor.position(position, location)
+        if job_page_number or resume_after:
+            utils.printyellow(f"Resuming the search for {position} in {location} at page {job_page_number}.")
+        else:
             utils.printyellow(f"Starting the search for {position} in {location}.")
+        self.search_cursor.start(position, location)
+        time_window = self.search_window(position, location)
+
+        try:
+            while True:
+                utils.printyellow(f"Going to job page {job_page_number}")
+                self.next_job_page(position, location_url, job_page_number, time_window)
+                utils.printyellow("Starting the application process for this page...")
+                self.apply_jobs((position, location), job_page_number, resume_after)
+                utils.printyellow("Applying to jobs on this page has been completed!")
+                self.search_cursor.page_done(position, location, job_page_number)
+                job_page_number += 1
+                resume_after = None
+        except NoMoreJobs:
+            self.search_cursor.complete(position, location)
+            utils.printyellow(f"Finished the search for {position} in {location}.")
+        except PacingBudgetExhausted:
+            raise
+        except Exception:
+            utils.printred(f"The search for {position} in {location} stopped at page {job_page_number}:\n{traceback.format_exc()}")
+            # The cursor still points at this page, so the next run picks the search up here
+            # unless the page keeps failing.
+            if self.search_cursor.page_failed(position, location, job_page_number):
+                self.search_cursor.abandon(position, location)
+                utils.printred(f"Page {job_page_number} of {position} in {location} keeps failing, giving the search up.")
+
+    def apply_jobs(self, search=None, job_page_number=0, resume_after=None):
+        """
+        Processes every job on the current results page. ``resume_after`` skips the jobs up
+        to and including that job ID, which were handled before the run was interrupted.
+        """
+        job_list = self.harvest_page()
+        if self.is_exhausted_page(job_list):
+            raise NoMoreJobs("Only already seen jobs on this page")
+        job_ids = [job.job_id for job in job_list]
+        if resume_after in job_ids:
+            job_list = job_list[job_ids.index(resume_after) + 1:]
+        for job in job_list:
+            self._handle_page_job(job)
+            if search is not None:
+                self.search_cursor.job_done(*search, job_page_number, job.job_id)
+
+    def _handle_page_job(self, job):
+        if self.job_claims is not None and not self.job_claims.claim(job.job_id):
+            utils.printyellow(f"{job.title} at {job.company} is being handled by another worker, skipping...")
+            return
+        try:
+            if job.job_id in self.seen_jobs:
+                utils.printyellow(f"Already processed {job.title} at {job.company}, skipping...")
+                return
+            self.process_job(job)
+        finally:
+            if self.job_claims is not None:
+                self.job_claims.release(job.job_id)
 
-            try:
-                while True:
-                    page_sleep += 1
-                    job_page_number += 1
-                    utils.printyellow(f"Going to job page {job_page_number}")
-                    self.next_job_page(position, location_url, job_page_number)
-                    time.sleep(random.uniform(1.5, 3.5))
-                    utils.printyellow("Starting the application process for this page...")
-                    self.apply_jobs()
-                    utils.printyellow("Applying to jobs on this page has been completed!")
-
-                    time_left = minimum_page_time - time.time()
-                    if time_left > 0:
-                        utils.printyellow(f"Sleeping for {time_left} seconds.")
-                        time.sleep(time_left)
-                        minimum_page_time = time.time() + minimum_time
-                    if page_sleep % 5 == 0:
-                        sleep_time = random.randint(5, 34)
-                        utils.printyellow(f"Sleeping for {sleep_time / 60} minutes.")
-                        time.sleep(sleep_time)
-                        page_sleep += 1
-            except Exception:
-                traceback.format_exc()
-                pass
-            time_left = minimum_page_time - time.time()
-            if time_left > 0:
-                utils.printyellow(f"Sleeping for {time_left} seconds.")
-                time.sleep(time_left)
-                minimum_page_time = time.time() + minimum_time
-            if page_sleep % 5 == 0:
-                sleep_time = random.randint(50, 90)
-                utils.printyellow(f"Sleeping for {sleep_time / 60} minutes.")
-                time.sleep(sleep_time)
-                page_sleep += 1
-
-    def apply_jobs(self):
+    def harvest_page(self):
         try:
             no_jobs_element = self.driver.find_element(By.CLASS_NAME, 'jobs-search-two-pane__no-results-banner--expand')
             if 'No matching jobs found' in no_jobs_element.text or 'unfortunately, things aren' in self.driver.page_source.lower():
-                raise Exception("No more jobs on this page")
+                raise NoMoreJobs("No more jobs on this page")
         except NoSuchElementException:
             pass
         
-        job_results = self.driver.find_element(By.CLASS_NAME, "jobs-search-results-list")
-        utils.scroll_slow(self.driver, job_results)
-        utils.scroll_slow(self.driver, job_results, step=300, reverse=True)
-        job_list_elements = self.driver.find_elements(By.CLASS_NAME, 'scaffold-layout__list-container')[0].find_elements(By.CLASS_NAME, 'jobs-search-results__list-item')
-        if not job_list_elements:
+        job_results = WebDriverWait(self.driver, 10).until(
+            EC.presence_of_element_located((By.CLASS_NAME, "jobs-search-results-list"))
+        )
+        if self.network_extractor:
+            # The job cards arrived as JSON with the page, so nothing needs scrolling into view.
+            job_list = self.network_extractor.extract(self.page_start)
+            if job_list:
+                return job_list
+            utils.printyellow("No job cards captured from the network, reading them from the page instead.")
+        if self.scroll_mode == 'slow':
+            utils.scroll_slow(self.driver, job_results)
+            utils.scroll_slow(self.driver, job_results, step=300, reverse=True)
+        else:
+            utils.load_list_items(self.driver, job_results, RENDERED_TILE_SELECTOR, self.scroll_pacing)
+        if self.fixture_recorder:
+            self.fixture_recorder.record_page(self.driver)
+        job_list = self.extract_jobs_from_page()
+        if not job_list:
             raise Exception("No job class elements found on page")
-        job_list = [Job(*self.extract_job_information_from_tile(job_element)) for job_element in job_list_elements] 
-        for job in job_list:
-            if self.is_blacklisted(job.title, job.company, job.link):
-                utils.printyellow(f"Blacklisted {job.title} at {job.company}, skipping...")
-                self.write_to_file(job, "skipped")
-                continue
-            try:
-                if job.apply_method not in {"Continue", "Applied", "Apply"}:
-                    self.easy_applier_component.job_apply(job)
-                    self.write_to_file(job, "success")
-            except Exception as e:
-                utils.printred(traceback.format_exc())
-                self.write_to_file(job, "failed")
-                continue
+        return job_list
+
+    def is_applicable(self, job):
+        return job.apply_method not in {"Continue", "Applied", "Apply"}
+
+    def process_job(self, job):
+        if self.is_blacklisted(job.title, job.company):
+            utils.printyellow(f"Blacklisted {job.title} at {job.company}, skipping...")
+            self.write_to_file(job, "skipped")
+            return
+        if self.is_applicable(job):
+            self.apply_to_job(job)
+
+    def apply_to_job(self, job):
+        with tracing.span("job", job_id=job.job_id, title=job.title, company=job.company):
+            self._apply_to_job(job)
+
+    def _apply_to_job(self, job):
+        started = time.monotonic()
+        llm_calls = self.gpt_answerer.llm_call_count
+        try:
+            with llm_call_labels(job=job.job_id or job.link):
+                self.easy_applier_component.job_apply(job)
+            self.write_to_file(job, "success")
+            self.applied_jobs += 1
+            self.applied_seconds += time.monotonic() - started
+            self.applied_llm_calls += self.gpt_answerer.llm_call_count - llm_calls
+        except DescriptionRejected as e:
+            utils.printyellow(f"Filtered out {job.title} at {job.company} ({e}), skipping...")
+            self.write_to_file(job, FILTERED_STATUS)
+        except PacingBudgetExhausted:
+            raise
+        except Exception as e:
+            utils.printred(traceback.format_exc())
+            self.write_to_file(job, "failed")
+
+    def print_description_filter_report(self, description_filter=None):
+        """Prints the description filter report for the applications made by this manager."""
+        if description_filter is None:
+            description_filter = self.description_filter
+        print_description_filter_report(description_filter, self.applied_jobs, self.applied_seconds,
+                                        self.applied_llm_calls)
+
+    def read_description_from_pane(self, job):
+        """
+        Opens the job in the search page's detail pane and returns its description,
+        or an empty string if the pane does not show it in time.
+        """
+        try:
+            tile_link = self.driver.find_element(By.CSS_SELECTOR, f'.jobs-search-results__list-item [href*="/jobs/view/{job.job_id}"]')
+            self.driver.execute_script("arguments[0].click();", tile_link)
+            WebDriverWait(self.driver, 10).until(lambda d: f"currentJobId={job.job_id}" in d.current_url)
+            description = WebDriverWait(self.driver, 10).until(
+                EC.visibility_of_element_located((By.CLASS_NAME, 'jobs-description-content__text'))
+            )
+            return description.get_attribute('innerText').strip()
+        except Exception:
+            return ""
         
     def write_to_file(self, job, file_name):
         pdf_path = Path(job.pdf_path).resolve()
@@ -137,22 +365,14 @@ class LinkedInJobManager:
             "job_location": job.location,
             "pdf_path": pdf_path
         }
-        file_path = self.output_file_directory / f"{file_name}.json"
-        if not file_path.exists():
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump([data], f, indent=4)
-        else:
-            with open(file_path, 'r+', encoding='utf-8') as f:
-                try:
-                    existing_data = json.load(f)
-                except json.JSONDecodeError:
-                    existing_data = []
-                existing_data.append(data)
-                f.seek(0)
-                json.dump(existing_data, f, indent=4)
-                f.truncate()
-
-    def get_base_search_url(self, parameters):
+        self.ledger.record(job.job_id or job.link or f"{job.company}|{job.title}", file_name, data)
+        metrics.APPLICATION_OUTCOMES.inc(status=file_name)
+        tracing.annotate(outcome=file_name)
+        if file_name in SEEN_STATUSES:
+            self.seen_jobs.add(job.job_id)
+
+    @staticmethod
+    def get_base_search_url(parameters):
         url_parts = []
         if parameters['remote']:
             url_parts.append("f_CF=f_WRA")
@@ -163,20 +383,80 @@ class LinkedInJobManager:
         job_types = [key[0].upper() for key, value in parameters.get('jobTypes', {}).items() if value]
         if job_types:
             url_parts.append(f"f_JT={','.join(job_types)}")
-        date_mapping = {
-            "all time": "",
-            "month": "&f_TPR=r2592000",
-            "week": "&f_TPR=r604800",
-            "24 hours": "&f_TPR=r86400"
-        }
-        date_param = next((v for k, v in date_mapping.items() if parameters.get('date', {}).get(k)), "")
         url_parts.append("f_LF=f_AL")  # Easy Apply
+        if parameters.get('incrementalSearch', {}).get('enabled', False):
+            # Newest first, so paging can stop at the first page of already seen jobs. The
+            # f_TPR window is added per search by search_window().
+            url_parts.append("sortBy=DD")
+            return f"?{'&'.join(url_parts)}"
+        max_age = LinkedInJobManager.get_max_posting_age(parameters)
+        date_param = f"&f_TPR=r{max_age}" if max_age else ""
         base_url = "&".join(url_parts)
         return f"?{base_url}{date_param}"
+
+    @staticmethod
+    def get_max_posting_age(parameters):
+        """Returns the ``date`` filter as a posting age in seconds, or None for all time."""
+        date_mapping = {
+            "all time": None,
+            "month": 2592000,
+            "week": 604800,
+            "24 hours": 86400
+        }
+        return next((v for k, v in date_mapping.items() if parameters.get('date', {}).get(k)), None)
+
+    def search_window(self, position, location):
+        """
+        Returns the f_TPR parameter for a search in incremental mode: the narrowest
+        posting age covering the time since its last complete crawl, plus the overlap.
+        """
+        if not self.incremental_search:
+            return ""
+        last_crawl_at = self.search_cursor.last_crawl_at(position, location)
+        if last_crawl_at is None:
+            max_age = self.max_posting_age
+        else:
+            max_age = int(time.time() - last_crawl_at + self.incremental_overlap)
+            if self.max_posting_age:
+                max_age = min(max_age, self.max_posting_age)
+        return f"&f_TPR=r{max_age}" if max_age else ""
+
+    def is_exhausted_page(self, job_list):
+        """In incremental mode, a page of nothing but already seen jobs ends the search."""
+        return self.incremental_search and bool(job_list) and all(job.job_id in self.seen_jobs for job in job_list)
     
-    def next_job_page(self, position, location, job_page):
-        self.driver.get(f"https://www.linkedin.com/jobs/search/{self.base_search_url}&keywords={position}{location}&start={job_page * 25}")
+    def next_job_page(self, position, location, job_page, time_window=""):
+        self.pacer.acquire(PAGE_LOAD)
+        if self.network_extractor:
+            self.network_extractor.reset()
+            self.page_start = job_page * 25
+        with metrics.stage("next_job_page"):
+            self.driver.get(f"{self.base_url}/jobs/search/{self.base_search_url}{time_window}"
+                            f"&keywords={position}{location}&start={job_page * 25}")
+        metrics.sample_browser_memory(self.driver)
+        self.browser_profile.record_page_load(self.driver)
     
+    @metrics.timed("extract_job_tiles")
+    def extract_jobs_from_page(self):
+        tiles = self.driver.execute_script(EXTRACT_JOB_TILES_SCRIPT) or []
+        # Placeholder tiles that never rendered have no title; they are not "Applied" jobs.
+        placeholders = sum(1 for tile in tiles if not tile['title'])
+        if placeholders:
+            utils.printyellow(f"{placeholders} job tiles were not rendered and are left out.")
+        job_list = []
+        for tile in tiles:
+            if not tile['title']:
+                continue
+            link = tile['link']
+            if not link and tile['job_id']:
+                link = f"{self.base_url}/jobs/view/{tile['job_id']}/"
+            job_list.append(Job(tile['title'], tile['company'], tile['location'], link, tile['apply_method']))
+        return job_list
+
+    def extract_jobs_from_page_elements(self):
+        job_list_elements = self.driver.find_elements(By.CLASS_NAME, 'scaffold-layout__list-container')[0].find_elements(By.CLASS_NAME, 'jobs-search-results__list-item')
+        return [Job(*self.extract_job_information_from_tile(job_element)) for job_element in job_list_elements]
+
     def extract_job_information_from_tile(self, job_tile):
         job_title, company, job_location, apply_method, link = "", "", "", "", ""
         try:
@@ -196,9 +476,5 @@ class LinkedInJobManager:
 
         return job_title, company, job_location, link, apply_method
     
-    def is_blacklisted(self, job_title, company, link):
-        job_title_words = job_title.lower().split(' ')
-        title_blacklisted = any(word in job_title_words for word in self.title_blacklist)
-        company_blacklisted = company.strip().lower() in (word.strip().lower() for word in self.company_blacklist)
-        link_seen = link in self.seen_jobs
-        return title_blacklisted or company_blacklisted or link_seen
+    def is_blacklisted(self, job_title, company):
+        return self.blacklist_matcher.matches(job_title, company)
@@ -0,0 +1,268 @@
+import contextvars
+import gzip
+import json
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from datetime import date, datetime
+from pathlib import Path
+from typing import Deque, Dict, Iterator, List, Optional, Tuple, Union
+
+import src.metrics as metrics
+import src.utils as utils
+from src.pacing import PacingBudgetExhausted
+
+# USD per million tokens. Model names are matched by longest prefix, so dated
+# snapshots such as "gpt-4o-mini-2024-07-18" use their base model's price.
+DEFAULT_PRICES = {
+    "gpt-4o-mini": {"input": 0.15, "output": 0.60},
+    "gpt-4o": {"input": 2.50, "output": 10.00},
+}
+CACHE_ONLY = "cacheOnly"
+PAUSE = "pause"
+
+_call_labels: contextvars.ContextVar = contextvars.ContextVar("llm_call_labels", default={})
+
+
+class LLMBudgetExceeded(Exception):
+    """Raised instead of an LLM call while the spend budget is exhausted in cache-only mode."""
+
+
+@contextmanager
+def llm_call_labels(**labels):
+    """Attributes the LLM calls made inside the block to e.g. ``job=`` and ``template=``."""
+    token = _call_labels.set({**_call_labels.get(), **labels})
+    try:
+        yield
+    finally:
+        _call_labels.reset(token)
+
+
+def current_call_labels() -> Dict[str, str]:
+    return _call_labels.get()
+
+
+def price_of(model_name: str, input_tokens: int, output_tokens: int, prices: Dict[str, Dict[str, float]] = None) -> float:
+    prices = prices or DEFAULT_PRICES
+    matches = [name for name in prices if (model_name or "").startswith(name)]
+    if not matches:
+        return 0.0
+    price = prices[max(matches, key=len)]
+    return (input_tokens * price.get("input", 0.0) + output_tokens * price.get("output", 0.0)) / 1_000_000
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+class _LatencyHistogram:
+    """Latency counts in fixed buckets; percentiles are interpolated within a bucket, in constant memory."""
+
+    def __init__(self, bounds: Tuple[float, ...] = metrics.DEFAULT_BUCKETS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.total = 0
+
+    def add(self, latency: float):
+        self.counts[bisect_left(self.bounds, latency)] += 1
+        self.total += 1
+
+    def percentile(self, fraction: float) -> float:
+        rank = fraction * self.total
+        below = 0
+        for index, count in enumerate(self.counts):
+            if count and below + count >= rank:
+                lower = self.bounds[index - 1] if index else 0.0
+                # Calls slower than the last bound are reported as the last bound.
+                upper = self.bounds[index] if index < len(self.bounds) else lower
+                return lower + (upper - lower) * (rank - below) / count
+            below += count
+        return 0.0
+
+
+class _Totals:
+    def __init__(self):
+        self.calls = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.cost = 0.0
+        self.latencies = _LatencyHistogram()
+
+    def add(self, input_tokens: int, output_tokens: int, cost: float, latency: float):
+        self.calls += 1
+        self.input_tokens += input_tokens
+        self.output_tokens += output_tokens
+        self.cost += cost
+        self.latencies.add(latency)
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "calls": self.calls,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "cost_usd": round(self.cost, 6),
+            "latency_p50": round(self.latencies.percentile(0.5), 3),
+            "latency_p90": round(self.latencies.percentile(0.9), 3),
+            "latency_p99": round(self.latencies.percentile(0.99), 3),
+        }
+
+
+class LLMAccounting:
+    """
+    Tokens, latency and cost of every LLM call, per run, per prompt template and per job.
+
+    Spend is checked against optional ``hourlyBudget`` (a sliding hour) and
+    ``dailyBudget`` (the calendar day) limits in USD before each call. Once one is
+    reached, ``cacheOnly`` mode raises LLMBudgetExceeded so GPTAnswerer falls back to
+    cached answers, and ``pause`` mode waits for the hourly window to free up and
+    stops the run through PacingBudgetExhausted when the daily budget is spent. Spend
+    from earlier runs is seeded from the JSONL call log, so a restart keeps both limits.
+
+    Per-job totals are kept for the ``max_jobs`` most expensive jobs only.
+    """
+
+    def __init__(self, prices: Optional[Dict[str, Dict[str, float]]] = None, hourly_budget: Optional[float] = None,
+                 daily_budget: Optional[float] = None, on_exhausted: str = CACHE_ONLY, max_jobs: int = 1000):
+        self.prices = {**DEFAULT_PRICES, **(prices or {})}
+        self.hourly_budget = hourly_budget
+        self.daily_budget = daily_budget
+        self.on_exhausted = on_exhausted
+        self.run = _Totals()
+        self.by_template: Dict[str, _Totals] = defaultdict(_Totals)
+        self.by_job: Dict[str, _Totals] = {}
+        self.max_jobs = max_jobs
+        self.job_count = 0
+        self.blocked_calls = 0
+        self.paused_seconds = 0.0
+        self._hour: Deque[Tuple[float, float]] = deque()
+        self._day = date.today()
+        self._day_spend = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Optional[dict], call_log_path: Union[str, Path, None] = None) -> "LLMAccounting":
+        config = config or {}
+        accounting = cls(
+            prices=config.get('prices'),
+            hourly_budget=config.get('hourlyBudget'),
+            daily_budget=config.get('dailyBudget'),
+            on_exhausted=config.get('onExhausted', CACHE_ONLY),
+        )
+        if call_log_path:
+            accounting.seed_from_call_log(call_log_path)
+        return accounting
+
+    def seed_from_call_log(self, log_path: Union[str, Path]):
+        """Adds today's and the last hour's spend recorded in the call log by earlier runs."""
+        today = date.today().isoformat()
+        wall_now, now = time.time(), time.monotonic()
+        hour, day_spend = [], 0.0
+        for path in _call_log_files(Path(log_path)):
+            reached_older_entries = False
+            opener = gzip.open if path.suffix == ".gz" else open
+            try:
+                with opener(path, "rt", encoding="utf-8") as f:
+                    for line in f:
+                        # Cheap check first: the log is large and only today's lines matter.
+                        if f'"time":"{today}' not in line:
+                            reached_older_entries = True
+                            continue
+                        try:
+                            entry = json.loads(line)
+                            age = wall_now - datetime.strptime(entry["time"], "%Y-%m-%d %H:%M:%S").timestamp()
+                            cost = float(entry.get("total_cost") or 0.0)
+                        except (ValueError, KeyError, TypeError):
+                            continue
+                        day_spend += cost
+                        if age < 3600:
+                            hour.append((now - max(0.0, age), cost))
+            except OSError:
+                continue
+            if reached_older_entries:
+                break
+        with self._lock:
+            self._day_spend += day_spend
+            self._hour = deque(sorted([*hour, *self._hour]))
+
+    def price(self, model_name: str, input_tokens: int, output_tokens: int) -> float:
+        return price_of(model_name, input_tokens, output_tokens, self.prices)
+
+    def record(self, model_name: str, input_tokens: int, output_tokens: int, latency: float) -> float:
+        """Records a finished call under the current labels and returns its cost."""
+        cost = self.price(model_name, input_tokens, output_tokens)
+        labels = current_call_labels()
+        now = time.monotonic()
+        with self._lock:
+            self._roll_day()
+            self._hour.append((now, cost))
+            self._day_spend += cost
+            self.run.add(input_tokens, output_tokens, cost, latency)
+            self.by_template[labels.get("template", "other")].add(input_tokens, output_tokens, cost, latency)
+            if labels.get("job"):
+                self._job_totals(labels["job"]).add(input_tokens, output_tokens, cost, latency)
+        return cost
+
+    def _job_totals(self, job: str) -> _Totals:
+        totals = self.by_job.get(job)
+        if totals is None:
+            if len(self.by_job) >= self.max_jobs:
+                del self.by_job[min(self.by_job, key=lambda key: self.by_job[key].cost)]
+            totals = self.by_job[job] = _Totals()
+            self.job_count += 1
+        return totals
+
+    def wait_seconds(self) -> float:
+        """
+        Returns 0 if a call may go ahead, or how long to pause before checking again.
+        Raises LLMBudgetExceeded (cache-only mode) or PacingBudgetExhausted (pause mode,
+        daily budget spent) instead when the budget does not allow waiting.
+        """
+        with self._lock:
+            self._roll_day()
+            now = time.monotonic()
+            while self._hour and now - self._hour[0][0] >= 3600:
+                self._hour.popleft()
+            daily_spent = self.daily_budget is not None and self._day_spend >= self.daily_budget
+            hourly_spent = self.hourly_budget is not None and sum(cost for _, cost in self._hour) >= self.hourly_budget
+            if not (daily_spent or hourly_spent):
+                return 0.0
+            if self.on_exhausted == CACHE_ONLY:
+                self.blocked_calls += 1
+                raise LLMBudgetExceeded("daily" if daily_spent else "hourly")
+            if daily_spent:
+                raise PacingBudgetExhausted(f"Daily LLM budget of ${self.daily_budget} reached.")
+            wait = max(1.0, 3600 - (now - self._hour[0][0]))
+            self.paused_seconds += wait
+        utils.printyellow(f"Hourly LLM budget of ${self.hourly_budget} reached, pausing for {wait:.0f}s.")
+        return wait
+
+    def _roll_day(self):
+        if date.today() != self._day:
+            self._day = date.today()
+            self._day_spend = 0.0
+
+    def stats(self, top_jobs: int = 5) -> Dict[str, object]:
+        with self._lock:
+            jobs = sorted(self.by_job.items(), key=lambda item: item[1].cost, reverse=True)[:top_jobs]
+            return {
+                "run": self.run.summary(),
+                "templates": {name: totals.summary() for name, totals in self.by_template.items()},
+                "top_jobs": {job: totals.summary() for job, totals in jobs},
+                "jobs": self.job_count,
+                "blocked_calls": self.blocked_calls,
+                "paused_seconds": round(self.paused_seconds, 1),
+            }
+
+
+def _call_log_files(log_path: Path) -> Iterator[Path]:
+    """The call log and its rotated, gzip-compressed backups, newest first."""
+    yield log_path
+    index = 1
+    while (backup := log_path.with_name(f"{log_path.name}.{index}.gz")).exists():
+        yield backup
+        index += 1
@@ -0,0 +1,112 @@
+import atexit
+import gzip
+import json
+import os
+import queue
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Union
+
+
+class BackgroundJsonlWriter:
+    """
+    Writes JSON records as compact JSON lines from a background thread.
+
+    Callers only pay for a non-blocking ``queue.put``. Records are flushed in
+    batches, the file is rotated and gzip-compressed once it grows past
+    ``max_bytes``, and the queue is drained when the interpreter exits. If the
+    queue is full, new records are dropped and counted rather than blocking
+    the caller.
+    """
+
+    def __init__(self, file_path: Union[str, Path], max_queue_size: int = 10000, batch_size: int = 100,
+                 flush_interval: float = 1.0, max_bytes: int = 50 * 1024 * 1024, backup_count: int = 5):
+        self.file_path = Path(file_path)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.dropped = 0
+        self._queue: "queue.Queue[Optional[dict]]" = queue.Queue(maxsize=max_queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+    def write(self, record: dict):
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self, timeout: float = 10.0):
+        if self._thread is None:
+            return
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            pass
+        self._thread.join(timeout)
+        self._thread = None
+
+    def _ensure_started(self):
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self.file_path.parent.mkdir(parents=True, exist_ok=True)
+                self._thread = threading.Thread(target=self._run, name="jsonl-log-writer", daemon=True)
+                self._thread.start()
+                atexit.register(self.close)
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            batch = []
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                try:
+                    record = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if record is None:
+                    stopping = True
+                    break
+                batch.append(record)
+            if stopping:
+                batch.extend(self._drain())
+            if batch:
+                self._write_batch(batch)
+
+    def _drain(self):
+        records = []
+        while True:
+            try:
+                record = self._queue.get_nowait()
+            except queue.Empty:
+                return records
+            if record is not None:
+                records.append(record)
+
+    def _write_batch(self, batch):
+        lines = "".join(json.dumps(record, ensure_ascii=False, separators=(",", ":"), default=str) + "\n"
+                        for record in batch)
+        try:
+            with open(self.file_path, "a", encoding="utf-8") as f:
+                f.write(lines)
+            if self.file_path.stat().st_size >= self.max_bytes:
+                self._rotate()
+        except OSError as e:
+            print(f"Error writing log batch to {self.file_path}: {e}")
+
+    def _rotate(self):
+        for index in range(self.backup_count - 1, 0, -1):
+            source = self.file_path.with_name(f"{self.file_path.name}.{index}.gz")
+            if source.exists():
+                os.replace(source, self.file_path.with_name(f"{self.file_path.name}.{index + 1}.gz"))
+        rotated = self.file_path.with_name(f"{self.file_path.name}.1")
+        os.replace(self.file_path, rotated)
+        with open(rotated, "rb") as source, gzip.open(f"{rotated}.gz", "wb") as target:
+            shutil.copyfileobj(source, target)
+        rotated.unlink()
@@ -0,0 +1,289 @@
+import functools
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import src.tracing as tracing
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+INF_BUCKET_LABEL = 'le="+Inf"'
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Iterable[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.label_names)
+
+    def header(self) -> List[str]:
+        return [f"# TYPE {self.name} {self.kind}", f"# HELP {self.name} {self.help_text}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str] = ()):
+        super().__init__(name, help_text, label_names)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f"{self.name}_total{_labels(self.label_names, key)} {_number(value)}" for key, value in values]
+
+
+class Gauge(_Metric):
+    """A gauge set directly or read from callbacks registered per label set at render time."""
+    kind = "gauge"
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str] = ()):
+        super().__init__(name, help_text, label_names)
+        self._values: Dict[LabelValues, float] = {}
+        self._callbacks: Dict[LabelValues, Callable[[], float]] = {}
+
+    def set(self, value: float, **labels):
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def set_function(self, function: Callable[[], float], **labels):
+        with self._lock:
+            self._callbacks[self._key(labels)] = function
+
+    def remove(self, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values.pop(key, None)
+            self._callbacks.pop(key, None)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            values = dict(self._values)
+            callbacks = dict(self._callbacks)
+        for key, function in callbacks.items():
+            try:
+                values[key] = function()
+            except Exception:
+                continue
+        return [f"{self.name}{_labels(self.label_names, key)} {_number(value)}" for key, value in sorted(values.items())]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, help_text, label_names)
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            # One count per bucket, then the +Inf count and the sum.
+            series = self._series.setdefault(key, [0] * (len(self.buckets) + 1) + [0.0])
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[index] += 1
+            series[-2] += 1
+            series[-1] += value
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            series = sorted((key, list(values)) for key, values in self._series.items())
+        lines = []
+        for key, values in series:
+            for bound, count in zip(self.buckets, values):
+                bucket_label = 'le="' + _number(float(bound)) + '"'
+                lines.append(f"{self.name}_bucket{_labels(self.label_names, key, bucket_label)} {count}")
+            lines.append(f"{self.name}_bucket{_labels(self.label_names, key, INF_BUCKET_LABEL)} {values[-2]}")
+            lines.append(f"{self.name}_sum{_labels(self.label_names, key)} {_number(values[-1])}")
+            lines.append(f"{self.name}_count{_labels(self.label_names, key)} {values[-2]}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, help_text: str, label_names: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help_text, label_names))
+
+    def gauge(self, name: str, help_text: str, label_names: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, help_text, label_names))
+
+    def histogram(self, name: str, help_text: str, label_names: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, help_text, label_names, buckets))
+
+    def render(self) -> str:
+        """Returns every metric in the OpenMetrics text exposition format."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.header())
+            lines.extend(metric.samples())
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+STAGE_DURATION = REGISTRY.histogram("bot_stage_duration_seconds", "Time spent in each bot stage.", ["stage"])
+STAGE_OUTCOMES = REGISTRY.counter("bot_stage", "Finished bot stages by outcome.", ["stage", "outcome"])
+APPLICATION_OUTCOMES = REGISTRY.counter("bot_applications", "Jobs recorded in the ledger by status.", ["status"])
+LLM_DURATION = REGISTRY.histogram("bot_llm_request_duration_seconds", "LLM request latency by prompt template.", ["template"])
+LLM_TOKENS = REGISTRY.counter("bot_llm_tokens", "LLM tokens by prompt template and direction.", ["template", "direction"])
+QUEUE_DEPTH = REGISTRY.gauge("bot_queue_depth", "Items waiting in a work queue.", ["queue"])
+LOGIN_DURATION = REGISTRY.histogram("bot_login_duration_seconds", "Time until LinkedIn is logged in, by login method.", ["method"])
+BROWSER_MEMORY = REGISTRY.gauge("bot_browser_js_heap_bytes", "JavaScript heap in use by a browser, sampled after page loads.", ["worker"])
+
+
+@contextmanager
+def stage(name: str, **attributes):
+    """Times the block into bot_stage_duration_seconds, counts its outcome and traces it as a span."""
+    started = time.monotonic()
+    outcome = "error"
+    try:
+        with tracing.span(name, **attributes):
+            yield
+        outcome = "success"
+    finally:
+        STAGE_DURATION.observe(time.monotonic() - started, stage=name)
+        STAGE_OUTCOMES.inc(stage=name, outcome=outcome)
+
+
+def timed(name: str):
+    """Decorator form of stage()."""
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with stage(name):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def sample_browser_memory(driver):
+    """Reads the page's JavaScript heap size through the DevTools protocol, if the driver supports it."""
+    try:
+        result = driver.execute_cdp_cmd("Performance.getMetrics", {})
+        heap = next(metric["value"] for metric in result["metrics"] if metric["name"] == "JSHeapUsedSize")
+    except Exception:
+        return
+    BROWSER_MEMORY.set(heap, worker=threading.current_thread().name)
+
+
+class MetricsServer:
+    """Serves the registry at http://host:port/metrics from a daemon thread."""
+
+    def __init__(self, registry: MetricsRegistry = REGISTRY, host: str = "127.0.0.1", port: int = 9464):
+        self.registry = registry
+        self.httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self.thread: Optional[threading.Thread] = None
+
+    def start(self) -> "MetricsServer":
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="metrics-server", daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def _handler_class(self):
+        registry = self.registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/metrics", "/"):
+                    self.send_error(404)
+                    return
+                payload = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+class MetricsFileWriter:
+    """Rewrites the registry to ``file_path`` every ``interval`` seconds, atomically."""
+
+    def __init__(self, file_path: Union[str, Path], registry: MetricsRegistry = REGISTRY, interval: float = 15.0):
+        self.file_path = Path(file_path)
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        self.registry = registry
+        self.interval = interval
+        self._stop = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+
+    def start(self) -> "MetricsFileWriter":
+        self.thread = threading.Thread(target=self._run, name="metrics-file-writer", daemon=True)
+        self.thread.start()
+        return self
+
+    def write(self):
+        temporary_path = self.file_path.with_name(self.file_path.name + ".tmp")
+        temporary_path.write_text(self.registry.render(), encoding="utf-8")
+        os.replace(temporary_path, self.file_path)
+
+    def stop(self):
+        self._stop.set()
+        self.write()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.write()
+
+
+def start_exporters(config: Optional[dict]) -> List[object]:
+    """Starts the exporters enabled in the ``metrics`` config section (``port``, ``file``, ``interval``)."""
+    config = config or {}
+    exporters = []
+    if config.get('port'):
+        exporters.append(MetricsServer(port=int(config['port'])).start())
+    if config.get('file'):
+        exporters.append(MetricsFileWriter(config['file'], interval=float(config.get('interval', 15))).start())
+    return exporters
@@ -0,0 +1,164 @@
+import base64
+import json
+import re
+import time
+from typing import Dict, Iterable, List, Optional
+
+import src.metrics as metrics
+from src.job import Job
+from src.performance_log import PerformanceLog
+
+# The search page loads its job cards from the Voyager API, either from the REST
+# endpoint or through a GraphQL query named after it.
+JOB_CARDS_URL_PATTERN = re.compile(r"/voyager/api/(?:voyagerJobsDashJobCards|graphql\?.*voyagerJobsDashJobCards)")
+START_PATTERN = re.compile(r"[?&(,]start[:=](\d+)")
+JOB_POSTING_URN_PATTERN = re.compile(r"urn:li:fsd_jobPosting(?:Card)?:\(?(\d+)")
+JOB_CARD_TYPE = "com.linkedin.voyager.dash.jobs.JobPostingCard"
+
+
+def _text(value) -> str:
+    if isinstance(value, dict):
+        value = value.get("text")
+    return value.strip() if isinstance(value, str) else ""
+
+
+def _walk(value) -> Iterable[dict]:
+    if isinstance(value, dict):
+        yield value
+        for child in value.values():
+            yield from _walk(child)
+    elif isinstance(value, list):
+        for child in value:
+            yield from _walk(child)
+
+
+def _apply_method(card: dict) -> str:
+    """
+    The search already filters on Easy Apply (f_LF=f_AL), and cards often leave the
+    Easy Apply footer out, so a job is only excluded on a positive signal.
+    """
+    footer_types = {item.get("type") for item in card.get("footerItems") or [] if isinstance(item, dict)}
+    if "APPLIED_DATE" in footer_types:
+        return "Applied"
+    apply_method = card.get("applyMethod") or {}
+    if isinstance(apply_method, dict) and "OffsiteApply" in str(apply_method.get("$type") or ""):
+        return "Apply"
+    return "Easy Apply"
+
+
+def parse_job_cards(payload: dict, base_url: str = "https://www.linkedin.com") -> List[Job]:
+    """
+    Turns a job cards API response into Job objects, in result order, once per job ID.
+
+    Works on both the normalized REST form (cards in ``included``, referenced in order
+    from ``data.elements``) and the nested GraphQL form, by looking for JobPostingCard
+    entities anywhere in the payload.
+    """
+    entities = list(_walk(payload))
+    order = {}
+    for entity in entities:
+        match = JOB_POSTING_URN_PATTERN.search(str(entity.get("*jobPostingCard") or ""))
+        if match:
+            order.setdefault(match.group(1), len(order))
+    jobs, seen = [], set()
+    for entity in entities:
+        if entity.get("$type") != JOB_CARD_TYPE:
+            continue
+        urn = entity.get("*jobPosting") or entity.get("jobPostingUrn") or entity.get("entityUrn") or ""
+        match = JOB_POSTING_URN_PATTERN.search(urn)
+        if not match or match.group(1) in seen:
+            continue
+        job_id = match.group(1)
+        seen.add(job_id)
+        jobs.append(Job(
+            _text(entity.get("jobPostingTitle")) or _text(entity.get("title")),
+            _text(entity.get("primaryDescription")),
+            _text(entity.get("secondaryDescription")),
+            f"{base_url}/jobs/view/{job_id}/",
+            _apply_method(entity),
+        ))
+    jobs.sort(key=lambda job: order.get(job.job_id, len(order)))
+    return jobs
+
+
+class NetworkJobExtractor:
+    """
+    Reads the search page's job cards from the API responses Chrome received.
+
+    Needs a browser started with performance logging (``goog:loggingPrefs``), which
+    chromeBrowserOptions turns on with ``performance_logging=True``. Call reset()
+    before loading a search page and extract() once it has loaded; extract() returns
+    None when no job cards response was captured, so the caller can fall back to the
+    DOM.
+    """
+
+    def __init__(self, driver, base_url: str = "https://www.linkedin.com", timeout: float = 5.0):
+        self.driver = driver
+        self.base_url = base_url
+        self.timeout = timeout
+        self.captured_pages = 0
+        self.missed_pages = 0
+        self._responses: Dict[str, str] = {}
+        self._finished = set()
+        self.performance_log = PerformanceLog.for_driver(driver)
+        self.performance_log.subscribe("Network.responseReceived", self._on_response_received)
+        self.performance_log.subscribe("Network.loadingFinished", self._on_loading_finished)
+
+    def reset(self):
+        """Drops everything logged so far, so only the next page's responses are read."""
+        self._read_log()
+        self._responses.clear()
+        self._finished.clear()
+
+    @metrics.timed("extract_job_cards_network")
+    def extract(self, start: Optional[int] = None) -> Optional[List[Job]]:
+        deadline = time.monotonic() + self.timeout
+        while True:
+            self._read_log()
+            request_ids = [request_id for request_id, url in self._responses.items()
+                           if request_id in self._finished and self._matches_start(url, start)]
+            if request_ids or time.monotonic() >= deadline:
+                break
+            time.sleep(0.25)
+        jobs, seen = [], set()
+        for request_id in request_ids:
+            for job in parse_job_cards(self._response_body(request_id), self.base_url):
+                if job.job_id not in seen:
+                    seen.add(job.job_id)
+                    jobs.append(job)
+        if not jobs:
+            self.missed_pages += 1
+            return None
+        self.captured_pages += 1
+        return jobs
+
+    @staticmethod
+    def _matches_start(url: str, start: Optional[int]) -> bool:
+        match = START_PATTERN.search(url)
+        return start is None or match is None or int(match.group(1)) == start
+
+    def _read_log(self):
+        self.performance_log.poll()
+
+    def _on_response_received(self, params: dict):
+        url = params.get("response", {}).get("url", "")
+        if JOB_CARDS_URL_PATTERN.search(url) and params.get("response", {}).get("status") == 200:
+            self._responses[params["requestId"]] = url
+
+    def _on_loading_finished(self, params: dict):
+        if params.get("requestId") in self._responses:
+            self._finished.add(params["requestId"])
+
+    def _response_body(self, request_id: str) -> dict:
+        try:
+            result = self.driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+            body = result.get("body", "")
+            if result.get("base64Encoded"):
+                body = base64.b64decode(body).decode("utf-8")
+            return json.loads(body)
+        except Exception:
+            # Evicted from Chrome's buffer, or not JSON after all.
+            return {}
+
+    def stats(self) -> Dict[str, int]:
+        return {"captured_pages": self.captured_pages, "missed_pages": self.missed_pages}
@@ -0,0 +1,47 @@
+import re
+from collections import OrderedDict
+from typing import Optional, Sequence, Tuple
+
+from rapidfuzz import fuzz, process
+
+PUNCTUATION_PATTERN = re.compile(r"[^\w\s]")
+
+
+def normalize_option(text: str) -> str:
+    return " ".join(PUNCTUATION_PATTERN.sub(" ", (text or "").casefold()).split())
+
+
+class OptionResolver:
+    """
+    Maps a free-text answer onto one of a form field's options.
+
+    All options are scored in one rapidfuzz ``extractOne`` call after case and
+    punctuation normalization. Results are cached per (question, options, answer),
+    so a form that shows up again resolves without recomputation.
+    """
+
+    def __init__(self, score_cutoff: float = 70, cache_size: int = 4096):
+        self.score_cutoff = score_cutoff
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Tuple[str, Tuple[str, ...], str], Optional[int]]" = OrderedDict()
+
+    def resolve(self, question: str, answer: str, options: Sequence[str]) -> Optional[int]:
+        """Returns the index of the best matching option, or None if nothing scores above the cutoff."""
+        normalized_options = tuple(normalize_option(option) for option in options)
+        key = (normalize_option(question), normalized_options, normalize_option(answer))
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+        index = self._score(key[2], normalized_options)
+        self._cache[key] = index
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return index
+
+    def _score(self, answer: str, options: Tuple[str, ...]) -> Optional[int]:
+        if not answer or not options:
+            return None
+        if answer in options:
+            return options.index(answer)
+        match = process.extractOne(answer, options, scorer=fuzz.WRatio, score_cutoff=self.score_cutoff)
+        return match[2] if match else None
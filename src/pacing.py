@@ -0,0 +1,139 @@
+import json
+import os
+import threading
+import time
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+PAGE_LOAD = "page_load"
+APPLICATION = "application"
+# Ledger statuses recorded by jobs that went through acquire(APPLICATION); filtered jobs are
+# rejected before the applier acquires it.
+APPLICATION_STATUSES = ("success", "failed")
+
+
+class PacingBudgetExhausted(Exception):
+    pass
+
+
+class TokenBucket:
+    """Grants up to ``rate_per_hour`` events per hour, allowing short bursts of ``burst``."""
+
+    def __init__(self, rate_per_hour: float, burst: int = 1):
+        self.rate_per_second = rate_per_hour / 3600
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+
+    def try_take(self) -> float:
+        """Takes a token and returns 0, or returns the seconds until one is available."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate_per_second)
+        self.updated_at = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate_per_second
+
+
+class PacingScheduler:
+    """
+    Paces page loads and applications against explicit budgets.
+
+    Each kind of work has an hourly token bucket and an optional daily cap. ``acquire``
+    returns as soon as budget is available and raises ``PacingBudgetExhausted`` once the
+    daily cap is spent. Today's counts are kept in ``state_path`` when one is given, so a
+    restart does not reset the daily caps. Time spent waiting on budget is tracked per kind.
+    """
+
+    def __init__(self, hourly_rates: Dict[str, float], daily_caps: Dict[str, Optional[int]], burst: int = 1,
+                 state_path: Union[str, Path, None] = None):
+        self.buckets = {kind: TokenBucket(rate, burst) for kind, rate in hourly_rates.items() if rate}
+        self.daily_caps = daily_caps
+        self.daily_counts: Dict[str, int] = {kind: 0 for kind in hourly_rates}
+        self.wait_seconds: Dict[str, float] = {kind: 0.0 for kind in hourly_rates}
+        self.granted: Dict[str, int] = {kind: 0 for kind in hourly_rates}
+        self.day = date.today()
+        self.started_at = time.monotonic()
+        self.state_path = Path(state_path) if state_path else None
+        self._lock = threading.Lock()
+        self._load_state()
+
+    @classmethod
+    def from_config(cls, config: Optional[dict], state_path: Union[str, Path, None] = None, ledger=None):
+        """
+        Builds the scheduler from the ``pacing`` section. Today's application count is
+        seeded from the ledger's timestamps, and page loads from ``state_path``.
+        """
+        config = config or {}
+        scheduler = cls(
+            hourly_rates={
+                PAGE_LOAD: config.get('pageLoadsPerHour', 60),
+                APPLICATION: config.get('applicationsPerHour', 30),
+            },
+            daily_caps={
+                PAGE_LOAD: config.get('maxPageLoadsPerDay'),
+                APPLICATION: config.get('maxApplicationsPerDay'),
+            },
+            burst=config.get('burst', 3),
+            state_path=state_path,
+        )
+        if ledger is not None:
+            midnight = datetime.combine(date.today(), datetime.min.time()).timestamp()
+            scheduler.seed_daily_counts({
+                APPLICATION: sum(ledger.count(status, since=midnight) for status in APPLICATION_STATUSES),
+            })
+        return scheduler
+
+    def seed_daily_counts(self, counts: Dict[str, int]):
+        """Raises today's counts to at least ``counts``, e.g. work recorded before a restart."""
+        with self._lock:
+            for kind, count in counts.items():
+                self.daily_counts[kind] = max(self.daily_counts.get(kind, 0), count)
+
+    def _load_state(self):
+        if not self.state_path or not self.state_path.exists():
+            return
+        try:
+            state = json.loads(self.state_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return
+        if state.get("day") == self.day.isoformat():
+            self.seed_daily_counts(state.get("counts", {}))
+
+    def _save_state(self):
+        if not self.state_path:
+            return
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = self.state_path.with_name(self.state_path.name + ".tmp")
+        temporary_path.write_text(json.dumps({"day": self.day.isoformat(), "counts": self.daily_counts}), encoding='utf-8')
+        os.replace(temporary_path, self.state_path)
+
+    def acquire(self, kind: str):
+        while True:
+            with self._lock:
+                if date.today() != self.day:
+                    self.day = date.today()
+                    self.daily_counts = {key: 0 for key in self.daily_counts}
+                cap = self.daily_caps.get(kind)
+                if cap is not None and self.daily_counts.get(kind, 0) >= cap:
+                    raise PacingBudgetExhausted(f"Daily budget of {cap} {kind.replace('_', ' ')}s reached.")
+                bucket = self.buckets.get(kind)
+                wait = bucket.try_take() if bucket else 0.0
+                if wait == 0.0:
+                    self.daily_counts[kind] = self.daily_counts.get(kind, 0) + 1
+                    self.granted[kind] = self.granted.get(kind, 0) + 1
+                    self._save_state()
+                    return
+                self.wait_seconds[kind] = self.wait_seconds.get(kind, 0.0) + wait
+            time.sleep(wait)
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "granted": dict(self.granted),
+                "today": dict(self.daily_counts),
+                "wait_seconds": {kind: round(seconds, 1) for kind, seconds in self.wait_seconds.items()},
+                "elapsed_seconds": round(time.monotonic() - self.started_at, 1),
+            }
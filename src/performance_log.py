@@ -0,0 +1,53 @@
+import json
+import threading
+import weakref
+from collections import defaultdict
+from typing import Callable, Dict, List
+
+Listener = Callable[[dict], None]
+
+
+class PerformanceLog:
+    """
+    Chrome's performance log (``goog:loggingPrefs``), shared by everything that reads it.
+
+    driver.get_log("performance") hands out each entry only once, so one reader would
+    steal the events of another. There is one PerformanceLog per browser (see for_driver):
+    poll() drains the log and passes each DevTools event's params to every listener
+    subscribed to its method, e.g. "Network.loadingFinished".
+    """
+
+    _instances: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+    _instances_lock = threading.Lock()
+
+    def __init__(self, driver):
+        self.driver = driver
+        self._listeners: Dict[str, List[Listener]] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_driver(cls, driver) -> "PerformanceLog":
+        with cls._instances_lock:
+            log = cls._instances.get(driver)
+            if log is None:
+                log = cls._instances[driver] = cls(driver)
+            return log
+
+    def subscribe(self, method: str, listener: Listener):
+        with self._lock:
+            self._listeners[method].append(listener)
+
+    def poll(self):
+        with self._lock:
+            try:
+                entries = self.driver.get_log("performance")
+            except Exception:
+                return
+            listeners = {method: list(callbacks) for method, callbacks in self._listeners.items()}
+        for entry in entries:
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, ValueError, TypeError):
+                continue
+            for listener in listeners.get(message.get("method"), ()):
+                listener(message.get("params", {}))
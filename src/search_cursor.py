@@ -0,0 +1,201 @@
+import random
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+Search = Tuple[str, str]
+
+
+class SearchCursor:
+    """
+    Persistent progress of the (position, location) search sweep, stored in SQLite (WAL mode).
+
+    Each search records the next results page to load, the last job ID handled on
+    it and when it was completed. Progress is committed after every job and page, so
+    a restarted run resumes each unfinished search where it stopped instead of
+    paging through everything again. Rows are keyed by the search filters too, so
+    changing them in config.yaml starts a new sweep.
+
+    Once every search is complete the next run starts a new sweep, unless
+    ``stale_after`` (seconds) is set: then only searches completed longer ago than
+    that are swept again. The start time of each search's last complete crawl is
+    kept across sweeps for the incremental search mode.
+
+    A page that fails to load or parse ``max_page_failures`` times in a row gives the
+    search up (see page_failed and abandon), so a broken page is not retried first on
+    every run; an abandoned crawl does not count as a complete one.
+    """
+
+    def __init__(self, db_path: Union[str, Path], query: str = "", stale_after: Optional[float] = None,
+                 max_page_failures: int = 3):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.query = query
+        self.stale_after = stale_after
+        self.max_page_failures = max_page_failures
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+
+    @classmethod
+    def from_config(cls, db_path: Union[str, Path], query: str, config: Optional[dict]) -> "SearchCursor":
+        config = config or {}
+        stale_after_hours = config.get('staleAfterHours')
+        return cls(db_path, query, stale_after_hours * 3600 if stale_after_hours is not None else None,
+                   config.get('maxPageFailures', 3))
+
+    def _create_schema(self):
+        with self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS searches (
+                    position TEXT NOT NULL,
+                    location TEXT NOT NULL,
+                    query TEXT NOT NULL,
+                    next_page INTEGER NOT NULL DEFAULT 0,
+                    last_job_id TEXT,
+                    started_at REAL,
+                    completed_at REAL,
+                    last_crawl_at REAL,
+                    failed_page INTEGER,
+                    page_failures INTEGER NOT NULL DEFAULT 0,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (position, location, query)
+                )
+                """
+            )
+            columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(searches)")}
+            if "last_crawl_at" not in columns:
+                self._conn.execute("ALTER TABLE searches ADD COLUMN last_crawl_at REAL")
+            if "page_failures" not in columns:
+                self._conn.execute("ALTER TABLE searches ADD COLUMN failed_page INTEGER")
+                self._conn.execute("ALTER TABLE searches ADD COLUMN page_failures INTEGER NOT NULL DEFAULT 0")
+
+    def _rows(self, searches: Iterable[Search]) -> Dict[Search, sqlite3.Row]:
+        with self._lock:
+            rows = self._conn.execute("SELECT * FROM searches WHERE query = ?", (self.query,)).fetchall()
+        wanted = set(searches)
+        return {(row["position"], row["location"]): row for row in rows if (row["position"], row["location"]) in wanted}
+
+    def plan(self, searches: Iterable[Search]) -> List[Search]:
+        """
+        Returns the searches to run, in order: unfinished ones first so an interrupted
+        search resumes straight away, then the rest in random order. Completed searches
+        are left out unless they are stale (or every search is complete and
+        ``stale_after`` is unset), in which case they are started over.
+        """
+        searches = list(dict.fromkeys(searches))
+        rows = self._rows(searches)
+        now = time.time()
+        in_progress, fresh, stale = [], [], []
+        for search in searches:
+            row = rows.get(search)
+            if row is None:
+                fresh.append(search)
+            elif row["completed_at"] is None:
+                (in_progress if row["started_at"] is not None else fresh).append(search)
+            elif self.stale_after is not None and now - row["completed_at"] >= self.stale_after:
+                stale.append(search)
+        if not (in_progress or fresh or stale) and self.stale_after is None:
+            fresh, stale = [], searches
+        for search in stale:
+            self.restart(*search)
+        random.shuffle(fresh)
+        random.shuffle(stale)
+        return in_progress + fresh + stale
+
+    def position(self, position: str, location: str) -> Tuple[int, Optional[str]]:
+        """Returns the page to resume the search at and the last job ID handled on it."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT next_page, last_job_id, completed_at FROM searches WHERE position = ? AND location = ? AND query = ?",
+                (position, location, self.query),
+            ).fetchone()
+        if row is None or row["completed_at"] is not None:
+            return 0, None
+        return row["next_page"], row["last_job_id"]
+
+    def last_crawl_at(self, position: str, location: str) -> Optional[float]:
+        """Returns when the last complete crawl of the search started, if there was one."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT last_crawl_at FROM searches WHERE position = ? AND location = ? AND query = ?",
+                (position, location, self.query),
+            ).fetchone()
+        return row["last_crawl_at"] if row else None
+
+    def restart(self, position: str, location: str):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE searches SET next_page = 0, last_job_id = NULL, started_at = NULL, completed_at = NULL, "
+                "failed_page = NULL, page_failures = 0, updated_at = ? "
+                "WHERE position = ? AND location = ? AND query = ?",
+                (time.time(), position, location, self.query),
+            )
+
+    def start(self, position: str, location: str):
+        self._upsert(position, location)
+
+    def job_done(self, position: str, location: str, page: int, job_id: str):
+        self._upsert(position, location, next_page=page, last_job_id=job_id)
+
+    def page_done(self, position: str, location: str, page: int):
+        self._upsert(position, location, next_page=page + 1, last_job_id=None, failed_page=None, page_failures=0)
+
+    def page_failed(self, position: str, location: str, page: int) -> bool:
+        """
+        Counts a failure of ``page`` and returns True once it has failed ``max_page_failures``
+        times in a row; the caller should then complete the search instead of retrying it.
+        """
+        self.start(position, location)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE searches SET page_failures = CASE WHEN failed_page = ? THEN page_failures + 1 ELSE 1 END, "
+                "failed_page = ?, updated_at = ? WHERE position = ? AND location = ? AND query = ?",
+                (page, page, time.time(), position, location, self.query),
+            )
+            failures = self._conn.execute(
+                "SELECT page_failures FROM searches WHERE position = ? AND location = ? AND query = ?",
+                (position, location, self.query),
+            ).fetchone()[0]
+        return failures >= self.max_page_failures
+
+    def complete(self, position: str, location: str):
+        self._upsert(position, location, last_job_id=None, completed_at=time.time(), failed_page=None, page_failures=0)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE searches SET last_crawl_at = started_at WHERE position = ? AND location = ? AND query = ?",
+                (position, location, self.query),
+            )
+
+    def abandon(self, position: str, location: str):
+        """Closes the search for this sweep like complete(), but keeps the last complete crawl's start."""
+        self._upsert(position, location, last_job_id=None, completed_at=time.time(), failed_page=None, page_failures=0)
+
+    def _upsert(self, position: str, location: str, **values):
+        now = time.time()
+        columns = ["position", "location", "query", *values, "started_at", "updated_at"]
+        updates = ", ".join([f"{column} = excluded.{column}" for column in [*values, "updated_at"]]
+                            + ["started_at = COALESCE(searches.started_at, excluded.started_at)"])
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"INSERT INTO searches ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)}) "
+                f"ON CONFLICT (position, location, query) DO UPDATE SET {updates}",
+                (position, location, self.query, *values.values(), now, now),
+            )
+
+    def stats(self, searches: Iterable[Search]) -> Dict[str, int]:
+        searches = set(searches)
+        rows = self._rows(searches)
+        completed = sum(1 for row in rows.values() if row["completed_at"] is not None)
+        in_progress = sum(1 for row in rows.values() if row["completed_at"] is None and row["started_at"] is not None)
+        return {"searches": len(searches), "completed": completed, "in_progress": in_progress}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
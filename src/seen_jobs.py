@@ -0,0 +1,52 @@
+import threading
+from pathlib import Path
+from typing import Callable, Iterable, Optional, Set, Union
+
+
+class SeenJobsIndex:
+    """
+    Disk-backed set of LinkedIn job IDs that have already been processed.
+
+    IDs are kept one per line in an append-only text file and loaded into an
+    in-memory set the first time the index is queried.
+    """
+
+    def __init__(self, file_path: Union[str, Path], seed: Optional[Callable[[], Iterable[str]]] = None):
+        self.file_path = Path(file_path)
+        self._seed = seed
+        self._ids: Optional[Set[str]] = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> Set[str]:
+        if self._ids is None:
+            with self._lock:
+                if self._ids is None:
+                    self._ids = self._read_file()
+        return self._ids
+
+    def _read_file(self) -> Set[str]:
+        if self.file_path.exists():
+            with open(self.file_path, 'r', encoding='utf-8') as f:
+                return {line.strip() for line in f if line.strip()}
+        ids = {job_id for job_id in (self._seed() if self._seed else []) if job_id}
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.file_path, 'w', encoding='utf-8') as f:
+            f.writelines(f"{job_id}\n" for job_id in sorted(ids))
+        return ids
+
+    def __contains__(self, job_id: str) -> bool:
+        return bool(job_id) and job_id in self._load()
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def add(self, job_id: str):
+        if not job_id:
+            return
+        ids = self._load()
+        with self._lock:
+            if job_id in ids:
+                return
+            ids.add(job_id)
+            with open(self.file_path, 'a', encoding='utf-8') as f:
+                f.write(f"{job_id}\n")
@@ -413,3 +413,29 @@ func_summarize_prompt_template = """
         {text_with_placeholders}
         
         ## Text without placeholders:"""
+
+batch_questions_template = """
+You are filling in a job application form for the candidate described below. Answer every question on the current form page.
+
+## Rules
+- Answer each question from the candidate's profile and the job summary.
+- For "radio" and "dropdown" questions the answer must be exactly one of the listed options; never choose a placeholder such as 'Select an option'.
+- For "textbox" questions keep the answer under 140 characters; when the question asks for a number of years, answer with a number only.
+- If the profile gives no basis for an answer, answer "{no_matching_data}".
+- Reply with a JSON object of the form {{"answers": [{{"id": <question id>, "answer": "<answer>"}}]}}, one entry per question.
+
+## Candidate profile:
+```
+{resume}
+```
+
+## Job summary:
+```
+{job_description}
+```
+
+## Questions (JSON):
+```
+{questions}
+```
+"""
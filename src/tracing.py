@@ -0,0 +1,141 @@
+import asyncio
+import atexit
+import contextvars
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+_current_span: contextvars.ContextVar = contextvars.ContextVar("trace_span", default=None)
+
+
+class Span:
+    __slots__ = ("name", "attributes", "started")
+
+    def __init__(self, name: str, attributes: Dict[str, object]):
+        self.name = name
+        self.attributes = attributes
+        self.started = time.perf_counter()
+
+
+class Tracer:
+    """
+    Records nested spans as Chrome trace-event "complete" events.
+
+    Spans nest by time on their track: one track per thread, plus lanes on the event
+    loop's thread so concurrent asyncio tasks (LLM requests) do not overlap. The exported
+    file opens as a timeline in chrome://tracing or https://ui.perfetto.dev. Recording
+    is off until ``enable`` is called, and stops after ``max_events`` events.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.file_path: Optional[Path] = None
+        self.max_events = 0
+        self.dropped = 0
+        self._events: List[dict] = []
+        self._tracks: Dict[object, int] = {}
+        self._task_tracks: Dict[asyncio.Task, int] = {}
+        self._free_lanes: Dict[str, List[int]] = {}
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def enable(self, file_path: Union[str, Path], max_events: int = 200_000):
+        self.file_path = Path(file_path)
+        self.max_events = max_events
+        self.enabled = True
+        atexit.register(self.export)
+
+    @contextmanager
+    def span(self, name: str, **attributes):
+        if not self.enabled:
+            yield None
+            return
+        span = Span(name, attributes)
+        track = self._track()
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.attributes["error"] = type(e).__name__
+            raise
+        finally:
+            _current_span.reset(token)
+            self._record(span, track, time.perf_counter())
+
+    def annotate(self, **attributes):
+        """Adds attributes to the innermost open span, if any."""
+        span = _current_span.get()
+        if span is not None:
+            span.attributes.update(attributes)
+
+    def _track(self) -> int:
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        with self._lock:
+            if task is None:
+                return self._named_track(threading.get_ident(), threading.current_thread().name)
+            track = self._task_tracks.get(task)
+            if track is None:
+                # Tasks come and go, so they borrow lanes that are returned when the task ends.
+                thread_name = threading.current_thread().name
+                free = self._free_lanes.setdefault(thread_name, [])
+                lane = free.pop() if free else sum(1 for key in self._tracks if isinstance(key, tuple) and key[0] == thread_name)
+                track = self._task_tracks[task] = self._named_track((thread_name, lane), f"{thread_name} lane {lane}")
+                task.add_done_callback(lambda _: self._release_lane(task, thread_name, lane))
+            return track
+
+    def _named_track(self, key, label: str) -> int:
+        track = self._tracks.get(key)
+        if track is None:
+            track = self._tracks[key] = len(self._tracks) + 1
+            self._events.append({"ph": "M", "name": "thread_name", "pid": os.getpid(), "tid": track,
+                                 "args": {"name": label}})
+        return track
+
+    def _release_lane(self, task, thread_name: str, lane: int):
+        with self._lock:
+            self._task_tracks.pop(task, None)
+            self._free_lanes[thread_name].append(lane)
+
+    def _record(self, span: Span, track: int, finished: float):
+        event = {
+            "ph": "X",
+            "name": span.name,
+            "cat": span.name.split(".")[0],
+            "pid": os.getpid(),
+            "tid": track,
+            "ts": round((span.started - self._origin) * 1e6, 1),
+            "dur": round((finished - span.started) * 1e6, 1),
+            "args": {key: value if isinstance(value, (int, float, bool, str)) or value is None else str(value)
+                     for key, value in span.attributes.items()},
+        }
+        with self._lock:
+            if len(self._events) >= self.max_events:
+                self.dropped += 1
+                return
+            self._events.append(event)
+
+    def export(self, file_path: Union[str, Path, None] = None):
+        file_path = file_path or self.file_path
+        if not file_path:
+            return
+        file_path = Path(file_path)
+        with self._lock:
+            events = list(self._events)
+            dropped = self.dropped
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = file_path.with_name(file_path.name + ".tmp")
+        with open(temporary_path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms", "otherData": {"dropped_events": dropped}}, f)
+        os.replace(temporary_path, file_path)
+
+
+TRACER = Tracer()
+span = TRACER.span
+annotate = TRACER.annotate
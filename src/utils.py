@@ -1,24 +1,32 @@
 import os
 import random
 import time
+from dataclasses import dataclass
 
 from selenium import webdriver
 
+import src.metrics as metrics
+
 chromeProfilePath = os.path.join(os.getcwd(), "chrome_profile", "linkedin_profile")
 
-def ensure_chrome_profile():
-    profile_dir = os.path.dirname(chromeProfilePath)
+def ensure_chrome_profile(profile_path=chromeProfilePath):
+    profile_dir = os.path.dirname(profile_path)
     if not os.path.exists(profile_dir):
         os.makedirs(profile_dir)
-    if not os.path.exists(chromeProfilePath):
-        os.makedirs(chromeProfilePath)
-    return chromeProfilePath
+    if not os.path.exists(profile_path):
+        os.makedirs(profile_path)
+    return profile_path
+
+def worker_chrome_profile_path(worker_index):
+    # Each worker needs its own user-data-dir: Chrome locks it for a single running instance.
+    return os.path.join(os.getcwd(), "chrome_profile", f"worker_{worker_index}", "linkedin_profile")
 
 def is_scrollable(element):
     scroll_height = element.get_attribute("scrollHeight")
     client_height = element.get_attribute("clientHeight")
     return int(scroll_height) > int(client_height)
 
+@metrics.timed("scroll_slow")
 def scroll_slow(driver, scrollable_element, start=0, end=3600, step=100, reverse=False):
     if reverse:
         start, end = end, start
@@ -47,10 +55,83 @@ def scroll_slow(driver, scrollable_element, start=0, end=3600, step=100, reverse
     except Exception as e:
         print(f"Exception occurred: {e}")
 
-def chromeBrowserOptions():
-    ensure_chrome_profile()
+# Scrolls the container by one viewport, then resolves once the list has not changed
+# for settleMs (or after timeoutMs) with [itemCount, reachedBottom].
+SCROLL_AND_WAIT_SCRIPT = """
+var container = arguments[0], selector = arguments[1], settleMs = arguments[2], timeoutMs = arguments[3];
+var done = arguments[arguments.length - 1];
+var count = function () { return container.querySelectorAll(selector).length; };
+var last = count(), settleTimer = null, hardTimer = null;
+// Any change inside the list (tiles being filled in, not only added) restarts the settle timer.
+var observer = new MutationObserver(function () {
+    last = count();
+    restart();
+});
+function finish() {
+    observer.disconnect();
+    clearTimeout(settleTimer);
+    clearTimeout(hardTimer);
+    var atBottom = container.scrollTop + container.clientHeight >= container.scrollHeight - 2;
+    done([last, atBottom]);
+}
+function restart() { clearTimeout(settleTimer); settleTimer = setTimeout(finish, settleMs); }
+observer.observe(container, {childList: true, subtree: true, characterData: true});
+hardTimer = setTimeout(finish, timeoutMs);
+container.scrollTop = container.scrollTop + container.clientHeight;
+restart();
+"""
+
+@dataclass
+class ScrollPacing:
+    """Pacing between scroll rounds, kept separate from the loading condition itself."""
+    min_delay: float = 0.2
+    max_delay: float = 0.6
+    settle_ms: int = 400
+    round_timeout_ms: int = 3000
+    max_rounds: int = 40
+
+    @classmethod
+    def from_config(cls, config):
+        config = config or {}
+        return cls(**{key: config[key] for key in cls.__dataclass_fields__ if key in config})
+
+    def pause(self):
+        time.sleep(random.uniform(self.min_delay, self.max_delay))
+
+@metrics.timed("load_list_items")
+def load_list_items(driver, scrollable_element, item_selector, pacing=None):
+    """
+    Scrolls a list container one viewport at a time, waiting on a MutationObserver
+    until the list stops changing instead of sleeping, and stops once the bottom is
+    reached and the item count has stopped growing. ``item_selector`` should match
+    rendered items only, since LinkedIn puts every tile on the page upfront as an
+    empty placeholder. Returns the final item count.
+    """
+    pacing = pacing if pacing is not None else ScrollPacing()
+    driver.set_script_timeout(pacing.round_timeout_ms / 1000 + 5)
+    previous_count = -1
+    count = 0
+    for _ in range(pacing.max_rounds):
+        try:
+            count, at_bottom = driver.execute_async_script(
+                SCROLL_AND_WAIT_SCRIPT, scrollable_element, item_selector, pacing.settle_ms, pacing.round_timeout_ms
+            )
+        except Exception as e:
+            print(f"Error while loading list items: {e}")
+            break
+        if at_bottom and count == previous_count:
+            break
+        previous_count = count
+        pacing.pause()
+    return count
+
+def chromeBrowserOptions(profile_path=chromeProfilePath, headless=False, performance_logging=False):
+    ensure_chrome_profile(profile_path)
     options = webdriver.ChromeOptions()
-    options.add_argument("--start-maximized")  # Avvia il browser a schermo intero
+    if headless:
+        options.add_argument("--headless=new")  # Avvia il browser senza finestra
+    else:
+        options.add_argument("--start-maximized")  # Avvia il browser a schermo intero
     options.add_argument("--no-sandbox")  # Disabilita la sandboxing per migliorare le prestazioni
     options.add_argument("--disable-dev-shm-usage")  # Utilizza una directory temporanea per la memoria condivisa
     options.add_argument("--ignore-certificate-errors")  # Ignora gli errori dei certificati SSL
@@ -76,10 +157,13 @@ def chromeBrowserOptions():
         "profile.managed_default_content_settings.stylesheets": 2,  # Disabilita il caricamento dei fogli di stile
     }
     options.add_experimental_option("prefs", prefs)
+    if performance_logging:
+        # Network events for BrowserProfile and NetworkJobExtractor, read through PerformanceLog.
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
 
-    if len(chromeProfilePath) > 0:
-        initialPath = os.path.dirname(chromeProfilePath)
-        profileDir = os.path.basename(chromeProfilePath)
+    if len(profile_path) > 0:
+        initialPath = os.path.dirname(profile_path)
+        profileDir = os.path.basename(profile_path)
         options.add_argument('--user-data-dir=' + initialPath)
         options.add_argument("--profile-directory=" + profileDir)
     else:
@@ -0,0 +1,167 @@
+import logging
+import queue
+import random
+import threading
+import time
+import traceback
+from itertools import product
+from pathlib import Path
+from typing import Any, Callable, Set
+
+import src.metrics as metrics
+import src.utils as utils
+from src.answer_store import AnswerStore
+from src.application_ledger import ApplicationLedger
+from src.description_filter import DescriptionFilter
+from src.gpt import GPTAnswerer, LLMLogger
+from src.linkedIn_authenticator import LinkedInAuthenticator
+from src.linkedIn_bot_facade import LinkedInBotFacade
+from src.linkedIn_job_manager import SEEN_STATUSES, EnvironmentKeys, LinkedInJobManager, print_description_filter_report
+from src.llm_accounting import LLMAccounting
+from src.pacing import PacingBudgetExhausted, PacingScheduler
+from src.search_cursor import SearchCursor
+from src.seen_jobs import SeenJobsIndex
+
+
+class JobClaims:
+    """Thread-safe set of job IDs currently being processed by some worker."""
+
+    def __init__(self):
+        self._claimed: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def claim(self, job_id: str) -> bool:
+        if not job_id:
+            return True
+        with self._lock:
+            if job_id in self._claimed:
+                return False
+            self._claimed.add(job_id)
+            return True
+
+    def release(self, job_id: str):
+        with self._lock:
+            self._claimed.discard(job_id)
+
+
+class SearchWorkerPool:
+    """
+    Runs the (position, location) searches across several browsers at once.
+
+    Each worker owns a Chrome profile directory, a driver and a full set of bot
+    components, and pulls search tasks from a shared queue. All workers record
+    results in one ledger and share the seen-jobs index, so a job found by two
+    searches is only handled once. ``maxConcurrentSearches`` caps how many
+    searches run at the same time, and every worker waits a random
+    ``minTaskDelay``..``maxTaskDelay`` seconds between tasks. The answer store and
+    description filter are shared as well, so answers and rejection stats are pooled.
+    """
+
+    def __init__(self, email: str, password: str, parameters: dict, openai_api_key: str,
+                 browser_factory: Callable[[str], Any]):
+        pool_config = parameters.get('workerPool', {}) or {}
+        self.email = email
+        self.password = password
+        self.parameters = parameters
+        self.openai_api_key = openai_api_key
+        self.browser_factory = browser_factory
+        self.worker_count = int(pool_config.get('workers', 1))
+        self.concurrency = threading.BoundedSemaphore(int(pool_config.get('maxConcurrentSearches', self.worker_count)))
+        self.min_task_delay = float(pool_config.get('minTaskDelay', 30))
+        self.max_task_delay = float(pool_config.get('maxTaskDelay', 90))
+
+        output_directory = Path(parameters['outputFileDirectory'])
+        self.ledger = ApplicationLedger(output_directory / "applications.db")
+        imported = self.ledger.import_legacy_json(output_directory)
+        if imported:
+            utils.printyellow(f"Imported {imported} records from the old JSON result files into the application ledger.")
+        self.seen_jobs = SeenJobsIndex(
+            output_directory / "seen_jobs.txt",
+            seed=lambda: self.ledger.job_ids(SEEN_STATUSES),
+        )
+        self.job_claims = JobClaims()
+        self.pacer = PacingScheduler.from_config(parameters.get('pacing', {}), output_directory / "pacing_state.json",
+                                                 self.ledger)
+        self.llm_accounting = LLMAccounting.from_config(parameters.get('llmBudget', {}),
+                                                        LLMLogger.calls_log_writer.file_path)
+        self.search_cursor = SearchCursor.from_config(output_directory / "search_cursor.db",
+                                                      LinkedInJobManager.get_base_search_url(parameters),
+                                                      parameters.get('searchSweep', {}))
+        self.answer_store = AnswerStore()
+        if EnvironmentKeys().disable_description_filter:
+            self.description_filter = None
+        else:
+            self.description_filter = DescriptionFilter(parameters.get('descriptionFilter', {}),
+                                                        output_directory / "plain_text_resume.yaml")
+        self.managers = []
+        self.managers_lock = threading.Lock()
+        self.tasks: "queue.Queue" = queue.Queue()
+        metrics.QUEUE_DEPTH.set_function(self.tasks.qsize, queue="search_tasks")
+
+    def run(self):
+        searches = self.search_cursor.plan(product(self.parameters.get('positions', []), self.parameters.get('locations', [])))
+        for search in searches:
+            self.tasks.put(search)
+        threads = [
+            threading.Thread(target=self._run_worker, args=(index,), name=f"search-worker-{index}")
+            for index in range(self.worker_count)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        logging.info(f"Worker pool finished: {self.ledger.count('success')} successful applications recorded.")
+        logging.info(f"Pacing stats: {self.pacer.stats()}")
+        logging.info(f"LLM accounting: {self.llm_accounting.stats()}")
+        with self.managers_lock:
+            managers = list(self.managers)
+        print_description_filter_report(self.description_filter,
+                                        sum(manager.applied_jobs for manager in managers),
+                                        sum(manager.applied_seconds for manager in managers),
+                                        sum(manager.applied_llm_calls for manager in managers))
+
+    def _build_worker(self, index: int):
+        browser = self.browser_factory(utils.worker_chrome_profile_path(index))
+        apply_component = LinkedInJobManager(browser)
+        apply_component.use_shared_state(self.ledger, self.seen_jobs, self.job_claims, self.pacer, self.search_cursor,
+                                         self.answer_store, self.description_filter)
+        with self.managers_lock:
+            self.managers.append(apply_component)
+        bot = LinkedInBotFacade(LinkedInAuthenticator(browser), apply_component)
+        bot.set_secrets(self.email, self.password)
+        bot.load_job_application_profile(Path(self.parameters['outputFileDirectory']) / 'plain_text_resume.yaml')
+        bot.set_gpt_answerer_and_resume_generator(GPTAnswerer(self.openai_api_key, base_url=self.parameters.get('llmBaseUrl'),
+                                                          accounting=self.llm_accounting))
+        bot.set_parameters(self.parameters)
+        bot.start_login()
+        bot.state.validate_state(['logged_in'])
+        apply_component.prepare_applying()
+        return browser, apply_component
+
+    def _run_worker(self, index: int):
+        try:
+            browser, apply_component = self._build_worker(index)
+        except Exception as e:
+            logging.error(f"Worker {index} could not start: {e}")
+            return
+        try:
+            while True:
+                try:
+                    position, location = self.tasks.get_nowait()
+                except queue.Empty:
+                    return
+                with self.concurrency:
+                    logging.info(f"Worker {index} searching {position} in {location}.")
+                    try:
+                        apply_component.apply_search(position, location)
+                    except PacingBudgetExhausted as e:
+                        logging.info(f"Worker {index} stopping: {e}")
+                        return
+                    except Exception:
+                        logging.error(f"Worker {index} failed on {position} in {location}:\n{traceback.format_exc()}")
+                time.sleep(random.uniform(self.min_task_delay, self.max_task_delay))
+        finally:
+            try:
+                browser.quit()
+            except Exception:
+                pass
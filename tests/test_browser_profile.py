@@ -0,0 +1,46 @@
+import json
+
+from src.browser_profile import BrowserProfile
+
+
+class FakeDriver:
+    def __init__(self):
+        self.log = []
+
+    def execute_cdp_cmd(self, command, arguments):
+        return {}
+
+    def execute_script(self, script):
+        return {"interactive": 0.5, "load": 1.0}
+
+    def get_log(self, kind):
+        entries, self.log = self.log, []
+        return entries
+
+    def finish(self, request_id, size):
+        message = {"method": "Network.loadingFinished", "params": {"requestId": request_id, "encodedDataLength": size}}
+        self.log.append({"message": json.dumps({"message": message})})
+
+
+def test_transfers_installed_by_one_profile_are_recorded_by_another():
+    driver = FakeDriver()
+    BrowserProfile.from_config({'name': 'lean', 'measureTransfers': True}).install(driver)
+    recorder = BrowserProfile.from_config({'name': 'lean'})
+    driver.finish("1", 2048)
+    driver.finish("2", 1024)
+
+    recorder.record_page_load(driver)
+
+    stats = recorder.stats()
+    assert stats["kb_per_page"] == 3.0
+    assert stats["requests_per_page"] == 2.0
+
+
+def test_transfers_are_opt_in():
+    profile = BrowserProfile.from_config({})
+    assert not profile.performance_logging
+    driver = FakeDriver()
+    profile.install(driver)
+    profile.record_page_load(driver)
+    assert profile.stats()["page_loads"] == 1
+    assert profile.stats()["kb_per_page"] == 0.0
@@ -0,0 +1,109 @@
+from types import SimpleNamespace
+
+import pytest
+from selenium.webdriver.common.by import By
+
+from src.answer_store import AnswerStore
+from src.description_filter import DescriptionRejected
+from src.linkedIn_easy_applier import LinkedInEasyApplier
+
+
+class FakeElement:
+    def __init__(self, text="", children=None):
+        self.text = text
+        self.children = children or {}
+        self.keys = []
+
+    def find_elements(self, by, value):
+        return self.children.get((by, value), [])
+
+    def send_keys(self, keys):
+        self.keys.append(keys)
+
+
+class FakeDriver:
+    def __init__(self, sections):
+        self.sections = sections
+
+    def find_elements(self, by, value):
+        assert (by, value) == (By.CLASS_NAME, 'jobs-easy-apply-form-section__grouping')
+        return self.sections
+
+
+class RecordingAsyncAnswerer:
+    def __init__(self):
+        self.calls = []
+
+    def answer_questions_sync(self, questions):
+        self.calls.append(questions)
+        return [f"answer to {q['question']}" for q in questions]
+
+
+class NoLLMAnswerer:
+    def answer_questions_batch(self, questions):
+        raise AssertionError("batch mode is off")
+
+    def answer_question_textual_wide_range(self, question):
+        raise AssertionError("questions should go through the async answerer")
+
+
+def textbox_section(question):
+    textbox = FakeElement()
+    return FakeElement(question, {(By.CLASS_NAME, 'jobs-easy-apply-form-element'): [textbox]}), textbox
+
+
+def test_async_only_page_answers_questions_concurrently(tmp_path):
+    (first, first_box), (second, second_box) = textbox_section("Years of Python?"), textbox_section("Notice period?")
+    async_answerer = RecordingAsyncAnswerer()
+    store = AnswerStore(tmp_path / "answers.json", tmp_path / "answers.jsonl")
+    applier = LinkedInEasyApplier(FakeDriver([first, second]), None, [], NoLLMAnswerer(),
+                                  async_answerer=async_answerer, answer_store=store)
+
+    applier._fill_additional_questions()
+
+    assert len(async_answerer.calls) == 1
+    assert [q["question"] for q in async_answerer.calls[0]] == ["years of python?", "notice period?"]
+    assert first_box.keys == ["answer to years of python?"]
+    assert second_box.keys == ["answer to notice period?"]
+
+
+def test_injected_empty_answer_store_is_used(tmp_path):
+    store = AnswerStore(tmp_path / "answers.json", tmp_path / "answers.jsonl")
+    assert len(store) == 0
+    applier = LinkedInEasyApplier(FakeDriver([]), None, [], NoLLMAnswerer(), answer_store=store)
+    assert applier.answer_store is store
+
+
+class PageDriver:
+    def get(self, url):
+        pass
+
+
+class RejectingFilter:
+    def check(self, description):
+        raise DescriptionRejected("missing keyword: python")
+
+
+class RecordingPacer:
+    def __init__(self):
+        self.acquired = []
+
+    def acquire(self, kind):
+        self.acquired.append(kind)
+
+
+def test_filtered_job_does_not_use_application_budget(tmp_path, monkeypatch):
+    monkeypatch.setattr("src.linkedIn_easy_applier.time.sleep", lambda seconds: None)
+    pacer = RecordingPacer()
+    store = AnswerStore(tmp_path / "answers.json", tmp_path / "answers.jsonl")
+    applier = LinkedInEasyApplier(PageDriver(), None, [], NoLLMAnswerer(), description_filter=RejectingFilter(),
+                                  answer_store=store, pacer=pacer)
+    monkeypatch.setattr(applier, "_find_easy_apply_button", lambda: None)
+    monkeypatch.setattr(applier, "_get_job_description", lambda: "Java only")
+    job = SimpleNamespace(link="https://www.linkedin.com/jobs/view/1", description="",
+                          set_job_description=lambda text: setattr(job, "description", text))
+
+    with pytest.raises(DescriptionRejected):
+        applier.job_apply(job)
+
+    assert pacer.acquired == []
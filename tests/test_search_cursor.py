@@ -0,0 +1,49 @@
+import time
+
+from src.linkedIn_job_manager import LinkedInJobManager
+from src.search_cursor import SearchCursor
+
+SEARCH = ("python developer", "Rome")
+
+
+def incremental_manager(cursor):
+    manager = LinkedInJobManager(driver=None)
+    manager.search_cursor = cursor
+    manager.incremental_search = True
+    manager.incremental_overlap = 3600
+    manager.max_posting_age = None
+    return manager
+
+
+def test_abandoned_search_is_recrawled_with_the_old_window(tmp_path):
+    cursor = SearchCursor(tmp_path / "cursor.db", "query", max_page_failures=2)
+    manager = incremental_manager(cursor)
+    cursor.start(*SEARCH)
+    cursor.complete(*SEARCH)
+    first_crawl_at = cursor.last_crawl_at(*SEARCH)
+
+    time.sleep(0.01)
+    cursor.restart(*SEARCH)
+    cursor.start(*SEARCH)
+    cursor.page_done(*SEARCH, 0)
+    assert not cursor.page_failed(*SEARCH, 1)
+    assert cursor.page_failed(*SEARCH, 1)
+    cursor.abandon(*SEARCH)
+
+    assert cursor.last_crawl_at(*SEARCH) == first_crawl_at
+    assert cursor.plan([SEARCH]) == [SEARCH]
+    assert cursor.position(*SEARCH) == (0, None)
+    window = int(manager.search_window(*SEARCH).split("r")[-1])
+    assert window >= int(time.time() - first_crawl_at + 3600) - 1
+
+
+def test_completed_search_moves_the_window(tmp_path):
+    cursor = SearchCursor(tmp_path / "cursor.db", "query")
+    cursor.start(*SEARCH)
+    cursor.complete(*SEARCH)
+    first_crawl_at = cursor.last_crawl_at(*SEARCH)
+    cursor.restart(*SEARCH)
+    time.sleep(0.01)
+    cursor.start(*SEARCH)
+    cursor.complete(*SEARCH)
+    assert cursor.last_crawl_at(*SEARCH) > first_crawl_at
@@ -0,0 +1,37 @@
+import src.worker_pool as worker_pool
+from src.linkedIn_job_manager import LinkedInJobManager
+from src.worker_pool import SearchWorkerPool
+
+
+class FakeBrowser:
+    def quit(self):
+        pass
+
+
+class FakeFacade:
+    def __init__(self, authenticator, apply_component):
+        self.apply_component = apply_component
+        self.state = self
+
+    def set_parameters(self, parameters):
+        self.apply_component.set_parameters(parameters)
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+def test_workers_share_answer_store_and_description_filter(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(worker_pool, "LinkedInBotFacade", FakeFacade)
+    monkeypatch.setattr(worker_pool, "LinkedInAuthenticator", lambda browser: None)
+    monkeypatch.setattr(worker_pool, "GPTAnswerer", lambda *args, **kwargs: None)
+    monkeypatch.setattr(LinkedInJobManager, "prepare_applying", lambda self: None)
+    parameters = {'outputFileDirectory': str(tmp_path), 'remote': True, 'distance': 25,
+                  'workerPool': {'workers': 2}, 'descriptionFilter': {'requiredKeywords': ['python']}}
+    pool = SearchWorkerPool("user@example.com", "secret", parameters, "key", lambda profile_path: FakeBrowser())
+
+    managers = [pool._build_worker(index)[1] for index in range(2)]
+
+    assert all(manager.answer_store is pool.answer_store for manager in managers)
+    assert all(manager.description_filter is pool.description_filter for manager in managers)
+    assert pool.managers == managers